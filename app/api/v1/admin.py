@@ -0,0 +1,62 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from app.core.profiling import collapse_stacks, dump_stats, profile_store, render_stats
+from app.core.security import admin_required
+from app.db.instrumentation import slow_query_log
+from app.schemas.profile import ProfileRead
+from app.schemas.slow_query import SlowQueryRead
+
+router = APIRouter(dependencies=[Depends(admin_required)])
+
+ProfileFormat = Literal["text", "pstats", "collapsed"]
+
+
+def _profile_response(profiles, format: ProfileFormat, sort: str, filename: str) -> Response:
+    if format == "pstats":
+        return Response(
+            dump_stats(profiles),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.prof"'},
+        )
+    if format == "collapsed":
+        return Response(
+            collapse_stacks(profiles),
+            media_type="text/plain",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.folded"'},
+        )
+    try:
+        return Response(render_stats(profiles, sort=sort), media_type="text/plain")
+    except KeyError:
+        raise HTTPException(status_code=400, detail=f"Unknown sort key: {sort}")
+
+@router.get("/slow-queries", response_model=list[SlowQueryRead])
+async def list_slow_queries(limit: int | None = Query(None, ge=1)):
+    return slow_query_log.list(limit)
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries():
+    slow_query_log.clear()
+
+@router.get("/profiles", response_model=list[ProfileRead])
+async def list_profiles(route: str | None = None):
+    return profile_store.select(route)
+
+@router.get("/profiles/aggregate")
+async def read_aggregated_profile(route: str | None = None, format: ProfileFormat = "text", sort: str = "cumulative"):
+    profiles = profile_store.select(route)
+    if not profiles:
+        raise HTTPException(status_code=404, detail="No profiles recorded")
+    return _profile_response(profiles, format, sort, "aggregate")
+
+@router.get("/profiles/{profile_id}")
+async def read_profile(profile_id: int, format: ProfileFormat = "text", sort: str = "cumulative"):
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return _profile_response([profile], format, sort, f"profile-{profile_id}")
+
+@router.delete("/profiles", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_profiles():
+    profile_store.clear()
@@ -3,22 +3,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import security
 from app.db.session import get_session
-from app.schemas.assignment import AssignmentCreate, AssignmentUpdate, AssignmentRead
+from app.schemas.assignment import AssignmentBulkUpdate, AssignmentCreate, AssignmentUpdate, AssignmentRead
 from app.services.assignment_service import (
     get_assignments_filtered,
     get_assignment,
+    complete_assignments,
     create_assignment,
     update_assignment,
     delete_assignment
 )
 from app.schemas.paginated import PaginatedResponse
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[AssignmentRead], dependencies=[Depends(security.access_token_required)])
 async def list_assignments(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_assignments_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[AssignmentRead], await get_assignments_filtered(db, dict(request.query_params)))
 
 @router.get("/{assignment_id}", response_model=AssignmentRead, dependencies=[Depends(security.access_token_required)])
 async def read_assignment(assignment_id: int, db: AsyncSession = Depends(get_session)):
@@ -31,6 +33,13 @@ async def read_assignment(assignment_id: int, db: AsyncSession = Depends(get_ses
 async def add_assignment(data: AssignmentCreate, db: AsyncSession = Depends(get_session)):
     return await create_assignment(db, data)
 
+@router.patch("/", response_model=list[AssignmentRead], dependencies=[Depends(security.access_token_required)])
+async def bulk_edit_assignments(data: AssignmentBulkUpdate, db: AsyncSession = Depends(get_session)):
+    try:
+        return await complete_assignments(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.patch("/{assignment_id}", response_model=AssignmentRead, dependencies=[Depends(security.access_token_required)])
 async def edit_assignment(assignment_id: int, data: AssignmentUpdate, db: AsyncSession = Depends(get_session)):
     updated = await update_assignment(db, assignment_id, data)
@@ -9,15 +9,18 @@ from app.services.case_service import (
     update_case,
     delete_case
 )
+from app.schemas.grade import TeamGradeRead
 from app.schemas.paginated import PaginatedResponse
 from app.core.security import security
+from app.services.grade_service import get_case_leaderboard
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[CaseRead], dependencies=[Depends(security.access_token_required)])
 async def list_cases(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_cases_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[CaseRead], await get_cases_filtered(db, dict(request.query_params)))
 
 @router.get("/{case_id}", response_model=CaseRead, dependencies=[Depends(security.access_token_required)])
 async def read_case(case_id: int, db: AsyncSession = Depends(get_session)):
@@ -26,6 +29,13 @@ async def read_case(case_id: int, db: AsyncSession = Depends(get_session)):
         raise HTTPException(status_code=404, detail="Case not found")
     return case
 
+@router.get("/{case_id}/leaderboard", response_model=list[TeamGradeRead], dependencies=[Depends(security.access_token_required)])
+async def read_case_leaderboard(case_id: int, db: AsyncSession = Depends(get_session)):
+    leaderboard = await get_case_leaderboard(db, case_id)
+    if leaderboard is None:
+        raise HTTPException(status_code=404, detail="Case not found")
+    return json_response(list[TeamGradeRead], leaderboard)
+
 @router.post("/", response_model=CaseRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
 async def add_case(data: CaseCreate, db: AsyncSession = Depends(get_session)):
     return await create_case(db, data)
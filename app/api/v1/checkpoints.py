@@ -12,13 +12,14 @@ from app.services.checkpoint_service import (
     update_checkpoint,
     delete_checkpoint
 )
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[CheckpointRead], dependencies=[Depends(security.access_token_required)])
 async def list_checkpoints(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_checkpoints_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[CheckpointRead], await get_checkpoints_filtered(db, dict(request.query_params)))
 
 @router.get("/{checkpoint_id}", response_model=CheckpointRead, dependencies=[Depends(security.access_token_required)])
 async def read_checkpoint(checkpoint_id: int, db: AsyncSession = Depends(get_session)):
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import security
+from app.db.session import get_session
+from app.schemas.job import JobRead
+from app.schemas.paginated import PaginatedResponse
+from app.services.job_service import (
+    get_jobs_filtered,
+    get_job_status,
+)
+from app.utils.responses import json_response
+import app.models
+
+router = APIRouter()
+
+@router.get("/", response_model=PaginatedResponse[JobRead], dependencies=[Depends(security.access_token_required)])
+async def list_jobs(request: Request, db: AsyncSession = Depends(get_session)):
+    return json_response(PaginatedResponse[JobRead], await get_jobs_filtered(db, dict(request.query_params)))
+
+@router.get("/{job_id}", response_model=JobRead, dependencies=[Depends(security.access_token_required)])
+async def read_job(job_id: int, db: AsyncSession = Depends(get_session)):
+    job = await get_job_status(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
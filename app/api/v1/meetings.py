@@ -1,37 +1,74 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import security
 from app.db.session import get_session
-from app.schemas.meeting import MeetingCreate, MeetingUpdate, MeetingRead
-from app.schemas.meeting_user import MeetingUserCreate, MeetingUserRead
+from app.schemas.meeting import (
+    MeetingCreate,
+    MeetingUpdate,
+    MeetingRead,
+    MeetingCalendarDay,
+    MeetingOccurrenceRead,
+    MeetingOccurrenceMaterialize,
+)
+from app.schemas.assignment import AssignmentCarryOverRead
+from app.schemas.job import JobRead
+from app.schemas.meeting_user import MeetingAttendeesRead, MeetingAttendeesUpdate, MeetingUserCreate, MeetingUserRead
 from app.schemas.paginated import PaginatedResponse
 from app.services.meeting_service import (
     get_meetings_filtered,
+    get_meetings_calendar,
     get_previous_meeting_id,
     get_meeting,
     create_meeting,
     update_meeting,
     delete_meeting,
     link_meeting_user,
+    set_meeting_attendees,
     get_team_schedule,
     create_meeting_schedule,
     update_meeting_schedule,
+    get_schedule_occurrences,
+    materialize_schedule_occurrence,
+    get_meeting_schedule,
 )
+from app.services.assignment_service import CarryOverMode, carry_over_assignments
+from app.services.job_service import enqueue_job
 from app.schemas.meeting_schedule import (
     MeetingScheduleCreate,
     MeetingScheduleUpdate,
     MeetingScheduleRead,
 )
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[MeetingRead], dependencies=[Depends(security.access_token_required)])
 async def list_meetings(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_meetings_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[MeetingRead], await get_meetings_filtered(db, dict(request.query_params)))
 
-@router.get("/previous/{meeting_id}", response_model=list[MeetingRead], dependencies=[Depends(security.access_token_required)])
+@router.get("/calendar", response_model=list[MeetingCalendarDay], dependencies=[Depends(security.access_token_required)])
+async def read_meetings_calendar(
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to"),
+    team_ids: str | None = None,
+    case_id: int | None = None,
+    term_id: int | None = None,
+    db: AsyncSession = Depends(get_session),
+):
+    try:
+        ids = [int(item) for item in team_ids.split(",") if item.strip()] if team_ids else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="'team_ids' must be a comma-separated list of integers")
+    try:
+        return json_response(list[MeetingCalendarDay], await get_meetings_calendar(db, date_from, date_to, ids, case_id, term_id))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/previous/{meeting_id}", response_model=int | None, dependencies=[Depends(security.access_token_required)])
 async def read_previous_meeting_id(meeting_id: int, db: AsyncSession = Depends(get_session)):
     return await get_previous_meeting_id(db, meeting_id)
 
@@ -48,7 +85,20 @@ async def add_meeting(data: MeetingCreate, db: AsyncSession = Depends(get_sessio
 
 @router.post("/user-link/", response_model=MeetingUserRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
 async def add_meeting_user_link(data: MeetingUserCreate, db: AsyncSession = Depends(get_session)):
-    return await link_meeting_user(db, data)
+    try:
+        return await link_meeting_user(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.put("/{meeting_id}/attendees", response_model=MeetingAttendeesRead, dependencies=[Depends(security.access_token_required)])
+async def replace_meeting_attendees(meeting_id: int, data: MeetingAttendeesUpdate, db: AsyncSession = Depends(get_session)):
+    try:
+        result = await set_meeting_attendees(db, meeting_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not result:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    return result
 
 @router.patch("/{meeting_id}", response_model=MeetingRead, dependencies=[Depends(security.access_token_required)])
 async def edit_meeting(meeting_id: int, data: MeetingUpdate, db: AsyncSession = Depends(get_session)):
@@ -57,6 +107,16 @@ async def edit_meeting(meeting_id: int, data: MeetingUpdate, db: AsyncSession =
         raise HTTPException(status_code=404, detail="Meeting not found")
     return updated
 
+@router.post("/{meeting_id}/assignments/carry-over", response_model=AssignmentCarryOverRead, dependencies=[Depends(security.access_token_required)])
+async def carry_over_meeting_assignments(meeting_id: int, mode: CarryOverMode = "copy", target_meeting_id: int | None = None, db: AsyncSession = Depends(get_session)):
+    try:
+        result = await carry_over_assignments(db, meeting_id, mode, target_meeting_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not result:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    return result
+
 @router.delete("/{meeting_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(security.access_token_required)])
 async def remove_meeting(meeting_id: int, db: AsyncSession = Depends(get_session)):
     deleted = await delete_meeting(db, meeting_id)
@@ -74,17 +134,56 @@ async def get_schedule(team_id: int, db: AsyncSession = Depends(get_session)):
     return schedule
 
 
-@router.post("/schedule/", response_model=MeetingScheduleRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
-async def create_schedule(data: MeetingScheduleCreate, db: AsyncSession = Depends(get_session)):
+@router.post("/schedule/", response_model=MeetingScheduleRead | JobRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
+async def create_schedule(data: MeetingScheduleCreate, response: Response, background: bool = False, db: AsyncSession = Depends(get_session)):
+    if background:
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await enqueue_job(db, "meeting_schedule.create", data.model_dump(mode="json"))
     try:
         return await create_meeting_schedule(db, data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.patch("/schedule/{schedule_id}", response_model=MeetingScheduleRead, dependencies=[Depends(security.access_token_required)])
-async def update_schedule(schedule_id: int, data: MeetingScheduleUpdate, db: AsyncSession = Depends(get_session)):
+@router.patch("/schedule/{schedule_id}", response_model=MeetingScheduleRead | JobRead, dependencies=[Depends(security.access_token_required)])
+async def update_schedule(schedule_id: int, data: MeetingScheduleUpdate, response: Response, background: bool = False, db: AsyncSession = Depends(get_session)):
+    if background:
+        if not await get_meeting_schedule(db, schedule_id):
+            raise HTTPException(status_code=404, detail="Schedule not found")
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await enqueue_job(
+            db,
+            "meeting_schedule.update",
+            {"schedule_id": schedule_id, "data": data.model_dump(mode="json", exclude_unset=True)},
+        )
     updated = await update_meeting_schedule(db, schedule_id, data)
     if not updated:
         raise HTTPException(status_code=404, detail="Schedule not found")
     return updated
+
+
+@router.get("/schedule/{schedule_id}/occurrences", response_model=list[MeetingOccurrenceRead], dependencies=[Depends(security.access_token_required)])
+async def read_schedule_occurrences(
+    schedule_id: int,
+    date_from: date = Query(alias="from"),
+    date_to: date = Query(alias="to"),
+    db: AsyncSession = Depends(get_session),
+):
+    try:
+        occurrences = await get_schedule_occurrences(db, schedule_id, date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if occurrences is None:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return json_response(list[MeetingOccurrenceRead], occurrences)
+
+
+@router.post("/schedule/{schedule_id}/occurrences", response_model=MeetingRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
+async def materialize_occurrence(schedule_id: int, data: MeetingOccurrenceMaterialize, db: AsyncSession = Depends(get_session)):
+    try:
+        meeting = await materialize_schedule_occurrence(db, schedule_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return meeting
@@ -12,13 +12,14 @@ from app.services.student_service import (
     update_student,
     delete_student
 )
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[StudentRead], dependencies=[Depends(security.access_token_required)])
 async def list_students(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_students_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[StudentRead], await get_students_filtered(db, dict(request.query_params)))
 
 @router.get("/{student_id}", response_model=StudentRead, dependencies=[Depends(security.access_token_required)])
 async def read_student(student_id: int, db: AsyncSession = Depends(get_session)):
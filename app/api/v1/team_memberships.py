@@ -12,13 +12,14 @@ from app.services.team_membership_service import (
     update_membership,
     delete_membership
 )
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[TeamMembershipRead], dependencies=[Depends(security.access_token_required)])
 async def list_team_memberships(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_memberships_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[TeamMembershipRead], await get_memberships_filtered(db, dict(request.query_params)))
 
 @router.get("/{team_membership_id}", response_model=TeamMembershipRead, dependencies=[Depends(security.access_token_required)])
 async def read_team_membership(team_membership_id: int, db: AsyncSession = Depends(get_session)):
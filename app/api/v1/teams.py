@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import security
+from app.core.config import settings
+from app.core.security import security, team_feed_token, verify_team_feed_token
 from app.db.session import get_session
+from app.schemas.assignment import AssignmentRead
 from app.schemas.paginated import PaginatedResponse
-from app.schemas.team import TeamCreate, TeamUpdate, TeamRead
+from app.schemas.roster import RosterImportRead
+from app.schemas.team import TeamCreate, TeamFeedRead, TeamUpdate, TeamRead
+from app.services.assignment_service import get_team_assignments
+from app.services.meeting_service import get_team_meetings_feed, team_feed_cache
+from app.services.roster_service import import_roster
 from app.services.team_service import (
     get_teams_filtered,
     get_team,
@@ -12,13 +18,33 @@ from app.services.team_service import (
     update_team,
     delete_team
 )
+from app.utils.cache import etag_matches
+from app.utils.compression import encode_cached
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[TeamRead], dependencies=[Depends(security.access_token_required)])
 async def list_teams(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_teams_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[TeamRead], await get_teams_filtered(db, dict(request.query_params)))
+
+@router.post("/import", response_model=RosterImportRead, dependencies=[Depends(security.access_token_required)])
+async def import_team_roster(
+    request: Request,
+    dry_run: bool = False,
+    case_id: int | None = None,
+    delimiter: str = Query(",", min_length=1, max_length=1),
+    db: AsyncSession = Depends(get_session),
+):
+    if request.headers.get("content-type", "").startswith("multipart/"):
+        raise HTTPException(status_code=415, detail="Send the CSV file as the request body (Content-Type: text/csv)")
+    try:
+        report = await import_roster(db, request.stream(), dry_run, case_id, delimiter)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    status_code = status.HTTP_409_CONFLICT if report["errors"] and not dry_run else status.HTTP_200_OK
+    return json_response(RosterImportRead, report, status_code=status_code)
 
 @router.get("/{team_id}", response_model=TeamRead, dependencies=[Depends(security.access_token_required)])
 async def read_team(team_id: int, db: AsyncSession = Depends(get_session)):
@@ -27,13 +53,55 @@ async def read_team(team_id: int, db: AsyncSession = Depends(get_session)):
         raise HTTPException(status_code=404, detail="Team not found")
     return team
 
+@router.get("/{team_id}/assignments", response_model=PaginatedResponse[AssignmentRead], dependencies=[Depends(security.access_token_required)])
+async def list_team_assignments(team_id: int, request: Request, completed: bool | None = None, db: AsyncSession = Depends(get_session)):
+    params = {key: value for key, value in request.query_params.items() if key != "completed"}
+    page = await get_team_assignments(db, team_id, params, completed)
+    if page is None:
+        raise HTTPException(status_code=404, detail="Team not found")
+    return json_response(PaginatedResponse[AssignmentRead], page)
+
+@router.get("/{team_id}/meetings.ics/link", response_model=TeamFeedRead, dependencies=[Depends(security.access_token_required)])
+async def read_team_meetings_feed_link(team_id: int, request: Request, db: AsyncSession = Depends(get_session)):
+    if not await get_team(db, team_id):
+        raise HTTPException(status_code=404, detail="Team not found")
+    token = team_feed_token(team_id)
+    url = request.url_for("read_team_meetings_feed", team_id=team_id).include_query_params(token=token)
+    return TeamFeedRead(team_id=team_id, token=token, url=str(url))
+
+@router.get("/{team_id}/meetings.ics", response_class=Response)
+async def read_team_meetings_feed(team_id: int, request: Request, token: str | None = None, db: AsyncSession = Depends(get_session)):
+    # Calendar clients subscribe by URL and cannot send the auth cookie, so a
+    # signed per-team token in the query string is accepted instead.
+    if token is None:
+        await security.access_token_required(request)
+    elif not verify_team_feed_token(team_id, token):
+        raise HTTPException(status_code=403, detail="Invalid feed token")
+    feed = await get_team_meetings_feed(db, team_id)
+    if not feed:
+        raise HTTPException(status_code=404, detail="Team not found")
+    etag, body = feed
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={settings.ICS_CACHE_TTL}", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    content, encoding = encode_cached(team_feed_cache, team_id, body.encode("utf-8"), request.headers.get("accept-encoding"))
+    if encoding:
+        headers.update({"Content-Encoding": encoding, "ETag": f"W/{etag}"})
+    return Response(content=content, media_type="text/calendar; charset=utf-8", headers=headers)
+
 @router.post("/", response_model=TeamRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
 async def add_team(data: TeamCreate, db: AsyncSession = Depends(get_session)):
-    return await create_team(db, data)
+    try:
+        return await create_team(db, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.patch("/{team_id}", response_model=TeamRead, dependencies=[Depends(security.access_token_required)])
 async def edit_team(team_id: int, data: TeamUpdate, db: AsyncSession = Depends(get_session)):
-    updated = await update_team(db, team_id, data)
+    try:
+        updated = await update_team(db, team_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not updated:
         raise HTTPException(status_code=404, detail="Team not found")
     return updated
@@ -3,22 +3,37 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import security
 from app.db.session import get_session
+from app.schemas.assignment import AssignmentCarryOverRead
+from app.schemas.grade import TeamGradeRead
+from app.schemas.job import JobRead
 from app.schemas.paginated import PaginatedResponse
-from app.schemas.term import TermCreate, TermUpdate, TermRead
+from app.schemas.term import TermArchiveRead, TermClone, TermCloneRead, TermCreate, TermUpdate, TermRead, TermStatsRead
 from app.services.term_service import (
     get_terms_filtered,
     get_term,
+    get_term_stats,
+    archive_ended_terms,
+    clone_term,
     create_term,
     update_term,
     delete_term
 )
+from app.services.assignment_service import CarryOverMode, carry_over_term_assignments
+from app.services.grade_service import enqueue_final_mark_recompute, get_term_grades
+from app.services.job_service import enqueue_job
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[TermRead], dependencies=[Depends(security.access_token_required)])
 async def list_terms(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_terms_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[TermRead], await get_terms_filtered(db, dict(request.query_params)))
+
+@router.post("/archive-ended", response_model=TermArchiveRead, dependencies=[Depends(security.access_token_required)])
+async def archive_finished_terms(db: AsyncSession = Depends(get_session)):
+    term_ids = await archive_ended_terms(db)
+    return TermArchiveRead(archived=len(term_ids), term_ids=term_ids)
 
 @router.get("/{term_id}", response_model=TermRead, dependencies=[Depends(security.access_token_required)])
 async def read_term(term_id: int, db: AsyncSession = Depends(get_session)):
@@ -27,10 +42,55 @@ async def read_term(term_id: int, db: AsyncSession = Depends(get_session)):
         raise HTTPException(status_code=404, detail="Term not found")
     return term
 
+@router.get("/{term_id}/stats", response_model=TermStatsRead, dependencies=[Depends(security.access_token_required)])
+async def read_term_stats(term_id: int, db: AsyncSession = Depends(get_session)):
+    stats = await get_term_stats(db, term_id)
+    if not stats:
+        raise HTTPException(status_code=404, detail="Term not found")
+    return stats
+
+@router.get("/{term_id}/grades", response_model=list[TeamGradeRead], dependencies=[Depends(security.access_token_required)])
+async def read_term_grades(term_id: int, db: AsyncSession = Depends(get_session)):
+    grades = await get_term_grades(db, term_id)
+    if grades is None:
+        raise HTTPException(status_code=404, detail="Term not found")
+    return json_response(list[TeamGradeRead], grades)
+
+@router.post("/{term_id}/grades/rebuild", response_model=JobRead, status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(security.access_token_required)])
+async def rebuild_term_grades(term_id: int, db: AsyncSession = Depends(get_session)):
+    if not await get_term(db, term_id):
+        raise HTTPException(status_code=404, detail="Term not found")
+    return await enqueue_job(db, "team_grades.rebuild", {"term_id": term_id})
+
+@router.post("/{term_id}/final-marks/recompute", response_model=JobRead, status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(security.access_token_required)])
+async def recompute_term_final_marks(term_id: int, db: AsyncSession = Depends(get_session)):
+    if not await get_term(db, term_id):
+        raise HTTPException(status_code=404, detail="Term not found")
+    try:
+        return await enqueue_final_mark_recompute(db, term_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/{term_id}/assignments/carry-over", response_model=AssignmentCarryOverRead, dependencies=[Depends(security.access_token_required)])
+async def carry_over_term_open_assignments(term_id: int, mode: CarryOverMode = "copy", db: AsyncSession = Depends(get_session)):
+    if not await get_term(db, term_id):
+        raise HTTPException(status_code=404, detail="Term not found")
+    return await carry_over_term_assignments(db, term_id, mode)
+
 @router.post("/", response_model=TermRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
 async def add_term(data: TermCreate, db: AsyncSession = Depends(get_session)):
     return await create_term(db, data)
 
+@router.post("/{term_id}/clone", response_model=TermCloneRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(security.access_token_required)])
+async def clone_existing_term(term_id: int, data: TermClone, db: AsyncSession = Depends(get_session)):
+    try:
+        cloned = await clone_term(db, term_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not cloned:
+        raise HTTPException(status_code=404, detail="Term not found")
+    return cloned
+
 @router.patch("/{term_id}", response_model=TermRead, dependencies=[Depends(security.access_token_required)])
 async def edit_term(term_id: int, data: TermUpdate, db: AsyncSession = Depends(get_session)):
     updated = await update_term(db, term_id, data)
@@ -12,13 +12,14 @@ from app.services.user_service import (
     update_user,
     delete_user
 )
+from app.utils.responses import json_response
 import app.models
 
 router = APIRouter()
 
 @router.get("/", response_model=PaginatedResponse[UserRead], dependencies=[Depends(security.access_token_required)])
 async def list_users(request: Request, db: AsyncSession = Depends(get_session)):
-    return await get_users_filtered(db, dict(request.query_params))
+    return json_response(PaginatedResponse[UserRead], await get_users_filtered(db, dict(request.query_params)))
 
 @router.get("/{user_id}", response_model=UserRead, dependencies=[Depends(security.access_token_required)])
 async def read_user(user_id: int, db: AsyncSession = Depends(get_session)):
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -9,6 +11,57 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: str
     JWT_SECRET_KEY: str
+    DB_CREATE_ON_STARTUP: bool = True
+    PAGE_SIZE_DEFAULT: int = 20
+    PAGE_SIZE_MAX: int = 100
+    PAGE_SIZE_LIMITS: dict[str, int] = {}
+    CALENDAR_MAX_DAYS: int = 62
+    ICS_CACHE_TTL: int = 300
+    ICS_FEED_SECRET: str | None = None
+    TERM_STATS_CACHE_TTL: int = 60
+    TERM_ARCHIVE_AFTER_DAYS: int = 30
+    MEETING_DURATION_MINUTES: int = 60
+    LAZY_MEETINGS: bool = False
+    JOB_WORKERS: int = 2
+    JOB_LEASE_SECONDS: float = 60
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_PROGRESS_INTERVAL: float = 2
+    ROSTER_IMPORT_MAX_ROWS: int = 20000
+    ROSTER_IMPORT_BATCH_SIZE: int = 1000
+    FINAL_MARK_FORMULA: Literal["manual", "sum", "average"] = "manual"
+    FINAL_MARK_WEIGHT: float = 1.0
+    FINAL_MARK_UNIVERSITY_WEIGHT: float = 0.0
+    LOG_LEVEL: str = "INFO"
+    ACCESS_LOG: bool = True
+    METRICS_ENABLED: bool = True
+    QUERY_BUDGET: int | None = None
+    QUERY_REPEAT_LIMIT: int | None = None
+    QUERY_BUDGET_ACTION: Literal["warn", "raise", "off"] = "warn"
+    SLOW_QUERY_MS: float | None = 200
+    SLOW_QUERY_BUFFER_SIZE: int = 200
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    SLOW_QUERY_LOG_PARAMETERS: bool = False
+    ADMIN_USER_IDS: list[int] = []
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_SAMPLE_INTERVAL_MS: float = 5
+    PROFILING_MAX_PROFILES: int = 50
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    WEB_HOST: str = "0.0.0.0"
+    WEB_PORT: int = 8000
+    WEB_CONCURRENCY: int | None = None
+    WEB_KEEPALIVE: int = 75
+    WEB_BACKLOG: int = 2048
+    WEB_LIMIT_CONCURRENCY: int | None = None
+    WEB_MAX_REQUESTS: int | None = None
+    WEB_GRACEFUL_TIMEOUT: int = 30
+    WEB_LOOP: str = "auto"
+    WEB_HTTP: str = "auto"
+    WEB_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
 
     model_config = ConfigDict(env_file=".env")
 
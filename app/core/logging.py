@@ -0,0 +1,41 @@
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+
+from app.core.config import settings
+
+access_logger = logging.getLogger("reqroute.access")
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+def configure_logging():
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(settings.LOG_LEVEL)
+
+    access_logger.disabled = not settings.ACCESS_LOG
+    logging.getLogger("uvicorn.access").disabled = settings.ACCESS_LOG
+
+
+def log_access(**fields):
+    access_logger.info(
+        "%s %s %s", fields.get("method"), fields.get("path"), fields.get("status"),
+        extra={"fields": fields},
+    )
@@ -0,0 +1,161 @@
+import time
+
+from app.core.logging import log_access
+from app.core.metrics import (
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    http_requests_total,
+    http_response_size_bytes,
+)
+from app.core.config import settings
+from app.db.instrumentation import check_query_budget, track_queries
+from app.utils.compression import StreamCompressor, compress, is_compressible, negotiate_encoding
+
+
+def route_template(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class TimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        state = {"status": 500, "size": 0}
+        start = time.perf_counter()
+
+        with track_queries(route=lambda: route_template(scope)) as stats:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    if settings.QUERY_BUDGET_ACTION == "raise":
+                        # Checked before the response starts, so a violation
+                        # still fails the request instead of only being logged.
+                        check_query_budget(stats, route_template(scope))
+                    state["status"] = message["status"]
+                    timing = (
+                        f'db;dur={stats.duration_ms};desc="{stats.count} queries", '
+                        f"app;dur={(time.perf_counter() - start) * 1000:.2f}"
+                    )
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode("latin-1"))]
+                elif message["type"] == "http.response.body":
+                    state["size"] += len(message.get("body", b""))
+                await send(message)
+
+            http_requests_in_progress.inc(method=method)
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                duration = time.perf_counter() - start
+                http_requests_in_progress.dec(method=method)
+                route = route_template(scope)
+                status = state["status"]
+                http_requests_total.inc(method=method, route=route, status=status)
+                http_request_duration_seconds.observe(duration, method=method, route=route)
+                http_response_size_bytes.observe(state["size"], method=method, route=route)
+                client = scope.get("client")
+                log_access(
+                    method=method,
+                    path=scope["path"],
+                    route=route,
+                    status=status,
+                    duration_ms=round(duration * 1000, 2),
+                    size=state["size"],
+                    client=client[0] if client else None,
+                    db_queries=stats.count,
+                    db_ms=stats.duration_ms,
+                )
+
+        if settings.QUERY_BUDGET_ACTION == "warn":
+            check_query_budget(stats, route)
+
+
+def _header(headers, name: bytes):
+    return next((value.decode("latin-1") for key, value in headers if key.lower() == name), None)
+
+
+def _add_vary(headers) -> list:
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return [*headers, (b"vary", b"Accept-Encoding")]
+    if "accept-encoding" in vary.lower():
+        return headers
+    return [(k, v) if k.lower() != b"vary" else (k, f"{vary}, Accept-Encoding".encode("latin-1")) for k, v in headers]
+
+
+def _encoded_headers(headers, encoding: str, length: int | None) -> list:
+    result = []
+    for key, value in headers:
+        name = key.lower()
+        if name == b"content-length":
+            continue
+        if name == b"etag" and not value.startswith(b"W/"):
+            value = b"W/" + value
+        result.append((key, value))
+    result.append((b"content-encoding", encoding.encode("latin-1")))
+    if length is not None:
+        result.append((b"content-length", str(length).encode("latin-1")))
+    return result
+
+
+class CompressionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = next((value.decode("latin-1") for key, value in scope["headers"] if key == b"accept-encoding"), None)
+        encoding = negotiate_encoding(accept)
+        state = {"start": None, "mode": None, "compressor": None}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["start"] = message
+                return
+            if message["type"] != "http.response.body" or state["mode"] == "passthrough":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if state["mode"] == "stream":
+                chunk = state["compressor"].compress(body)
+                if not more_body:
+                    chunk += state["compressor"].finish()
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            start = state["start"]
+            headers = list(start.get("headers", []))
+            compressible = is_compressible(_header(headers, b"content-type")) and _header(headers, b"content-encoding") is None
+            if compressible:
+                headers = _add_vary(headers)
+            if not compressible or encoding is None or (not more_body and len(body) < settings.COMPRESSION_MIN_SIZE):
+                state["mode"] = "passthrough"
+                await send({**start, "headers": headers})
+                await send(message)
+                return
+
+            if not more_body:
+                state["mode"] = "passthrough"
+                compressed = compress(body, encoding)
+                await send({**start, "headers": _encoded_headers(headers, encoding, len(compressed))})
+                await send({"type": "http.response.body", "body": compressed})
+                return
+
+            state["mode"] = "stream"
+            state["compressor"] = StreamCompressor(encoding)
+            await send({**start, "headers": _encoded_headers(headers, encoding, None)})
+            await send({"type": "http.response.body", "body": state["compressor"].compress(body), "more_body": True})
+
+        await self.app(scope, receive, send_wrapper)
+        if state["start"] is not None and state["mode"] is None:
+            await send(state["start"])
@@ -0,0 +1,205 @@
+import asyncio
+import cProfile
+import io
+import itertools
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+
+from starlette.requests import HTTPConnection
+
+from app.core.config import settings
+from app.core.middleware import route_template
+from app.core.security import is_admin_token
+
+
+class RequestProfile:
+    def __init__(self, id: int, method: str, path: str, route: str, duration_ms: float,
+                 profiler: cProfile.Profile, stacks: Counter):
+        self.id = id
+        self.method = method
+        self.path = path
+        self.route = route
+        self.duration_ms = duration_ms
+        self.recorded_at = datetime.now(timezone.utc)
+        self.profiler = profiler
+        self.stacks = stacks
+
+
+class ProfileStore:
+    def __init__(self, size: int):
+        self.profiles = deque(maxlen=size)
+        self._ids = itertools.count(1)
+
+    def add(self, **fields) -> RequestProfile:
+        profile = RequestProfile(id=next(self._ids), **fields)
+        self.profiles.appendleft(profile)
+        return profile
+
+    def get(self, id: int) -> RequestProfile | None:
+        return next((profile for profile in self.profiles if profile.id == id), None)
+
+    def select(self, route: str | None = None) -> list[RequestProfile]:
+        return [profile for profile in self.profiles if route is None or profile.route == route]
+
+    def clear(self):
+        self.profiles.clear()
+
+
+profile_store = ProfileStore(settings.PROFILING_MAX_PROFILES)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _await_chain(awaitable) -> list[str]:
+    labels = []
+    while awaitable is not None:
+        if isinstance(awaitable, asyncio.Task):
+            awaitable = awaitable.get_coro()
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None) or getattr(awaitable, "ag_frame", None)
+        if frame is None:
+            labels.append(f"<await {type(awaitable).__name__}>")
+            break
+        labels.append(_frame_label(frame))
+        awaitable = (
+            getattr(awaitable, "cr_await", None)
+            or getattr(awaitable, "gi_yieldfrom", None)
+            or getattr(awaitable, "ag_await", None)
+        )
+    return labels
+
+
+class ProfiledCoroutine:
+    """Drives one request's coroutine step by step.
+
+    cProfile is enabled only while the request's own code runs, so other
+    requests sharing the event loop are not attributed to it, and the
+    sampler can tell running steps from awaits.
+    """
+
+    def __init__(self, coro, profiler: cProfile.Profile):
+        self.coro = coro
+        self.profiler = profiler
+        self.step_frame = None
+
+    def __await__(self):
+        value, error = None, None
+        while True:
+            self.step_frame = sys._getframe()
+            self.profiler.enable()
+            try:
+                yielded = self.coro.throw(error) if error is not None else self.coro.send(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.profiler.disable()
+                self.step_frame = None
+            try:
+                value, error = (yield yielded), None
+            except BaseException as exc:
+                value, error = None, exc
+
+    def sample(self, thread_id: int) -> list[str]:
+        step_frame = self.step_frame
+        if step_frame is None:
+            return _await_chain(self.coro)
+        # Mid-step: the request's frames are those above the step frame on
+        # the event-loop thread's stack.
+        labels = []
+        frame = sys._current_frames().get(thread_id)
+        while frame is not None and frame is not step_frame:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        return list(reversed(labels)) if frame is step_frame else _await_chain(self.coro)
+
+
+class StackSampler:
+    def __init__(self, target: ProfiledCoroutine, thread_id: int, interval: float):
+        self.target = target
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            labels = self.target.sample(self.thread_id)
+            if labels:
+                self.stacks[";".join(labels)] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+def render_stats(profiles: list[RequestProfile], sort: str = "cumulative", limit: int = 50) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(*(profile.profiler for profile in profiles), stream=stream)
+    stats.sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def dump_stats(profiles: list[RequestProfile]) -> bytes:
+    stats = pstats.Stats(*(profile.profiler for profile in profiles))
+    return marshal.dumps(stats.stats)
+
+
+def collapse_stacks(profiles: list[RequestProfile]) -> str:
+    stacks = sum((profile.stacks for profile in profiles), Counter())
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class ProfilingMiddleware:
+    # One request is profiled at a time. Work the request hands to other
+    # tasks (background tasks, thread pools) is not followed, except tasks it
+    # awaits directly.
+    def __init__(self, app):
+        self.app = app
+        self._active = False
+
+    def _should_profile(self, scope) -> bool:
+        if self._active:
+            return False
+        connection = HTTPConnection(scope)
+        if settings.PROFILING_HEADER.lower() in connection.headers:
+            return is_admin_token(connection.cookies.get("access_token"))
+        return random.random() < settings.PROFILING_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profiler = cProfile.Profile()
+        target = ProfiledCoroutine(self.app(scope, receive, send), profiler)
+        sampler = StackSampler(target, threading.get_ident(), settings.PROFILING_SAMPLE_INTERVAL_MS / 1000)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await target
+        finally:
+            stacks = sampler.stop()
+            self._active = False
+            profile_store.add(
+                method=scope["method"],
+                path=scope["path"],
+                route=route_template(scope),
+                duration_ms=round((time.perf_counter() - start) * 1000, 2),
+                profiler=profiler,
+                stacks=stacks,
+            )
@@ -1,5 +1,11 @@
+import hashlib
+import hmac
+
+from authx import AuthX, AuthXConfig, RequestToken, TokenPayload
+from authx.exceptions import AuthXException
+from fastapi import Depends, HTTPException, status
+
 from app.core.config import settings
-from authx import AuthX, AuthXConfig
 
 config = AuthXConfig()
 config.JWT_SECRET_KEY = settings.JWT_SECRET_KEY
@@ -8,3 +14,32 @@ config.JWT_ACCESS_COOKIE_NAME = "access_token"
 config.JWT_COOKIE_CSRF_PROTECT = False
 
 security = AuthX(config=config)
+
+
+def is_admin_subject(sub: str | None) -> bool:
+    return sub in {str(user_id) for user_id in settings.ADMIN_USER_IDS}
+
+
+def is_admin_token(token: str | None) -> bool:
+    if not token:
+        return False
+    try:
+        payload = security.verify_token(RequestToken(token=token, location="cookies"), verify_csrf=False)
+    except (AuthXException, ValueError):
+        return False
+    return is_admin_subject(payload.sub)
+
+
+async def admin_required(payload: TokenPayload = Depends(security.access_token_required)) -> TokenPayload:
+    if not is_admin_subject(payload.sub):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return payload
+
+
+def team_feed_token(team_id: int) -> str:
+    secret = (settings.ICS_FEED_SECRET or settings.JWT_SECRET_KEY).encode("utf-8")
+    return hmac.new(secret, f"team-feed:{team_id}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def verify_team_feed_token(team_id: int, token: str) -> bool:
+    return hmac.compare_digest(team_feed_token(team_id).encode("utf-8"), token.encode("utf-8"))
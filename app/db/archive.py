@@ -0,0 +1,81 @@
+from sqlalchemy import select, update
+
+from app.models.assignment import Assignment
+from app.models.case import Case
+from app.models.checkpoint import Checkpoint
+from app.models.meeting import Meeting
+from app.models.meeting_schedule import MeetingSchedule
+from app.models.team import Team
+from app.models.team_membership import TeamMembership
+from app.models.term import Term
+
+
+def _active_terms():
+    return select(Term.id).where(Term.archived == False)
+
+
+def _active_cases():
+    return select(Case.id).where(Case.term_id.in_(_active_terms()))
+
+
+def _active_teams():
+    return select(Team.id).where(Team.case_id.in_(_active_cases()))
+
+
+# Meetings, assignments and checkpoints carry a copy of their term's archived
+# flag, so the large tables are filtered on the row itself. The smaller
+# tables are scoped to active terms through their indexed foreign keys.
+_ACTIVE_CLAUSES = {
+    Term: lambda: Term.archived == False,
+    Case: lambda: Case.term_id.in_(_active_terms()),
+    Team: lambda: Team.case_id.in_(_active_cases()),
+    TeamMembership: lambda: TeamMembership.team_id.in_(_active_teams()),
+    MeetingSchedule: lambda: MeetingSchedule.team_id.in_(_active_teams()),
+    Checkpoint: lambda: Checkpoint.archived == False,
+    Meeting: lambda: Meeting.archived == False,
+    Assignment: lambda: Assignment.archived == False,
+}
+
+
+def active_term_clause(model):
+    clause = _ACTIVE_CLAUSES.get(model)
+    return clause() if clause else None
+
+
+def team_archived(team_id):
+    """Archived flag of the team's term, as a scalar subquery for inserts and updates."""
+    return (
+        select(Term.archived)
+        .join(Case, Case.term_id == Term.id)
+        .join(Team, Team.case_id == Case.id)
+        .where(Team.id == team_id)
+        .scalar_subquery()
+    )
+
+
+def meeting_archived(meeting_id):
+    return select(Meeting.archived).where(Meeting.id == meeting_id).scalar_subquery()
+
+
+ARCHIVED_COPIES = (Checkpoint.__table__, Meeting.__table__, Assignment.__table__)
+
+
+async def sync_archived(db, teams):
+    """Copy the term's archived flag onto the meetings, assignments and checkpoints of `teams` (a select of team ids)."""
+    for model in (Checkpoint, Meeting):
+        await db.execute(
+            update(model)
+            .where(model.team_id.in_(teams))
+            .values(archived=team_archived(model.team_id))
+            .execution_options(synchronize_session=False)
+        )
+    await db.execute(
+        update(Assignment)
+        .where(Assignment.meeting_id.in_(select(Meeting.id).where(Meeting.team_id.in_(teams))))
+        .values(archived=meeting_archived(Assignment.meeting_id))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def term_teams(term_ids):
+    return select(Team.id).join(Case, Team.case_id == Case.id).where(Case.term_id.in_(term_ids))
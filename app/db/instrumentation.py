@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import random
+import re
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import Context, ContextVar
+from datetime import datetime, timezone
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_current_stats: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    def __init__(self, parent: "QueryStats | None" = None, route: Callable[[], str] | None = None):
+        self.parent = parent
+        self._route = route
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, duration: float, executemany: bool):
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            if not executemany:
+                stats.statements[statement] += 1
+            stats = stats.parent
+
+    @property
+    def route(self) -> str | None:
+        stats = self
+        while stats is not None:
+            if stats._route is not None:
+                return stats._route()
+            stats = stats.parent
+        return None
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 2)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {statement: n for statement, n in self.statements.items() if n >= threshold}
+
+    def violations(self, max_queries: int | None, max_repeats: int | None) -> list[str]:
+        problems = []
+        if max_queries is not None and self.count > max_queries:
+            problems.append(f"{self.count} queries exceed the budget of {max_queries}")
+        if max_repeats is not None:
+            for statement, n in self.repeated(max_repeats + 1).items():
+                problems.append(f"statement repeated {n} times: {statement}")
+        return problems
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(route: Callable[[], str] | None = None):
+    stats = QueryStats(parent=_current_stats.get(), route=route)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_query_budget(max_queries: int | None = None, max_repeats: int | None = None):
+    with track_queries() as stats:
+        yield stats
+    problems = stats.violations(max_queries, max_repeats)
+    if problems:
+        raise QueryBudgetExceeded("; ".join(problems))
+
+
+def check_query_budget(stats: QueryStats, route: str):
+    if settings.QUERY_BUDGET_ACTION == "off":
+        return
+    problems = stats.violations(settings.QUERY_BUDGET, settings.QUERY_REPEAT_LIMIT)
+    if not problems:
+        return
+    message = f"Query budget exceeded on {route}: " + "; ".join(problems)
+    if settings.QUERY_BUDGET_ACTION == "raise":
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%s|\$\d+|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|%s|\$\d+|%\(\w+\)s|:\w+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("(...)", statement)
+
+
+def _format_parameters(parameters, executemany: bool, limit: int = 500) -> str:
+    if executemany:
+        return _format_parameters(parameters[0], False, limit) + f" (+{len(parameters) - 1} more rows)"
+    text = repr(parameters)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class SlowQueryLog:
+    def __init__(self, size: int):
+        self.entries = deque(maxlen=size)
+
+    def add(self, entry: dict):
+        self.entries.appendleft(entry)
+
+    def list(self, limit: int | None = None) -> list[dict]:
+        entries = list(self.entries)
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        self.entries.clear()
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_BUFFER_SIZE)
+
+
+_async_engines: "WeakKeyDictionary" = WeakKeyDictionary()
+_explain_tasks: set[asyncio.Task] = set()
+_EXPLAIN_OPTION = "slow_query_explain"
+
+
+async def _explain(engine: AsyncEngine, statement: str, parameters, entry: dict):
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) "
+    elif dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    else:
+        return
+    # A separate connection whose transaction is rolled back on close, so the
+    # request neither waits for the plan nor shares its transaction with it.
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(**{_EXPLAIN_OPTION: True})
+            rows = (await conn.exec_driver_sql(prefix + statement, parameters)).all()
+    except Exception as exc:
+        logger.warning("EXPLAIN failed for slow query: %s", exc)
+        return
+    if dialect == "sqlite":
+        entry["plan"] = "\n".join(str(row[-1]) for row in rows)
+    else:
+        entry["plan"] = "\n".join(row[0] for row in rows)
+
+
+def _schedule_explain(conn, statement: str, parameters, entry: dict):
+    engine = _async_engines.get(conn.engine)
+    if engine is None or _explain_tasks:
+        # Only one EXPLAIN runs at a time; samples taken meanwhile are dropped.
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    # A fresh context keeps the EXPLAIN out of the request's query stats.
+    task = loop.create_task(_explain(engine, statement, parameters, entry), context=Context())
+    _explain_tasks.add(task)
+    task.add_done_callback(_explain_tasks.discard)
+
+
+def _record_slow_query(conn, statement: str, parameters, duration: float, executemany: bool, route: str | None):
+    entry = {
+        "recorded_at": datetime.now(timezone.utc),
+        "duration_ms": round(duration * 1000, 2),
+        "route": route,
+        "statement": normalize_statement(statement),
+        "parameters": _format_parameters(parameters, executemany) if settings.SLOW_QUERY_LOG_PARAMETERS else None,
+        "plan": None,
+    }
+    slow_query_log.add(entry)
+    logger.warning(
+        "Slow query (%.2f ms) on %s: %s",
+        entry["duration_ms"],
+        route or "-",
+        entry["statement"],
+        extra={"fields": {"duration_ms": entry["duration_ms"], "route": route, "parameters": entry["parameters"]}},
+    )
+    if (
+        not executemany
+        and statement.lstrip().upper().startswith(("SELECT", "WITH"))
+        and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+    ):
+        _schedule_explain(conn, statement, parameters, entry)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration, executemany)
+    threshold = settings.SLOW_QUERY_MS
+    if threshold is not None and duration * 1000 >= threshold and not conn.get_execution_options().get(_EXPLAIN_OPTION):
+        _record_slow_query(conn, statement, parameters, duration, executemany, stats.route if stats else None)
+
+
+def _handle_error(exception_context):
+    starts = exception_context.connection.info.get("query_start_time") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine):
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if isinstance(engine, AsyncEngine):
+        _async_engines[sync_engine] = engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -1,13 +1,29 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncAttrs
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine, AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, mapped_column, Mapped
 from app.core.config import settings
+from app.db.instrumentation import instrument_engine
 
 class Base(DeclarativeBase, AsyncAttrs):
     __abstract__ = True
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine):
+    # SQLite ignores ON DELETE clauses unless foreign keys are switched on per connection.
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 engine = create_async_engine(settings.database_url)
+enable_sqlite_foreign_keys(engine)
+instrument_engine(engine)
 
 SessionLocal = async_sessionmaker(
     bind=engine,
@@ -1,9 +1,24 @@
 from authx.exceptions import AuthXException
 from fastapi import FastAPI, HTTPException, status
-from app.api.v1 import auth, cases, terms, teams, students, team_memberships, users, meetings, assignments, checkpoints
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.api.v1 import admin, auth, cases, terms, teams, students, team_memberships, users, meetings, assignments, checkpoints, jobs
+from app.core.config import settings
+from app.core.logging import configure_logging
+from app.core.metrics import registry
+from app.core.middleware import CompressionMiddleware, TimingMiddleware
+from app.core.profiling import ProfilingMiddleware
 from app.db.session import init_db
+from app.services.job_service import job_runner
+from app.utils.filtering import FilterError
+
+configure_logging()
 
 app = FastAPI(title="ReqRoute API", version="1.0")
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+app.add_middleware(TimingMiddleware)
 
 @app.exception_handler(AuthXException)
 async def authx_exception_handler(request, exc: AuthXException):
@@ -11,6 +26,14 @@ async def authx_exception_handler(request, exc: AuthXException):
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Authentication required"
     )
+
+@app.exception_handler(FilterError)
+async def filter_exception_handler(request, exc: FilterError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Auth"])
 app.include_router(cases.router, prefix="/api/v1/cases", tags=["Cases"])
 app.include_router(terms.router, prefix="/api/v1/terms", tags=["Terms"])
@@ -21,8 +44,23 @@ app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
 app.include_router(meetings.router, prefix="/api/v1/meetings", tags=["Meetings"])
 app.include_router(assignments.router, prefix="/api/v1/assignments", tags=["Assignments"])
 app.include_router(checkpoints.router, prefix="/api/v1/checkpoints", tags=["Checkpoints"])
+app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["Jobs"])
+app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 
 @app.on_event("startup")
 async def on_startup():
-    await init_db()
+    if settings.DB_CREATE_ON_STARTUP:
+        await init_db()
+    await job_runner.start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await job_runner.stop()
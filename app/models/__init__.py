@@ -7,4 +7,6 @@ from .meeting import MeetingUser, Meeting
 from .meeting_schedule import MeetingSchedule
 from .assignment import Assignment
 from .checkpoint import Checkpoint
-from .user import User
\ No newline at end of file
+from .user import User
+from .job import Job
+from .team_grade import TeamGrade
\ No newline at end of file
@@ -1,13 +1,22 @@
 from app.db.session import Base
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, column, false
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 
 
 class Assignment(Base):
     __tablename__ = "assignments"
+    __table_args__ = (
+        Index(
+            "ix_assignments_open_meeting_id",
+            "meeting_id",
+            postgresql_where=column("completed").isnot(True),
+            sqlite_where=column("completed").isnot(True),
+        ),
+    )
 
-    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id"))
+    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id", ondelete="CASCADE"), index=True)
     text: Mapped[str]
     completed: Mapped[bool | None]
+    archived: Mapped[bool] = mapped_column(default=False, server_default=false(), index=True)
 
     meeting = relationship("Meeting", back_populates="assignments")
\ No newline at end of file
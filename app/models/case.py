@@ -12,7 +12,7 @@ class CaseStatus(str, enum.Enum):
 class Case(Base):
     __tablename__ = "cases"
 
-    term_id: Mapped[int] = mapped_column(ForeignKey("terms.id"))
+    term_id: Mapped[int] = mapped_column(ForeignKey("terms.id"), index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     title: Mapped[str]
     description: Mapped[str | None]
@@ -20,4 +20,4 @@ class Case(Base):
 
     term = relationship("Term", back_populates="cases")
     user = relationship("User", back_populates="cases")
-    teams = relationship("Team", back_populates="case")
+    teams = relationship("Team", back_populates="case", cascade="all, delete-orphan", passive_deletes=True)
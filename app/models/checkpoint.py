@@ -1,14 +1,14 @@
 import datetime
 
 from app.db.session import Base
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, false
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 
 
 class Checkpoint(Base):
     __tablename__ = "checkpoints"
 
-    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"))
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"), index=True)
     number: Mapped[int]
     date: Mapped[datetime.date | None]
     project_state: Mapped[str | None]
@@ -17,5 +17,6 @@ class Checkpoint(Base):
     presentation_link: Mapped[str | None]
     university_mark: Mapped[int | None]
     university_comment: Mapped[str | None]
+    archived: Mapped[bool] = mapped_column(default=False, server_default=false(), index=True)
 
     team = relationship("Team", back_populates="checkpoints")
\ No newline at end of file
@@ -1,28 +1,35 @@
 from app.db.session import Base
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        Index("ix_meetings_team_id_date_time", "team_id", "date_time"),
+    )
 
-    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"))
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"))
     previous_meeting_id: Mapped[int | None] = mapped_column(ForeignKey("meetings.id", ondelete="SET NULL"))
-    schedule_id: Mapped[int | None] = mapped_column(ForeignKey("meeting_schedules.id"))
+    schedule_id: Mapped[int | None] = mapped_column(ForeignKey("meeting_schedules.id", ondelete="SET NULL"))
     recording_link: Mapped[str | None]
-    date_time: Mapped[datetime]
+    date_time: Mapped[datetime] = mapped_column(index=True)
     summary: Mapped[str | None]
+    archived: Mapped[bool] = mapped_column(default=False, server_default=false(), index=True)
 
-    users = relationship("MeetingUser", back_populates="meeting")
-    assignments = relationship("Assignment", back_populates="meeting")
+    users = relationship("MeetingUser", back_populates="meeting", cascade="all, delete-orphan", passive_deletes=True)
+    assignments = relationship("Assignment", back_populates="meeting", cascade="all, delete-orphan", passive_deletes=True)
     team = relationship("Team", back_populates="meetings")
     schedule = relationship("MeetingSchedule", back_populates="meetings")
 
 class MeetingUser(Base):
     __tablename__ = "meeting_users"
+    __table_args__ = (
+        Index("ux_meeting_users_meeting_id_user_id", "meeting_id", "user_id", unique=True),
+    )
 
-    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id"))
+    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id", ondelete="CASCADE"))
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
 
     meeting = relationship("Meeting", back_populates="users")
@@ -7,7 +7,7 @@ from datetime import date, time
 class MeetingSchedule(Base):
     __tablename__ = "meeting_schedules"
 
-    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"))
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"), index=True)
     start_date: Mapped[date]
     day_of_week: Mapped[int]
     time: Mapped[time]
@@ -15,5 +15,5 @@ class MeetingSchedule(Base):
     active: Mapped[bool] = mapped_column(default=True)
 
     team = relationship("Team", back_populates="meeting_schedules")
-    meetings = relationship("Meeting", back_populates="schedule")
+    meetings = relationship("Meeting", back_populates="schedule", passive_deletes=True)
 
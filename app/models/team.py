@@ -7,12 +7,13 @@ class Team(Base):
     __tablename__ = "teams"
 
     title: Mapped[str]
-    case_id: Mapped[int] = mapped_column(ForeignKey("cases.id"))
+    case_id: Mapped[int] = mapped_column(ForeignKey("cases.id", ondelete="CASCADE"), index=True)
     workspace_link: Mapped[str | None]
     final_mark: Mapped[int] = mapped_column(default=0)
 
-    team_memberships = relationship("TeamMembership", back_populates="team")
-    checkpoints = relationship("Checkpoint", back_populates="team")
+    team_memberships = relationship("TeamMembership", back_populates="team", cascade="all, delete-orphan", passive_deletes=True)
+    checkpoints = relationship("Checkpoint", back_populates="team", cascade="all, delete-orphan", passive_deletes=True)
     case = relationship("Case", back_populates="teams")
-    meetings = relationship("Meeting", back_populates="team")
-    meeting_schedules = relationship("MeetingSchedule", back_populates="team")
\ No newline at end of file
+    meetings = relationship("Meeting", back_populates="team", cascade="all, delete-orphan", passive_deletes=True)
+    meeting_schedules = relationship("MeetingSchedule", back_populates="team", cascade="all, delete-orphan", passive_deletes=True)
+    grade = relationship("TeamGrade", back_populates="team", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
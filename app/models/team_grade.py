@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from app.db.session import Base
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import relationship, mapped_column, Mapped
+
+
+class TeamGrade(Base):
+    __tablename__ = "team_grades"
+
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"), unique=True)
+    checkpoint_count: Mapped[int] = mapped_column(default=0)
+    mark_sum: Mapped[int] = mapped_column(default=0)
+    university_mark_count: Mapped[int] = mapped_column(default=0)
+    university_mark_sum: Mapped[int] = mapped_column(default=0)
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.now, onupdate=datetime.now)
+
+    team = relationship("Team", back_populates="grade")
@@ -6,7 +6,7 @@ class TeamMembership(Base):
     __tablename__ = "team_memberships"
 
     student_id: Mapped[int] = mapped_column(ForeignKey("students.id"))
-    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"))
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id", ondelete="CASCADE"), index=True)
     role: Mapped[str | None]
     group: Mapped[str]
 
@@ -1,7 +1,7 @@
 from app.db.session import Base
 import enum
 from datetime import date
-from sqlalchemy import Enum
+from sqlalchemy import Enum, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -16,5 +16,6 @@ class Term(Base):
     end_date: Mapped[date | None]
     year: Mapped[int]
     season: Mapped[SeasonEnum] = mapped_column(Enum(SeasonEnum), nullable=False)
+    archived: Mapped[bool] = mapped_column(default=False, server_default=false(), index=True)
 
     cases = relationship("Case", back_populates="term")
@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AssignmentBase(BaseModel):
@@ -14,6 +14,16 @@ class AssignmentUpdate(BaseModel):
     completed: Optional[bool] = None
     text: Optional[str] = None
 
+class AssignmentBulkUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=1000)
+    completed: bool = True
+
+class AssignmentCarryOverRead(BaseModel):
+    mode: Literal["copy", "move"]
+    carried: int
+    source_meeting_id: Optional[int] = None
+    target_meeting_id: Optional[int] = None
+
 class AssignmentRead(AssignmentBase):
     id: int
 
@@ -0,0 +1,19 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class TeamGradeRead(BaseModel):
+    team_id: int
+    team_title: str
+    case_id: int
+    case_title: str
+    checkpoints: int
+    mark_sum: int
+    mark_avg: Optional[float] = None
+    university_mark_sum: int
+    university_mark_avg: Optional[float] = None
+    final_mark: Optional[int] = None
+    rank: int
+    case_rank: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,19 @@
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from app.models.job import JobStatus
+
+class JobRead(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    progress: int
+    total: Optional[int] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
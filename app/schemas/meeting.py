@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
-from datetime import datetime
+from datetime import date, datetime
 
 class MeetingBase(BaseModel):
     team_id: int
@@ -20,4 +20,21 @@ class MeetingUpdate(BaseModel):
 class MeetingRead(MeetingBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class MeetingOccurrenceRead(MeetingRead):
+    id: Optional[int] = None
+    schedule_id: Optional[int] = None
+    virtual: bool = False
+
+class MeetingOccurrenceMaterialize(BaseModel):
+    date_time: datetime
+    summary: Optional[str] = None
+    recording_link: Optional[str] = None
+
+class MeetingCalendarItem(MeetingOccurrenceRead):
+    team_title: str
+
+class MeetingCalendarDay(BaseModel):
+    date: date
+    meetings: List[MeetingCalendarItem]
\ No newline at end of file
@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MeetingUserBase(BaseModel):
@@ -16,4 +16,13 @@ class MeetingUserUpdate(BaseModel):
 class MeetingUserRead(MeetingUserBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class MeetingAttendeesUpdate(BaseModel):
+    user_ids: list[int] = Field(max_length=1000)
+
+class MeetingAttendeesRead(BaseModel):
+    meeting_id: int
+    user_ids: list[int]
+    added: int
+    removed: int
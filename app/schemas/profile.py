@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+
+class ProfileRead(BaseModel):
+    id: int
+    method: str
+    path: str
+    route: str
+    duration_ms: float
+    recorded_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
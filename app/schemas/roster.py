@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class RosterIssue(BaseModel):
+    line: int
+    kind: str
+    detail: str
+
+class RosterImportRead(BaseModel):
+    dry_run: bool
+    applied: bool
+    rows: int
+    students_created: int
+    students_matched: int
+    memberships_created: int
+    memberships_skipped: int
+    errors: list[RosterIssue]
+    warnings: list[RosterIssue]
+    truncated_issues: int = 0
@@ -0,0 +1,11 @@
+from typing import Optional
+from pydantic import BaseModel
+from datetime import datetime
+
+class SlowQueryRead(BaseModel):
+    recorded_at: datetime
+    duration_ms: float
+    route: Optional[str] = None
+    statement: str
+    parameters: Optional[str] = None
+    plan: Optional[str] = None
@@ -20,4 +20,8 @@ class TeamUpdate(BaseModel):
 class TeamRead(TeamBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+class TeamFeedRead(BaseModel):
+    team_id: int
+    token: str
+    url: str
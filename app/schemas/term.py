@@ -17,8 +17,37 @@ class TermUpdate(TermBase):
     end_date: Optional[date] = None
     year: Optional[int] = None
     season: Optional[SeasonEnum] = None
+    archived: Optional[bool] = None
 
 class TermRead(TermBase):
     id: int
+    archived: bool = False
 
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class TermStatsRead(BaseModel):
+    term_id: int
+    cases: int
+    cases_by_status: dict[str, int]
+    teams: int
+    students: int
+    meetings_scheduled: int
+    meetings_held: int
+    assignments_completed: int
+    assignments_open: int
+
+class TermClone(TermCreate):
+    include_teams: bool = True
+    include_schedules: bool = True
+
+class TermCloneRead(BaseModel):
+    source_term_id: int
+    term: TermRead
+    cases: int
+    teams: int
+    schedules: int
+    meetings: int
+
+class TermArchiveRead(BaseModel):
+    archived: int
+    term_ids: list[int]
@@ -1,19 +1,42 @@
+from datetime import datetime
+from typing import Literal
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, func, insert, literal, select, update
+from sqlalchemy.orm import aliased
 from app.utils.filtering import  filter_and_paginate
+from app.db.archive import meeting_archived
 from app.models.assignment import Assignment
+from app.models.case import Case
+from app.models.meeting import Meeting
+from app.models.team import Team
+
+from app.schemas.assignment import AssignmentBulkUpdate, AssignmentCreate, AssignmentUpdate
 
-from app.schemas.assignment import AssignmentCreate, AssignmentUpdate
+CarryOverMode = Literal["copy", "move"]
 
 async def get_assignments_filtered(db: AsyncSession, params: dict):
     return await filter_and_paginate(Assignment, db, params)
 
+async def get_team_assignments(db: AsyncSession, team_id: int, params: dict, completed: bool | None = None):
+    stmt = select(Assignment).join(Meeting, Assignment.meeting_id == Meeting.id).where(Meeting.team_id == team_id)
+    if completed is not None:
+        # Open items are matched with IS NOT TRUE so that NULL counts as open
+        # and the partial index on open assignments can be used.
+        stmt = stmt.where(Assignment.completed.is_(True) if completed else Assignment.completed.isnot(True))
+    if 'sort' not in params:
+        stmt = stmt.order_by(Meeting.date_time, Assignment.id)
+    page = await filter_and_paginate(Assignment, db, {'include_archived': 'true', **params}, stmt)
+    if not page['total'] and await db.scalar(select(Team.id).where(Team.id == team_id)) is None:
+        return None
+    return page
+
 async def get_assignment(db: AsyncSession, assignment_id: int):
     result = await db.execute(select(Assignment).where(Assignment.id == assignment_id))
     return result.scalar_one_or_none()
 
 async def create_assignment(db: AsyncSession, data: AssignmentCreate):
-    new_assignment = Assignment(**data.model_dump())
+    new_assignment = Assignment(**data.model_dump(), archived=meeting_archived(data.meeting_id))
     db.add(new_assignment)
     await db.commit()
     await db.refresh(new_assignment)
@@ -35,4 +58,108 @@ async def delete_assignment(db: AsyncSession, assignment_id: int):
         return None
     await db.delete(assignment)
     await db.commit()
-    return assignment
\ No newline at end of file
+    return assignment
+
+async def complete_assignments(db: AsyncSession, data: AssignmentBulkUpdate):
+    ids = set(data.ids)
+    result = await db.execute(
+        update(Assignment)
+        .where(Assignment.id.in_(ids))
+        .values(completed=data.completed)
+        .returning(Assignment)
+        .execution_options(synchronize_session=False)
+    )
+    updated = result.scalars().all()
+    missing = ids - {assignment.id for assignment in updated}
+    if missing:
+        await db.rollback()
+        raise ValueError(f"Assignments not found: {', '.join(map(str, sorted(missing)))}")
+    await db.commit()
+    return sorted(updated, key=lambda assignment: assignment.id)
+
+def _is_open(assignment=Assignment):
+    return assignment.completed.isnot(True)
+
+async def _get_next_meeting(db: AsyncSession, meeting: Meeting) -> Meeting | None:
+    linked = await db.execute(
+        select(Meeting)
+        .where(Meeting.previous_meeting_id == meeting.id)
+        .order_by(Meeting.date_time, Meeting.id)
+        .limit(1)
+    )
+    next_meeting = linked.scalar_one_or_none()
+    if next_meeting is not None:
+        return next_meeting
+    upcoming = await db.execute(
+        select(Meeting)
+        .where(Meeting.team_id == meeting.team_id, Meeting.date_time > meeting.date_time)
+        .order_by(Meeting.date_time, Meeting.id)
+        .limit(1)
+    )
+    return upcoming.scalar_one_or_none()
+
+def _copy_open_assignments(sources, source_id, target_id):
+    existing = aliased(Assignment)
+    return insert(Assignment).from_select(
+        ["meeting_id", "text", "completed", "archived"],
+        select(target_id, Assignment.text, Assignment.completed, Assignment.archived)
+        .select_from(sources)
+        .join(Assignment, Assignment.meeting_id == source_id)
+        .where(_is_open())
+        .where(~exists().where(existing.meeting_id == target_id, existing.text == Assignment.text))
+        .order_by(Assignment.id),
+    )
+
+async def carry_over_assignments(
+    db: AsyncSession, meeting_id: int, mode: CarryOverMode = "copy", target_meeting_id: int | None = None
+):
+    source = await db.scalar(select(Meeting).where(Meeting.id == meeting_id))
+    if not source:
+        return None
+    if target_meeting_id is None:
+        target = await _get_next_meeting(db, source)
+        if target is None:
+            raise ValueError(f"Meeting {meeting_id} has no next meeting")
+    else:
+        target = await db.scalar(select(Meeting).where(Meeting.id == target_meeting_id))
+        if target is None or target.team_id != source.team_id or target.id == source.id:
+            raise ValueError(f"Meeting {target_meeting_id} is not another meeting of the same team")
+
+    if mode == "move":
+        stmt = (
+            update(Assignment)
+            .where(Assignment.meeting_id == source.id, _is_open())
+            .values(meeting_id=target.id)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        sources = select(literal(source.id).label("source_id"), literal(target.id).label("target_id")).subquery()
+        stmt = _copy_open_assignments(sources, sources.c.source_id, sources.c.target_id)
+    result = await db.execute(stmt)
+    await db.commit()
+    return {"mode": mode, "carried": result.rowcount, "source_meeting_id": source.id, "target_meeting_id": target.id}
+
+async def carry_over_term_assignments(db: AsyncSession, term_id: int, mode: CarryOverMode = "copy", now: datetime | None = None):
+    now = now or datetime.now()
+    successor = aliased(Meeting)
+    pairs = (
+        select(Meeting.id.label("source_id"), func.min(successor.id).label("target_id"))
+        .join(successor, successor.previous_meeting_id == Meeting.id)
+        .join(Team, Meeting.team_id == Team.id)
+        .join(Case, Team.case_id == Case.id)
+        .where(Case.term_id == term_id, Meeting.date_time <= now, successor.date_time > now)
+        .group_by(Meeting.id)
+        .subquery()
+    )
+    if mode == "move":
+        stmt = (
+            update(Assignment)
+            .where(Assignment.meeting_id.in_(select(pairs.c.source_id)), _is_open())
+            .values(meeting_id=select(pairs.c.target_id).where(pairs.c.source_id == Assignment.meeting_id).scalar_subquery())
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = _copy_open_assignments(pairs, pairs.c.source_id, pairs.c.target_id)
+    result = await db.execute(stmt)
+    await db.commit()
+    return {"mode": mode, "carried": result.rowcount}
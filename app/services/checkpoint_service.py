@@ -1,11 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.db.archive import team_archived
 from app.models.checkpoint import Checkpoint
 
 from app.schemas.checkpoint import CheckpointCreate, CheckpointUpdate
+from app.services.grade_service import refresh_team_grade
 from app.utils.filtering import filter_and_paginate
 
+GRADED_FIELDS = {"mark", "university_mark"}
+
 
 async def get_checkpoints_filtered(db: AsyncSession, params: dict):
     return await filter_and_paginate(Checkpoint, db, params)
@@ -15,8 +19,10 @@ async def get_checkpoint(db: AsyncSession, checkpoint_id: int):
     return result.scalar_one_or_none()
 
 async def create_checkpoint(db: AsyncSession, data: CheckpointCreate):
-    new_checkpoint = Checkpoint(**data.model_dump())
+    new_checkpoint = Checkpoint(**data.model_dump(), archived=team_archived(data.team_id))
     db.add(new_checkpoint)
+    await db.flush()
+    await refresh_team_grade(db, new_checkpoint.team_id)
     await db.commit()
     await db.refresh(new_checkpoint)
     return  new_checkpoint
@@ -25,8 +31,12 @@ async def update_checkpoint(db: AsyncSession, checkpoint_id: int, data: Checkpoi
     checkpoint = await get_checkpoint(db, checkpoint_id)
     if not checkpoint:
         return None
-    for key, value in data.model_dump(exclude_unset=True).items():
+    changes = data.model_dump(exclude_unset=True)
+    for key, value in changes.items():
         setattr(checkpoint, key, value)
+    if changes.keys() & GRADED_FIELDS:
+        await db.flush()
+        await refresh_team_grade(db, checkpoint.team_id)
     await db.commit()
     await db.refresh(checkpoint)
     return checkpoint
@@ -36,5 +46,7 @@ async def delete_checkpoint(db: AsyncSession, checkpoint_id: int):
     if not checkpoint:
         return None
     await db.delete(checkpoint)
+    await db.flush()
+    await refresh_team_grade(db, checkpoint.team_id)
     await db.commit()
     return checkpoint
\ No newline at end of file
@@ -0,0 +1,176 @@
+from datetime import datetime
+
+from sqlalchemy import Float, Integer, cast, delete, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.upsert import dialect_insert
+from app.models.case import Case
+from app.models.checkpoint import Checkpoint
+from app.models.team import Team
+from app.models.team_grade import TeamGrade
+from app.models.term import Term
+from app.services.job_service import Progress, enqueue_job, job_handler
+
+ROLLUP_FIELDS = ("checkpoint_count", "mark_sum", "university_mark_count", "university_mark_sum")
+
+
+def _rollup_columns(now: datetime):
+    return (
+        func.count(Checkpoint.id),
+        func.coalesce(func.sum(Checkpoint.mark), 0),
+        func.count(Checkpoint.university_mark),
+        func.coalesce(func.sum(Checkpoint.university_mark), 0),
+        literal(now),
+    )
+
+
+def final_mark_expression():
+    formula = settings.FINAL_MARK_FORMULA
+    if formula == "manual":
+        return None
+    mark, university_mark = TeamGrade.mark_sum, TeamGrade.university_mark_sum
+    if formula == "average":
+        mark = func.coalesce(cast(mark, Float) / func.nullif(TeamGrade.checkpoint_count, 0), 0)
+        university_mark = func.coalesce(
+            cast(university_mark, Float) / func.nullif(TeamGrade.university_mark_count, 0), 0
+        )
+    score = settings.FINAL_MARK_WEIGHT * mark + settings.FINAL_MARK_UNIVERSITY_WEIGHT * university_mark
+    return cast(func.round(score), Integer)
+
+
+def _final_mark_update(expression, teams):
+    return (
+        update(Team)
+        .where(Team.id.in_(teams))
+        .values(final_mark=func.coalesce(
+            select(expression).where(TeamGrade.team_id == Team.id).scalar_subquery(), 0
+        ))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _insert_target():
+    return [TeamGrade.team_id, *(getattr(TeamGrade, field) for field in ROLLUP_FIELDS), TeamGrade.updated_at]
+
+
+async def refresh_team_grade(db: AsyncSession, team_id: int):
+    # Locking the team serializes concurrent checkpoint writes to it, and
+    # the rollup is recomputed from the checkpoints rather than adjusted by a
+    # delta, so it always matches the rows committed before it. NO KEY UPDATE
+    # does not conflict with the key-share locks taken by checkpoint inserts.
+    await db.execute(select(Team.id).where(Team.id == team_id).with_for_update(key_share=True))
+    now = datetime.now()
+    stmt = dialect_insert(db, TeamGrade).from_select(
+        _insert_target(),
+        select(Checkpoint.team_id, *_rollup_columns(now))
+        .where(Checkpoint.team_id == team_id)
+        .group_by(Checkpoint.team_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TeamGrade.team_id],
+        set_={field: getattr(stmt.excluded, field) for field in (*ROLLUP_FIELDS, "updated_at")},
+    )
+    await db.execute(stmt)
+    await db.execute(
+        delete(TeamGrade)
+        .where(TeamGrade.team_id == team_id)
+        .where(~select(Checkpoint.id).where(Checkpoint.team_id == team_id).exists())
+    )
+    expression = final_mark_expression()
+    if expression is not None:
+        await db.execute(_final_mark_update(expression, [team_id]))
+
+
+def _term_teams(term_id: int | None):
+    teams = select(Team.id)
+    if term_id is not None:
+        teams = teams.join(Case, Team.case_id == Case.id).where(Case.term_id == term_id)
+    return teams
+
+
+async def rebuild_team_grades(db, term_id: int | None = None) -> int:
+    teams = _term_teams(term_id)
+    await db.execute(delete(TeamGrade).where(TeamGrade.team_id.in_(teams)))
+    result = await db.execute(
+        insert(TeamGrade).from_select(
+            _insert_target(),
+            select(Checkpoint.team_id, *_rollup_columns(datetime.now()))
+            .where(Checkpoint.team_id.in_(teams))
+            .group_by(Checkpoint.team_id),
+        )
+    )
+    return result.rowcount
+
+
+def _required_final_mark_expression():
+    expression = final_mark_expression()
+    if expression is None:
+        raise ValueError("Final marks are set manually (FINAL_MARK_FORMULA=manual)")
+    return expression
+
+
+async def recompute_final_marks(db, term_id: int | None = None) -> int:
+    expression = _required_final_mark_expression()
+    result = await db.execute(_final_mark_update(expression, _term_teams(term_id)))
+    return result.rowcount
+
+
+def _grades_query():
+    mark_sum = func.coalesce(TeamGrade.mark_sum, 0)
+    university_mark_sum = func.coalesce(TeamGrade.university_mark_sum, 0)
+    return (
+        select(
+            Team.id.label("team_id"),
+            Team.title.label("team_title"),
+            Case.id.label("case_id"),
+            Case.title.label("case_title"),
+            func.coalesce(TeamGrade.checkpoint_count, 0).label("checkpoints"),
+            mark_sum.label("mark_sum"),
+            (cast(TeamGrade.mark_sum, Float) / func.nullif(TeamGrade.checkpoint_count, 0)).label("mark_avg"),
+            university_mark_sum.label("university_mark_sum"),
+            (cast(TeamGrade.university_mark_sum, Float) / func.nullif(TeamGrade.university_mark_count, 0)).label("university_mark_avg"),
+            Team.final_mark,
+            func.rank().over(order_by=mark_sum.desc()).label("rank"),
+            func.rank().over(partition_by=Case.id, order_by=mark_sum.desc()).label("case_rank"),
+        )
+        .join(Case, Team.case_id == Case.id)
+        .outerjoin(TeamGrade, TeamGrade.team_id == Team.id)
+    )
+
+
+async def get_term_grades(db: AsyncSession, term_id: int):
+    if await db.scalar(select(Term.id).where(Term.id == term_id)) is None:
+        return None
+    result = await db.execute(
+        _grades_query().where(Case.term_id == term_id).order_by("rank", Case.id, Team.id)
+    )
+    return [dict(row._mapping) for row in result]
+
+
+async def get_case_leaderboard(db: AsyncSession, case_id: int):
+    if await db.scalar(select(Case.id).where(Case.id == case_id)) is None:
+        return None
+    result = await db.execute(_grades_query().where(Case.id == case_id).order_by("rank", Team.id))
+    return [dict(row._mapping) for row in result]
+
+
+@job_handler("team_grades.rebuild")
+async def _rebuild_team_grades_job(db: AsyncSession, payload: dict, progress: Progress) -> dict:
+    teams = await rebuild_team_grades(db, payload.get("term_id"))
+    if final_mark_expression() is not None:
+        await recompute_final_marks(db, payload.get("term_id"))
+    await db.commit()
+    return {"teams": teams}
+
+
+async def enqueue_final_mark_recompute(db: AsyncSession, term_id: int):
+    _required_final_mark_expression()
+    return await enqueue_job(db, "final_marks.recompute", {"term_id": term_id})
+
+
+@job_handler("final_marks.recompute")
+async def _recompute_final_marks_job(db: AsyncSession, payload: dict, progress: Progress) -> dict:
+    teams = await recompute_final_marks(db, payload.get("term_id"))
+    await db.commit()
+    return {"teams": teams}
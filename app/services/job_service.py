@@ -0,0 +1,209 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.job import Job, JobStatus
+from app.schemas.job import JobRead
+from app.utils.filtering import filter_and_paginate
+
+logger = logging.getLogger(__name__)
+
+Progress = Callable[[int, int], Awaitable[None]]
+JobHandler = Callable[[AsyncSession, dict, Progress], Awaitable[dict | None]]
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str):
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+    return register
+
+
+async def get_jobs_filtered(db: AsyncSession, params: dict):
+    return await filter_and_paginate(Job, db, params)
+
+async def get_job(db: AsyncSession, job_id: int):
+    result = await db.execute(select(Job).where(Job.id == job_id))
+    return result.scalar_one_or_none()
+
+async def get_job_status(db: AsyncSession, job_id: int) -> JobRead | None:
+    job = await get_job(db, job_id)
+    return JobRead.model_validate(job) if job else None
+
+async def enqueue_job(db: AsyncSession, kind: str, payload: dict) -> Job:
+    if kind not in _handlers:
+        raise ValueError(f"Unknown job kind '{kind}'")
+    job = Job(kind=kind, payload=payload, status=JobStatus.pending, progress=0)
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    job_runner.submit(job.id)
+    return job
+
+
+def _stale(now: datetime):
+    stale = now - timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    return and_(Job.status == JobStatus.running, func.coalesce(Job.heartbeat_at, Job.started_at) < stale)
+
+
+def _claimable(now: datetime):
+    # A running job whose worker stopped renewing its lease (crash, redeploy)
+    # is treated like a pending one and may be claimed again, up to
+    # JOB_MAX_ATTEMPTS claims in total.
+    return or_(
+        Job.status == JobStatus.pending,
+        and_(_stale(now), Job.attempts < settings.JOB_MAX_ATTEMPTS),
+    )
+
+
+async def _report(job_id: int, state: dict):
+    # Progress and the lease are written from a separate session so any worker
+    # can serve the job status, without blocking the handler's transaction.
+    interval = min(settings.JOB_PROGRESS_INTERVAL, settings.JOB_LEASE_SECONDS / 3)
+    loop_time = asyncio.get_running_loop().time
+    written, renewed = (0, None), loop_time()
+    while True:
+        await asyncio.sleep(interval)
+        current = (state["progress"], state["total"])
+        if current == written and loop_time() - renewed < settings.JOB_LEASE_SECONDS / 3:
+            continue
+        try:
+            async with SessionLocal() as db:
+                await db.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.status == JobStatus.running)
+                    .values(heartbeat_at=datetime.now(), progress=current[0], total=current[1])
+                )
+                await db.commit()
+        except SQLAlchemyError:
+            logger.warning("Could not report progress of job %s", job_id, exc_info=True)
+        else:
+            written, renewed = current, loop_time()
+
+
+async def _finish_job(job_id: int, **values):
+    async with SessionLocal() as db:
+        await db.execute(
+            update(Job).where(Job.id == job_id).values(finished_at=datetime.now(), **values)
+        )
+        await db.commit()
+
+
+async def run_job(job_id: int):
+    async with SessionLocal() as db:
+        now = datetime.now()
+        claimed = await db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .where(_claimable(now))
+            .values(status=JobStatus.running, started_at=now, heartbeat_at=now, error=None, attempts=Job.attempts + 1)
+        )
+        await db.commit()
+        if claimed.rowcount != 1:
+            return
+        job = await get_job(db, job_id)
+        # A rollback expires the job, so keep what the error path needs.
+        kind, payload = job.kind, job.payload
+        handler = _handlers.get(kind)
+
+        state = {"progress": 0, "total": None}
+
+        async def progress(done: int, total: int):
+            state.update(progress=done, total=total)
+
+        reporter = asyncio.create_task(_report(job_id, state))
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job kind '{kind}'")
+            result = await handler(db, payload, progress)
+        except Exception as e:
+            await db.rollback()
+            if not isinstance(e, ValueError):
+                logger.exception("Job %s (%s) failed", job_id, kind)
+            error = str(e) or type(e).__name__
+        else:
+            error = None
+        finally:
+            reporter.cancel()
+
+    if error is None:
+        await _finish_job(job_id, status=JobStatus.done, result=result, **state)
+    else:
+        await _finish_job(job_id, status=JobStatus.failed, error=error, **state)
+
+
+class JobRunner:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._queue: asyncio.Queue[int] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def submit(self, job_id: int):
+        if self._queue is not None:
+            self._queue.put_nowait(job_id)
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        await self.requeue()
+        self._tasks.append(asyncio.create_task(self._reclaim()))
+
+    async def requeue(self, min_age: float = 0):
+        # Jobs another worker enqueued but never ran, or whose lease expired.
+        # The conditional claim in run_job keeps each job to a single runner.
+        now = datetime.now()
+        async with SessionLocal() as db:
+            exhausted = await db.execute(
+                update(Job)
+                .where(_stale(now), Job.attempts >= settings.JOB_MAX_ATTEMPTS)
+                .values(status=JobStatus.failed, finished_at=now, error="Lease expired after the last attempt")
+                .returning(Job.id)
+            )
+            for job_id in exhausted.scalars().all():
+                logger.warning("Job %s failed: lease expired after %s attempts", job_id, settings.JOB_MAX_ATTEMPTS)
+            await db.commit()
+            result = await db.execute(
+                select(Job.id)
+                .where(_claimable(now))
+                .where(Job.created_at <= now - timedelta(seconds=min_age))
+                .order_by(Job.id)
+            )
+            for job_id in result.scalars().all():
+                self.submit(job_id)
+
+    async def _reclaim(self):
+        while True:
+            await asyncio.sleep(settings.JOB_LEASE_SECONDS)
+            try:
+                await self.requeue(min_age=settings.JOB_LEASE_SECONDS)
+            except SQLAlchemyError:
+                logger.warning("Could not reclaim stale jobs", exc_info=True)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def _work(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await run_job(job_id)
+            except Exception:
+                logger.exception("Job runner failed to process job %s", job_id)
+            finally:
+                self._queue.task_done()
+
+
+job_runner = JobRunner(workers=settings.JOB_WORKERS)
@@ -1,19 +1,44 @@
+import hashlib
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from datetime import datetime, timedelta, date, time
+from sqlalchemy import delete, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime, timedelta, date, time, timezone
 from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
+from app.db.archive import team_archived
+from app.db.upsert import dialect_insert
 from app.models import Case
 from app.models.meeting import Meeting, MeetingUser
 from app.models.meeting_schedule import MeetingSchedule
 from app.models.team import Team
-from app.schemas.meeting import MeetingCreate, MeetingUpdate
-from app.schemas.meeting_user import MeetingUserCreate
+from app.models.term import Term
+from app.models.user import User
+from app.schemas.meeting import (
+    MeetingCreate,
+    MeetingUpdate,
+    MeetingCalendarItem,
+    MeetingCalendarDay,
+    MeetingOccurrenceRead,
+    MeetingOccurrenceMaterialize,
+)
+from app.schemas.meeting_user import MeetingAttendeesUpdate, MeetingUserCreate
 from app.schemas.meeting_schedule import (
     MeetingScheduleCreate,
     MeetingScheduleUpdate,
 )
+from app.services.job_service import Progress, job_handler
+from app.utils.cache import ResponseCache
 from app.utils.filtering import filter_and_paginate
+from app.utils.ics import WEEKDAYS, escape_text, format_date, format_datetime, render_calendar
+
+MEETING_INSERT_BATCH_SIZE = 500
+
+team_feed_cache = ResponseCache(
+    ttl=settings.ICS_CACHE_TTL,
+    depends_on=("meetings", "meeting_schedules", "teams", "cases", "terms"),
+)
 
 
 async def get_meetings_filtered(db: AsyncSession, params: dict):
@@ -27,15 +52,245 @@ async def get_meeting(db: AsyncSession, meeting_id: int):
     result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
     return result.scalar_one_or_none()
 
+def _validate_range(date_from: date, date_to: date):
+    if date_to < date_from:
+        raise ValueError("'to' must not be earlier than 'from'")
+    if (date_to - date_from).days + 1 > settings.CALENDAR_MAX_DAYS:
+        raise ValueError(f"Calendar range must not exceed {settings.CALENDAR_MAX_DAYS} days")
+    return (
+        datetime.combine(date_from, time.min),
+        datetime.combine(date_to + timedelta(days=1), time.min),
+    )
+
+
+def _virtual_occurrences(schedule: MeetingSchedule, end_date: date, start: datetime, end: datetime, taken: set):
+    for occurrence in _schedule_occurrences(schedule, min(end_date, end.date())):
+        if start <= occurrence < end and (schedule.id, occurrence) not in taken:
+            yield occurrence
+
+
+def _virtual_meeting(schedule: MeetingSchedule, occurrence: datetime) -> dict:
+    return {
+        "id": None,
+        "team_id": schedule.team_id,
+        "schedule_id": schedule.id,
+        "previous_meeting_id": None,
+        "recording_link": None,
+        "date_time": occurrence,
+        "summary": None,
+        "virtual": True,
+    }
+
+
+async def get_meetings_calendar(
+    db: AsyncSession,
+    date_from: date,
+    date_to: date,
+    team_ids: list[int] | None = None,
+    case_id: int | None = None,
+    term_id: int | None = None,
+) -> list[MeetingCalendarDay]:
+    start, end = _validate_range(date_from, date_to)
+
+    stmt = (
+        select(Meeting, Team.title)
+        .join(Team, Meeting.team_id == Team.id)
+        .where(Meeting.date_time >= start)
+        .where(Meeting.date_time < end)
+        .order_by(Meeting.date_time, Meeting.id)
+    )
+    if team_ids:
+        stmt = stmt.where(Meeting.team_id.in_(team_ids))
+    if case_id is not None:
+        stmt = stmt.where(Team.case_id == case_id)
+    if term_id is not None:
+        stmt = stmt.join(Case, Team.case_id == Case.id).where(Case.term_id == term_id)
+
+    result = await db.execute(stmt)
+    items = [
+        MeetingCalendarItem(
+            **MeetingOccurrenceRead.model_validate(meeting).model_dump(),
+            team_title=team_title,
+        )
+        for meeting, team_title in result.all()
+    ]
+
+    if settings.LAZY_MEETINGS:
+        taken = {(item.schedule_id, item.date_time) for item in items}
+        schedules_stmt = (
+            select(MeetingSchedule, Team.title, Term.end_date)
+            .join(Team, MeetingSchedule.team_id == Team.id)
+            .join(Case, Team.case_id == Case.id)
+            .join(Term, Case.term_id == Term.id)
+            .where(MeetingSchedule.active == True)
+            .where(Term.end_date.is_not(None))
+        )
+        if team_ids:
+            schedules_stmt = schedules_stmt.where(MeetingSchedule.team_id.in_(team_ids))
+        if case_id is not None:
+            schedules_stmt = schedules_stmt.where(Team.case_id == case_id)
+        if term_id is not None:
+            schedules_stmt = schedules_stmt.where(Case.term_id == term_id)
+        schedules = await db.execute(schedules_stmt)
+        for schedule, team_title, end_date in schedules.all():
+            for occurrence in _virtual_occurrences(schedule, end_date, start, end, taken):
+                items.append(MeetingCalendarItem(**_virtual_meeting(schedule, occurrence), team_title=team_title))
+        items.sort(key=lambda item: (item.date_time, item.id is None, item.id or 0))
+
+    days: dict[date, list[MeetingCalendarItem]] = {}
+    for item in items:
+        days.setdefault(item.date_time.date(), []).append(item)
+    return [MeetingCalendarDay(date=day, meetings=day_items) for day, day_items in days.items()]
+
+
+async def _get_schedule_with_term(db: AsyncSession, schedule_id: int, lock: bool = False) -> MeetingSchedule | None:
+    stmt = (
+        select(MeetingSchedule)
+        .options(selectinload(MeetingSchedule.team).selectinload(Team.case).selectinload(Case.term))
+        .where(MeetingSchedule.id == schedule_id)
+    )
+    if lock:
+        # NO KEY UPDATE leaves the key-share locks of meeting inserts alone.
+        stmt = stmt.with_for_update(key_share=True)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+def _schedule_end_date(schedule: MeetingSchedule) -> date | None:
+    team = schedule.team
+    if team and team.case and team.case.term:
+        return team.case.term.end_date
+    return None
+
+
+async def get_schedule_occurrences(
+    db: AsyncSession, schedule_id: int, date_from: date, date_to: date
+) -> list[MeetingOccurrenceRead] | None:
+    start, end = _validate_range(date_from, date_to)
+    schedule = await _get_schedule_with_term(db, schedule_id)
+    if not schedule:
+        return None
+
+    result = await db.execute(
+        select(Meeting)
+        .where(Meeting.schedule_id == schedule_id)
+        .where(Meeting.date_time >= start)
+        .where(Meeting.date_time < end)
+        .order_by(Meeting.date_time, Meeting.id)
+    )
+    occurrences = [MeetingOccurrenceRead.model_validate(m) for m in result.scalars().all()]
+
+    end_date = _schedule_end_date(schedule)
+    if settings.LAZY_MEETINGS and schedule.active and end_date:
+        taken = {(schedule.id, item.date_time) for item in occurrences}
+        occurrences.extend(
+            MeetingOccurrenceRead(**_virtual_meeting(schedule, occurrence))
+            for occurrence in _virtual_occurrences(schedule, end_date, start, end, taken)
+        )
+        occurrences.sort(key=lambda item: (item.date_time, item.id is None, item.id or 0))
+    return occurrences
+
+
+async def materialize_schedule_occurrence(
+    db: AsyncSession, schedule_id: int, data: MeetingOccurrenceMaterialize
+) -> Meeting | None:
+    # The schedule lock serializes concurrent materializations of its
+    # occurrences, so the existence check below cannot race with an insert.
+    schedule = await _get_schedule_with_term(db, schedule_id, lock=True)
+    if not schedule:
+        return None
+    end_date = _schedule_end_date(schedule)
+    if not end_date or data.date_time not in set(_schedule_occurrences(schedule, end_date)):
+        raise ValueError(f"{data.date_time.isoformat()} is not an occurrence of schedule {schedule_id}")
+
+    existing = await db.execute(
+        select(Meeting)
+        .where(Meeting.schedule_id == schedule_id)
+        .where(Meeting.date_time == data.date_time)
+        .limit(1)
+    )
+    meeting = existing.scalar_one_or_none()
+    if meeting is None:
+        previous = await db.execute(
+            select(Meeting.id)
+            .where(Meeting.schedule_id == schedule_id)
+            .where(Meeting.date_time < data.date_time)
+            .order_by(Meeting.date_time.desc())
+            .limit(1)
+        )
+        following = await db.execute(
+            select(Meeting)
+            .where(Meeting.schedule_id == schedule_id)
+            .where(Meeting.date_time > data.date_time)
+            .order_by(Meeting.date_time)
+            .limit(1)
+        )
+        next_meeting = following.scalar_one_or_none()
+        meeting = Meeting(
+            team_id=schedule.team_id,
+            archived=schedule.team.case.term.archived,
+            schedule_id=schedule_id,
+            previous_meeting_id=previous.scalar_one_or_none(),
+            date_time=data.date_time,
+        )
+        db.add(meeting)
+        await db.flush()
+        if next_meeting is not None:
+            next_meeting.previous_meeting_id = meeting.id
+
+    for key, value in data.model_dump(exclude_unset=True, exclude={"date_time"}).items():
+        setattr(meeting, key, value)
+    await db.commit()
+    await db.refresh(meeting)
+    return meeting
+
 async def link_meeting_user(db: AsyncSession, data: MeetingUserCreate):
     new_link = MeetingUser(**data.model_dump())
     db.add(new_link)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        existing = await db.scalar(
+            select(MeetingUser).where(MeetingUser.meeting_id == data.meeting_id, MeetingUser.user_id == data.user_id)
+        )
+        if existing is None:
+            raise ValueError("Meeting or user not found")
+        return existing
     await db.refresh(new_link)
     return new_link
 
+async def set_meeting_attendees(db: AsyncSession, meeting_id: int, data: MeetingAttendeesUpdate):
+    if await db.scalar(select(Meeting.id).where(Meeting.id == meeting_id)) is None:
+        return None
+    user_ids = set(data.user_ids)
+    removed = await db.execute(
+        delete(MeetingUser).where(MeetingUser.meeting_id == meeting_id, MeetingUser.user_id.not_in(user_ids))
+    )
+    added = 0
+    if user_ids:
+        inserted = await db.execute(
+            dialect_insert(db, MeetingUser)
+            .from_select(
+                ["meeting_id", "user_id"],
+                select(literal(meeting_id), User.id).where(User.id.in_(user_ids)).order_by(User.id),
+            )
+            .on_conflict_do_nothing(index_elements=["meeting_id", "user_id"])
+        )
+        added = inserted.rowcount
+    attendees = await db.execute(
+        select(MeetingUser.user_id).where(MeetingUser.meeting_id == meeting_id).order_by(MeetingUser.user_id)
+    )
+    current = attendees.scalars().all()
+    missing = user_ids.difference(current)
+    if missing:
+        await db.rollback()
+        raise ValueError(f"Users not found: {', '.join(map(str, sorted(missing)))}")
+    await db.commit()
+    return {"meeting_id": meeting_id, "user_ids": current, "added": added, "removed": removed.rowcount}
+
 async def create_meeting(db: AsyncSession, data: MeetingCreate):
-    new_meeting = Meeting(**data.model_dump())
+    new_meeting = Meeting(**data.model_dump(), archived=team_archived(data.team_id))
     db.add(new_meeting)
     await db.commit()
     await db.refresh(new_meeting)
@@ -71,7 +326,14 @@ async def get_team_schedule(db: AsyncSession, team_id: int) -> MeetingSchedule |
     return result.scalar_one_or_none()
 
 
-async def create_meeting_schedule(db: AsyncSession, data: MeetingScheduleCreate) -> MeetingSchedule:
+async def get_meeting_schedule(db: AsyncSession, schedule_id: int) -> MeetingSchedule | None:
+    result = await db.execute(select(MeetingSchedule).where(MeetingSchedule.id == schedule_id))
+    return result.scalar_one_or_none()
+
+
+async def create_meeting_schedule(
+    db: AsyncSession, data: MeetingScheduleCreate, progress: Progress | None = None
+) -> MeetingSchedule:
     team_result = await db.execute(
         select(Team)
         .options(selectinload(Team.case).selectinload(Case.term))
@@ -100,23 +362,19 @@ async def create_meeting_schedule(db: AsyncSession, data: MeetingScheduleCreate)
     db.add(schedule)
     await db.flush()
 
-    meetings = _generate_meetings_from_schedule(
-        schedule, term.end_date, team_id=data.team_id
-    )
-
-    db.add_all(meetings)
-    await db.flush()
+    if settings.LAZY_MEETINGS:
+        await db.commit()
+        await db.refresh(schedule)
+        return schedule
 
-    for i in range(1, len(meetings)):
-        meetings[i].previous_meeting_id = meetings[i - 1].id
+    await insert_schedule_meetings(db, [schedule], term.end_date, archived=term.archived, progress=progress)
 
     await db.commit()
     await db.refresh(schedule)
     return schedule
 
 
-def _generate_meetings_from_schedule(schedule: MeetingSchedule, end_date: date, team_id: int) -> list[Meeting]:
-    meetings = []
+def _schedule_occurrences(schedule: MeetingSchedule, end_date: date):
     current_date = schedule.start_date
 
     days_ahead = schedule.day_of_week - current_date.weekday()
@@ -126,31 +384,47 @@ def _generate_meetings_from_schedule(schedule: MeetingSchedule, end_date: date,
     current_datetime = datetime.combine(first_meeting_date, schedule.time)
 
     while current_datetime.date() <= end_date:
-        meeting = Meeting(
-            team_id=team_id,
-            schedule_id=schedule.id,
-            previous_meeting_id=None,
-            date_time=current_datetime,
-            summary=None,
-            recording_link=None,
-        )
-        meetings.append(meeting)
-
+        yield current_datetime
         current_datetime += timedelta(weeks=schedule.interval_weeks)
 
-    for i in range(1, len(meetings)):
-        meetings[i].previous_meeting_id = None
-
-    return meetings
 
-
-async def update_meeting_schedule(db: AsyncSession, schedule_id: int, data: MeetingScheduleUpdate) -> MeetingSchedule | None:
-    schedule_result = await db.execute(
-        select(MeetingSchedule)
-        .options(selectinload(MeetingSchedule.team).selectinload(Team.case).selectinload(Case.term))
-        .where(MeetingSchedule.id == schedule_id)
-    )
-    schedule = schedule_result.scalar_one_or_none()
+async def insert_schedule_meetings(
+    db: AsyncSession,
+    schedules: list[MeetingSchedule],
+    end_date: date,
+    previous_ids: dict[int, int] | None = None,
+    after: datetime | None = None,
+    archived: bool = False,
+    progress: Progress | None = None,
+) -> int:
+    rows = [
+        {"team_id": schedule.team_id, "schedule_id": schedule.id, "date_time": occurrence, "archived": archived}
+        for schedule in schedules
+        for occurrence in _schedule_occurrences(schedule, end_date)
+        if after is None or occurrence > after
+    ]
+    previous_ids = dict(previous_ids or {})
+    total = len(rows)
+    for offset in range(0, total, MEETING_INSERT_BATCH_SIZE):
+        batch = rows[offset:offset + MEETING_INSERT_BATCH_SIZE]
+        result = await db.execute(insert(Meeting).returning(Meeting.id, sort_by_parameter_order=True), batch)
+        links = []
+        for row, meeting_id in zip(batch, result.scalars().all()):
+            previous_id = previous_ids.get(row["schedule_id"])
+            if previous_id is not None:
+                links.append({"id": meeting_id, "previous_meeting_id": previous_id})
+            previous_ids[row["schedule_id"]] = meeting_id
+        if links:
+            await db.execute(update(Meeting), links)
+        if progress:
+            await progress(offset + len(batch), total)
+    return total
+
+
+async def update_meeting_schedule(
+    db: AsyncSession, schedule_id: int, data: MeetingScheduleUpdate, progress: Progress | None = None
+) -> MeetingSchedule | None:
+    schedule = await _get_schedule_with_term(db, schedule_id)
     if not schedule:
         return None
 
@@ -158,81 +432,163 @@ async def update_meeting_schedule(db: AsyncSession, schedule_id: int, data: Meet
     if not update_data:
         return schedule
 
+    if settings.LAZY_MEETINGS:
+        for key, value in update_data.items():
+            setattr(schedule, key, value)
+        await db.commit()
+        await db.refresh(schedule)
+        return schedule
+
     now = datetime.now()
-    future_meetings_result = await db.execute(
-        select(Meeting)
+    # Attendees and assignments go with the meetings through ON DELETE CASCADE.
+    await db.execute(
+        delete(Meeting)
         .where(Meeting.schedule_id == schedule_id)
         .where(Meeting.date_time > now)
+        .execution_options(synchronize_session=False)
     )
-    for meeting in future_meetings_result.scalars():
-        await db.delete(meeting)
 
     for key, value in update_data.items():
         setattr(schedule, key, value)
 
     await db.flush()
 
-    if schedule.active:
-        team = schedule.team
-        if team.case and team.case.term and team.case.term.end_date:
-            start_date = (
-                update_data.get("start_date")
-                if "start_date" in update_data
-                else schedule.start_date
-            )
-            day_of_week = (
-                update_data.get("day_of_week")
-                if "day_of_week" in update_data
-                else schedule.day_of_week
-            )
-            meeting_time = (
-                update_data.get("time")
-                if "time" in update_data
-                else schedule.time
-            )
-            interval_weeks = (
-                update_data.get("interval_weeks")
-                if "interval_weeks" in update_data
-                else schedule.interval_weeks
-            )
-
-            temp_schedule = MeetingSchedule(
-                team_id=schedule.team_id,
-                start_date=start_date,
-                day_of_week=day_of_week,
-                time=meeting_time,
-                interval_weeks=interval_weeks,
-            )
-
-            effective_start = max(start_date, now.date())
-            meetings = _generate_meetings_from_schedule(
-                temp_schedule, team.case.term.end_date, team_id=schedule.team_id
-            )
-            future_meetings = [
-                m for m in meetings if m.date_time > now and m.date_time.date() >= effective_start
-            ]
-
-            for m in future_meetings:
-                m.schedule_id = schedule.id
-
-            db.add_all(future_meetings)
-            await db.flush()
-
-            if future_meetings:
-                last_existing = await db.execute(
-                    select(Meeting)
-                    .where(Meeting.schedule_id == schedule_id)
-                    .where(Meeting.date_time <= now)
-                    .order_by(Meeting.date_time.desc())
-                    .limit(1)
-                )
-                last_meeting = last_existing.scalar_one_or_none()
-
-                previous = last_meeting
-                for meeting in future_meetings:
-                    meeting.previous_meeting_id = previous.id if previous else None
-                    previous = meeting
+    end_date = _schedule_end_date(schedule)
+    if schedule.active and end_date and end_date >= now.date():
+        last_existing = (await db.execute(
+            select(Meeting.id)
+            .where(Meeting.schedule_id == schedule_id)
+            .where(Meeting.date_time <= now)
+            .order_by(Meeting.date_time.desc())
+            .limit(1)
+        )).scalar_one_or_none()
+        await insert_schedule_meetings(
+            db,
+            [schedule],
+            end_date,
+            previous_ids={schedule_id: last_existing} if last_existing is not None else None,
+            after=now,
+            archived=schedule.team.case.term.archived,
+            progress=progress,
+        )
 
     await db.commit()
     await db.refresh(schedule)
-    return schedule
\ No newline at end of file
+    return schedule
+
+
+@job_handler("meeting_schedule.create")
+async def _create_meeting_schedule_job(db: AsyncSession, payload: dict, progress: Progress) -> dict:
+    schedule = await create_meeting_schedule(db, MeetingScheduleCreate(**payload), progress)
+    return {"schedule_id": schedule.id}
+
+
+@job_handler("meeting_schedule.update")
+async def _update_meeting_schedule_job(db: AsyncSession, payload: dict, progress: Progress) -> dict:
+    schedule = await update_meeting_schedule(
+        db, payload["schedule_id"], MeetingScheduleUpdate(**payload["data"]), progress
+    )
+    if not schedule:
+        raise ValueError(f"Schedule {payload['schedule_id']} not found")
+    return {"schedule_id": schedule.id}
+
+
+def _meeting_event_lines(uid: str, stamp: str, title: str, meeting: Meeting) -> list[str]:
+    lines = [
+        f"UID:{uid}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{format_datetime(meeting.date_time)}",
+        f"DURATION:PT{settings.MEETING_DURATION_MINUTES}M",
+        f"SUMMARY:{escape_text(title)}",
+    ]
+    description = "\n".join(filter(None, [meeting.summary, meeting.recording_link]))
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    if meeting.recording_link:
+        lines.append(f"URL:{meeting.recording_link}")
+    return lines
+
+
+def _schedule_event_lines(
+    schedule: MeetingSchedule,
+    occurrences: list[datetime],
+    exdates: list[datetime],
+    end_date: date,
+    stamp: str,
+    title: str,
+) -> list[str]:
+    rule = (
+        f"RRULE:FREQ=WEEKLY;INTERVAL={schedule.interval_weeks};"
+        f"BYDAY={WEEKDAYS[schedule.day_of_week]};UNTIL={format_date(end_date)}T235959"
+    )
+    lines = [
+        f"UID:schedule-{schedule.id}@reqroute",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{format_datetime(occurrences[0])}",
+        f"DURATION:PT{settings.MEETING_DURATION_MINUTES}M",
+        f"SUMMARY:{escape_text(title)}",
+        rule,
+    ]
+    if exdates:
+        lines.append("EXDATE:" + ",".join(format_datetime(value) for value in exdates))
+    return lines
+
+
+async def get_team_meetings_feed(db: AsyncSession, team_id: int) -> tuple[str, str] | None:
+    cached = team_feed_cache.get(team_id)
+    if cached is not None:
+        return cached
+
+    team_result = await db.execute(
+        select(Team)
+        .options(selectinload(Team.case).selectinload(Case.term))
+        .where(Team.id == team_id)
+    )
+    team = team_result.scalar_one_or_none()
+    if not team:
+        return None
+
+    schedule = await get_team_schedule(db, team_id)
+    meetings_result = await db.execute(
+        select(Meeting)
+        .where(Meeting.team_id == team_id)
+        .order_by(Meeting.date_time, Meeting.id)
+    )
+    meetings = meetings_result.scalars().all()
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    title = f"{team.title} meeting"
+    end_date = team.case.term.end_date if team.case and team.case.term else None
+    events = []
+    standalone = list(meetings)
+
+    occurrences = list(_schedule_occurrences(schedule, end_date)) if schedule and end_date else []
+    if occurrences:
+        by_time = {m.date_time: m for m in meetings if m.schedule_id == schedule.id}
+        covered = set()
+        exdates = []
+        overrides = []
+        for occurrence in occurrences:
+            meeting = by_time.get(occurrence)
+            if meeting is None:
+                if not settings.LAZY_MEETINGS:
+                    exdates.append(occurrence)
+                continue
+            covered.add(meeting.id)
+            if meeting.summary or meeting.recording_link:
+                override = _meeting_event_lines(f"schedule-{schedule.id}@reqroute", stamp, title, meeting)
+                override.insert(2, f"RECURRENCE-ID:{format_datetime(occurrence)}")
+                overrides.append(override)
+        events.append(_schedule_event_lines(schedule, occurrences, exdates, end_date, stamp, title))
+        events.extend(overrides)
+        standalone = [m for m in meetings if m.id not in covered]
+
+    for meeting in standalone:
+        events.append(_meeting_event_lines(f"meeting-{meeting.id}@reqroute", stamp, title, meeting))
+
+    body = render_calendar(team.title, events)
+    fingerprint = "\n".join(line for line in body.splitlines() if not line.startswith("DTSTAMP:"))
+    etag = f'"{hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()}"'
+    feed = (etag, body)
+    team_feed_cache.set(team_id, feed)
+    return feed
\ No newline at end of file
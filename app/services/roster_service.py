@@ -0,0 +1,180 @@
+from collections import defaultdict
+from typing import AsyncIterable
+
+from sqlalchemy import insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.student import Student
+from app.models.team import Team
+from app.models.team_membership import TeamMembership
+from app.utils.csv_stream import iter_csv_dicts
+
+ROSTER_COLUMNS = ("full_name", "group", ("team_id", "team"))
+MAX_REPORTED_ISSUES = 200
+
+
+class _Report:
+    def __init__(self, dry_run: bool):
+        self.values = {
+            "dry_run": dry_run,
+            "applied": False,
+            "rows": 0,
+            "students_created": 0,
+            "students_matched": 0,
+            "memberships_created": 0,
+            "memberships_skipped": 0,
+            "errors": [],
+            "warnings": [],
+            "truncated_issues": 0,
+        }
+        self.has_errors = False
+
+    def _add(self, target: str, line: int, kind: str, detail: str):
+        issues = self.values[target]
+        if len(self.values["errors"]) + len(self.values["warnings"]) >= MAX_REPORTED_ISSUES:
+            self.values["truncated_issues"] += 1
+        else:
+            issues.append({"line": line, "kind": kind, "detail": detail})
+
+    def error(self, line: int, kind: str, detail: str):
+        self.has_errors = True
+        self._add("errors", line, kind, detail)
+
+    def warning(self, line: int, kind: str, detail: str):
+        self._add("warnings", line, kind, detail)
+
+
+def _chunks(items: list, size: int):
+    for offset in range(0, len(items), size):
+        yield items[offset:offset + size]
+
+
+async def _parse_rows(chunks: AsyncIterable[bytes], delimiter: str, report: _Report) -> list[dict]:
+    rows = []
+    async for line, values in iter_csv_dicts(chunks, ROSTER_COLUMNS, delimiter):
+        report.values["rows"] += 1
+        if report.values["rows"] > settings.ROSTER_IMPORT_MAX_ROWS:
+            raise ValueError(f"Roster must not exceed {settings.ROSTER_IMPORT_MAX_ROWS} rows")
+        full_name, group = values.get("full_name", ""), values.get("group", "")
+        team_id, team_title = values.get("team_id", ""), values.get("team", "")
+        if not full_name or not group or not (team_id or team_title):
+            report.error(line, "invalid_row", "full_name, group and team_id or team are required")
+            continue
+        if team_id:
+            try:
+                team_ref = int(team_id)
+            except ValueError:
+                report.error(line, "invalid_row", f"team_id must be an integer, got {team_id!r}")
+                continue
+        else:
+            team_ref = team_title
+        rows.append({
+            "line": line,
+            "full_name": full_name,
+            "group": group,
+            "role": values.get("role") or None,
+            "team_ref": team_ref,
+        })
+    return rows
+
+
+async def _resolve_teams(db: AsyncSession, rows: list[dict], case_id: int | None) -> dict:
+    ids = {row["team_ref"] for row in rows if isinstance(row["team_ref"], int)}
+    titles = {row["team_ref"] for row in rows if isinstance(row["team_ref"], str)}
+    if not ids and not titles:
+        return {}
+    stmt = select(Team.id, Team.title).where(or_(Team.id.in_(ids), Team.title.in_(titles)))
+    if case_id is not None:
+        stmt = stmt.where(Team.case_id == case_id)
+    teams = defaultdict(set)
+    for team_id, title in (await db.execute(stmt)).all():
+        teams[team_id].add(team_id)
+        teams[title].add(team_id)
+    return teams
+
+
+async def import_roster(
+    db: AsyncSession,
+    chunks: AsyncIterable[bytes],
+    dry_run: bool = False,
+    case_id: int | None = None,
+    delimiter: str = ",",
+) -> dict:
+    report = _Report(dry_run)
+    rows = await _parse_rows(chunks, delimiter, report)
+    teams = await _resolve_teams(db, rows, case_id)
+
+    existing = defaultdict(list)
+    names = {row["full_name"] for row in rows}
+    if names:
+        result = await db.execute(select(Student.id, Student.full_name).where(Student.full_name.in_(names)))
+        for student_id, full_name in result.all():
+            existing[full_name].append(student_id)
+
+    known_ids = [ids[0] for ids in existing.values() if len(ids) == 1]
+    memberships = set()
+    if known_ids:
+        result = await db.execute(
+            select(TeamMembership.student_id, TeamMembership.team_id).where(TeamMembership.student_id.in_(known_ids))
+        )
+        memberships = set(result.all())
+
+    new_names: dict[str, None] = {}
+    pending = []
+    seen = set()
+    matched = set()
+    for row in rows:
+        line, full_name = row["line"], row["full_name"]
+        team_ids = teams.get(row["team_ref"], set())
+        if not team_ids:
+            report.error(line, "unknown_team", f"Team {row['team_ref']!r} not found")
+            continue
+        if len(team_ids) > 1:
+            report.error(line, "ambiguous_team", f"Team {row['team_ref']!r} matches teams {sorted(team_ids)}")
+            continue
+        team_id = next(iter(team_ids))
+        student_ids = existing.get(full_name, [])
+        if len(student_ids) > 1:
+            report.error(line, "ambiguous_student", f"{full_name!r} matches students {sorted(student_ids)}")
+            continue
+        if (full_name, team_id) in seen:
+            report.warning(line, "duplicate_row", f"{full_name!r} is listed for team {team_id} more than once")
+            continue
+        seen.add((full_name, team_id))
+        if student_ids:
+            if full_name not in matched:
+                matched.add(full_name)
+                report.warning(line, "existing_student", f"{full_name!r} matches student {student_ids[0]}")
+            if (student_ids[0], team_id) in memberships:
+                report.values["memberships_skipped"] += 1
+                report.warning(line, "existing_membership", f"{full_name!r} is already in team {team_id}")
+                continue
+        else:
+            new_names[full_name] = None
+        pending.append({"full_name": full_name, "team_id": team_id, "group": row["group"], "role": row["role"]})
+
+    report.values["students_matched"] = len(matched)
+    report.values["students_created"] = len(new_names)
+    report.values["memberships_created"] = len(pending)
+    if dry_run or report.has_errors:
+        return report.values
+
+    student_ids = {name: ids[0] for name, ids in existing.items()}
+    for batch in _chunks(list(new_names), settings.ROSTER_IMPORT_BATCH_SIZE):
+        created = await db.execute(
+            insert(Student).returning(Student.id, Student.full_name, sort_by_parameter_order=True),
+            [{"full_name": name} for name in batch],
+        )
+        student_ids.update((full_name, student_id) for student_id, full_name in created.all())
+    for batch in _chunks(pending, settings.ROSTER_IMPORT_BATCH_SIZE):
+        await db.execute(
+            insert(TeamMembership),
+            [
+                {"student_id": student_ids[item["full_name"]], "team_id": item["team_id"], "group": item["group"], "role": item["role"]}
+                for item in batch
+            ],
+        )
+    await db.commit()
+    report.values["applied"] = True
+    return report.values
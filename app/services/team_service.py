@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.config import settings
+from app.db.archive import sync_archived
 from app.models.team import Team
 
 from app.schemas.team import TeamCreate, TeamUpdate
@@ -14,7 +16,12 @@ async def get_team(db: AsyncSession, team_id: int):
     result = await db.execute(select(Team).where(Team.id == team_id))
     return result.scalar_one_or_none()
 
+def _check_final_mark(data: TeamCreate | TeamUpdate):
+    if "final_mark" in data.model_fields_set and settings.FINAL_MARK_FORMULA != "manual":
+        raise ValueError(f"final_mark is computed from checkpoints (FINAL_MARK_FORMULA={settings.FINAL_MARK_FORMULA})")
+
 async def create_team(db: AsyncSession, data: TeamCreate):
+    _check_final_mark(data)
     new_team = Team(**data.model_dump())
     db.add(new_team)
     await db.commit()
@@ -22,11 +29,17 @@ async def create_team(db: AsyncSession, data: TeamCreate):
     return  new_team
 
 async def update_team(db: AsyncSession, team_id: int, data: TeamUpdate):
+    _check_final_mark(data)
     team = await get_team(db, team_id)
     if not team:
         return None
-    for key, value in data.model_dump(exclude_unset=True).items():
+    changes = data.model_dump(exclude_unset=True)
+    moved = "case_id" in changes and changes["case_id"] != team.case_id
+    for key, value in changes.items():
         setattr(team, key, value)
+    if moved:
+        await db.flush()
+        await sync_archived(db, [team_id])
     await db.commit()
     await db.refresh(team)
     return team
@@ -1,10 +1,27 @@
+from datetime import date, datetime, timedelta
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import distinct, func, insert, select, update
 
+from app.core.config import settings
+from app.db.archive import sync_archived, term_teams
+from app.models.assignment import Assignment
+from app.models.case import Case, CaseStatus
+from app.models.meeting import Meeting
+from app.models.meeting_schedule import MeetingSchedule
+from app.models.team import Team
+from app.models.team_membership import TeamMembership
 from app.models.term import Term
-from app.schemas.term import TermCreate, TermUpdate
+from app.schemas.term import TermClone, TermCreate, TermUpdate, TermStatsRead
+from app.services.meeting_service import insert_schedule_meetings
+from app.utils.cache import ResponseCache
 from app.utils.filtering import filter_and_paginate
 
+term_stats_cache = ResponseCache(
+    ttl=settings.TERM_STATS_CACHE_TTL,
+    depends_on=("terms", "cases", "teams", "team_memberships", "meetings", "assignments"),
+)
+
 
 async def get_terms_filtered(db: AsyncSession, params: dict):
     return await filter_and_paginate(Term, db, params)
@@ -24,8 +41,13 @@ async def update_term(db: AsyncSession, term_id: int, data: TermUpdate):
     term = await get_term(db, term_id)
     if not term:
         return None
-    for key, value in data.model_dump(exclude_unset=True).items():
+    changes = data.model_dump(exclude_unset=True)
+    archived_changed = "archived" in changes and changes["archived"] != term.archived
+    for key, value in changes.items():
         setattr(term, key, value)
+    if archived_changed:
+        await db.flush()
+        await sync_archived(db, term_teams([term_id]))
     await db.commit()
     await db.refresh(term)
     return term
@@ -36,4 +58,139 @@ async def delete_term(db: AsyncSession, term_id: int):
         return None
     await db.delete(term)
     await db.commit()
-    return term
\ No newline at end of file
+    return term
+
+
+async def archive_ended_terms(db: AsyncSession, today: date | None = None) -> list[int]:
+    cutoff = (today or date.today()) - timedelta(days=settings.TERM_ARCHIVE_AFTER_DAYS)
+    result = await db.execute(
+        update(Term)
+        .where(Term.archived == False, Term.end_date < cutoff)
+        .values(archived=True)
+        .returning(Term.id)
+    )
+    term_ids = sorted(result.scalars().all())
+    if term_ids:
+        await sync_archived(db, term_teams(term_ids))
+    await db.commit()
+    return term_ids
+
+
+async def get_term_stats(db: AsyncSession, term_id: int) -> TermStatsRead | None:
+    cached = term_stats_cache.get(term_id)
+    if cached is not None:
+        return cached
+    if not await get_term(db, term_id):
+        return None
+
+    cases_by_status = dict.fromkeys((status.value for status in CaseStatus), 0)
+    status_counts = await db.execute(
+        select(Case.status, func.count(Case.id)).where(Case.term_id == term_id).group_by(Case.status)
+    )
+    for status, count in status_counts.all():
+        cases_by_status[status.value] = count
+
+    teams = select(Team.id).join(Case, Team.case_id == Case.id).where(Case.term_id == term_id)
+    meetings = select(Meeting.id).where(Meeting.team_id.in_(teams))
+    assignments = select(func.count(Assignment.id)).where(Assignment.meeting_id.in_(meetings))
+    totals = (await db.execute(select(
+        select(func.count()).select_from(teams.subquery()).scalar_subquery().label("teams"),
+        select(func.count(distinct(TeamMembership.student_id)))
+        .where(TeamMembership.team_id.in_(teams)).scalar_subquery().label("students"),
+        select(func.count()).select_from(meetings.subquery()).scalar_subquery().label("meetings_scheduled"),
+        select(func.count(Meeting.id))
+        .where(Meeting.team_id.in_(teams), Meeting.date_time <= datetime.now()).scalar_subquery().label("meetings_held"),
+        assignments.where(Assignment.completed.is_(True)).scalar_subquery().label("assignments_completed"),
+        assignments.where(Assignment.completed.isnot(True)).scalar_subquery().label("assignments_open"),
+    ))).one()
+
+    stats = TermStatsRead(
+        term_id=term_id,
+        cases=sum(cases_by_status.values()),
+        cases_by_status=cases_by_status,
+        **totals._mapping,
+    )
+    term_stats_cache.set(term_id, stats)
+    return stats
+
+
+async def _insert_copies(db: AsyncSession, model, id_column, rows: list[dict]) -> dict[int, int]:
+    # insertmanyvalues keeps RETURNING in parameter order, so the new ids line
+    # up with the source rows without a natural key to join on.
+    if not rows:
+        return {}
+    sources = [row.pop("source_id") for row in rows]
+    result = await db.execute(insert(model).returning(id_column, sort_by_parameter_order=True), rows)
+    return dict(zip(sources, result.scalars().all()))
+
+
+async def clone_term(db: AsyncSession, term_id: int, data: TermClone) -> dict | None:
+    source = await get_term(db, term_id)
+    if not source:
+        return None
+    if data.include_schedules and not data.include_teams:
+        raise ValueError("Schedules can only be cloned together with teams")
+    if data.include_schedules and not (data.start_date and data.end_date):
+        raise ValueError("start_date and end_date are required to clone schedules")
+
+    term = Term(**data.model_dump(exclude={"include_teams", "include_schedules"}))
+    db.add(term)
+    await db.flush()
+
+    cases = await db.execute(
+        select(Case.id, Case.user_id, Case.title, Case.description).where(Case.term_id == term_id).order_by(Case.id)
+    )
+    case_ids = await _insert_copies(db, Case, Case.id, [
+        {"source_id": case_id, "term_id": term.id, "user_id": user_id, "title": title,
+         "description": description, "status": CaseStatus.draft}
+        for case_id, user_id, title, description in cases.all()
+    ])
+
+    team_ids = {}
+    if data.include_teams and case_ids:
+        teams = await db.execute(
+            select(Team.id, Team.case_id, Team.title).where(Team.case_id.in_(case_ids)).order_by(Team.id)
+        )
+        team_ids = await _insert_copies(db, Team, Team.id, [
+            {"source_id": team_id, "case_id": case_ids[case_id], "title": title, "final_mark": 0}
+            for team_id, case_id, title in teams.all()
+        ])
+
+    schedules = []
+    meetings = 0
+    if data.include_schedules and team_ids:
+        result = await db.execute(
+            select(MeetingSchedule)
+            .where(MeetingSchedule.team_id.in_(team_ids), MeetingSchedule.active == True)
+            .order_by(MeetingSchedule.id)
+        )
+        shift = data.start_date - source.start_date if source.start_date else None
+        rows = [
+            {
+                "source_id": schedule.id,
+                "team_id": team_ids[schedule.team_id],
+                "start_date": schedule.start_date + shift if shift is not None else data.start_date,
+                "day_of_week": schedule.day_of_week,
+                "time": schedule.time,
+                "interval_weeks": schedule.interval_weeks,
+                "active": True,
+            }
+            for schedule in result.scalars().all()
+        ]
+        schedule_ids = await _insert_copies(db, MeetingSchedule, MeetingSchedule.id, [dict(row) for row in rows])
+        schedules = [
+            MeetingSchedule(id=schedule_ids[row.pop("source_id")], **row) for row in rows
+        ]
+        if not settings.LAZY_MEETINGS:
+            meetings = await insert_schedule_meetings(db, schedules, data.end_date)
+
+    await db.commit()
+    await db.refresh(term)
+    return {
+        "source_term_id": term_id,
+        "term": term,
+        "cases": len(case_ids),
+        "teams": len(team_ids),
+        "schedules": len(schedules),
+        "meetings": meetings,
+    }
@@ -0,0 +1,108 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_PENDING_TABLES_KEY = "cache_pending_tables"
+
+_caches: list["ResponseCache"] = []
+
+
+class ResponseCache:
+    def __init__(self, ttl: float, depends_on: tuple[str, ...] = (), max_entries: int = 1024):
+        self.ttl = ttl
+        self.depends_on = frozenset(depends_on)
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        _caches.append(self)
+
+    def _live_entry(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key):
+        with self._lock:
+            entry = self._live_entry(key)
+            return entry[1] if entry else None
+
+    def variant(self, key, name, factory):
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry and name in entry[2]:
+                return entry[2][name]
+        value = factory()
+        with self._lock:
+            current = self._entries.get(key)
+            if entry is not None and current is entry:
+                entry[2][name] = value
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value, {})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+def invalidate_tables(tables) -> None:
+    tables = set(tables)
+    for cache in _caches:
+        if cache.depends_on & tables:
+            cache.invalidate()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [item.strip() for item in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _pending_tables(session: Session) -> set:
+    return session.info.setdefault(_PENDING_TABLES_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    pending = _pending_tables(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            pending.add(table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _pending_tables(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session):
+    pending = session.info.pop(_PENDING_TABLES_KEY, None)
+    if pending:
+        invalidate_tables(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tables(session):
+    session.info.pop(_PENDING_TABLES_KEY, None)
@@ -0,0 +1,50 @@
+import codecs
+import csv
+from typing import AsyncIterable, AsyncIterator
+
+
+async def iter_csv_lines(
+    chunks: AsyncIterable[bytes], delimiter: str = ",", encoding: str = "utf-8-sig"
+) -> AsyncIterator[tuple[int, list[str]]]:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    record: list[str] = []
+    line_no = start = 0
+
+    async def chunks_with_end():
+        async for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True) + "\n"
+
+    async for text in chunks_with_end():
+        pending += text
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_no += 1
+            if not record:
+                start = line_no
+            record.append(line.rstrip("\r") + "\n")
+            # A record ends once its quotes are balanced; quoted fields may
+            # span several physical lines.
+            if sum(part.count('"') for part in record) % 2 == 0:
+                fields = next(csv.reader(record, delimiter=delimiter), [])
+                record = []
+                if any(field.strip() for field in fields):
+                    yield start, fields
+    if record:
+        raise ValueError(f"Unterminated quoted field starting on line {start}")
+
+
+async def iter_csv_dicts(
+    chunks: AsyncIterable[bytes], required: tuple = (), delimiter: str = ",", encoding: str = "utf-8-sig"
+) -> AsyncIterator[tuple[int, dict[str, str]]]:
+    header = None
+    async for line_no, fields in iter_csv_lines(chunks, delimiter, encoding):
+        if header is None:
+            header = [name.strip().lower() for name in fields]
+            alternatives = [(name,) if isinstance(name, str) else name for name in required]
+            missing = [" or ".join(names) for names in alternatives if not set(names) & set(header)]
+            if missing:
+                raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+            continue
+        yield line_no, {name: value.strip() for name, value in zip(header, fields)}
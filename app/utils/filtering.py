@@ -1,37 +1,155 @@
-from sqlalchemy import asc, desc
+import logging
+from datetime import date, datetime, time
+
+from sqlalchemy import asc, desc, func
 from sqlalchemy.sql import Select
 from sqlalchemy import select
 
+from app.core.config import settings
+from app.db.archive import active_term_clause
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+clamped_page_size_requests = registry.counter(
+    "page_size_clamped_total", "List requests whose page_size was clamped.", ("table",)
+)
+
+
+class FilterError(ValueError):
+    pass
+
+
+_COMPARISONS = {
+    'gt': lambda column, value: column > value,
+    'gte': lambda column, value: column >= value,
+    'lt': lambda column, value: column < value,
+    'lte': lambda column, value: column <= value,
+}
+
+_TRUE_VALUES = {'true', '1', 'yes'}
+_FALSE_VALUES = {'false', '0', 'no'}
+
+
+def _get_column(model, field: str):
+    if field.startswith('_'):
+        return None
+    column = getattr(model, field, None)
+    if column is None or not hasattr(column, 'type'):
+        return None
+    return column
+
+
+def _parse_bool(key: str, value) -> bool:
+    if isinstance(value, bool):
+        return value
+    lowered = str(value).lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise FilterError(f"'{key}' must be a boolean")
+
+
+def _coerce(column, key: str, value):
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if isinstance(value, python_type):
+        return value
+    if python_type is bool:
+        return _parse_bool(key, value)
+    try:
+        if python_type in (datetime, date, time):
+            return python_type.fromisoformat(value)
+        return python_type(value)
+    except (TypeError, ValueError):
+        raise FilterError(f"Invalid value for '{key}': {value!r}")
+
+
+def _apply_sort(model, stmt: Select, value: str):
+    for item in value.split(','):
+        item = item.strip()
+        column = _get_column(model, item.lstrip('-'))
+        if column is not None:
+            stmt = stmt.order_by(
+                desc(column) if item.startswith('-') else column
+            )
+    return stmt
+
+
 def apply_filters(model, stmt: Select, params: dict):
+    if not _parse_bool('include_archived', params.get('include_archived') or False):
+        clause = active_term_clause(model)
+        if clause is not None:
+            stmt = stmt.where(clause)
     for key, value in params.items():
-        if value is None:
+        if value is None or key == 'include_archived':
             continue
         if key.endswith('_contains'):
             field = key.replace('_contains', '')
-            column = getattr(model, field, None)
+            column = _get_column(model, field)
             if column is not None:
                 stmt = stmt.where(column.ilike(f'%{value}%'))
             continue
         if key == 'sort':
-            column = getattr(model, value.lstrip('-'), None)
-            if column is not None:
-                stmt = stmt.order_by(
-                    desc(column) if value.startswith('-') else column
-                )
+            stmt = _apply_sort(model, stmt, value)
             continue
-        column = getattr(model, key, None)
-        if column is not None:
-            value = column.type.python_type(value)
-            stmt = stmt.where(column == value)
+        field, _, op = key.partition('__')
+        column = _get_column(model, field)
+        if column is None:
+            continue
+        if not op:
+            stmt = stmt.where(column == _coerce(column, key, value))
+        elif op in _COMPARISONS:
+            stmt = stmt.where(_COMPARISONS[op](column, _coerce(column, key, value)))
+        elif op == 'in':
+            items = [item.strip() for item in str(value).split(',') if item.strip()]
+            stmt = stmt.where(column.in_([_coerce(column, key, item) for item in items]))
+        elif op == 'isnull':
+            stmt = stmt.where(column.is_(None) if _parse_bool(key, value) else column.is_not(None))
+        else:
+            raise FilterError(f"Unsupported filter operator '{op}' in '{key}'")
     return stmt
 
-async def filter_and_paginate(model, db, params: dict):
-    stmt = select(model)
+
+def max_page_size(model) -> int:
+    table = getattr(model, '__tablename__', None)
+    return settings.PAGE_SIZE_LIMITS.get(table, settings.PAGE_SIZE_MAX)
+
+
+def _parse_positive_int(params: dict, key: str, default: int) -> int:
+    raw = params.get(key)
+    if raw is None or raw == '':
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise FilterError(f"'{key}' must be an integer")
+    if value < 1:
+        raise FilterError(f"'{key}' must be greater than or equal to 1")
+    return value
+
+
+def get_pagination(model, params: dict) -> tuple[int, int]:
+    limit = max_page_size(model)
+    page = _parse_positive_int(params, 'page', 1)
+    page_size = _parse_positive_int(params, 'page_size', min(settings.PAGE_SIZE_DEFAULT, limit))
+    if page_size > limit:
+        table = getattr(model, '__tablename__', type(model).__name__)
+        clamped_page_size_requests.inc(table=table)
+        logger.warning("page_size=%s clamped to %s for %s", page_size, limit, table)
+        page_size = limit
+    return page, page_size
+
+
+async def filter_and_paginate(model, db, params: dict, stmt: Select | None = None):
+    page, page_size = get_pagination(model, params)
+    stmt = select(model) if stmt is None else stmt
     stmt = apply_filters(model, stmt, params)
-    page = int(params.get('page', 1))
-    page_size = int(params.get('page_size', 20))
-    total = (await db.execute(stmt)).unique().scalars().all()
-    total_count = len(total)
+    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+    total_count = (await db.execute(count_stmt)).scalar_one()
     stmt = stmt.offset((page - 1) * page_size).limit(page_size)
     result = await db.execute(stmt)
     return {
@@ -39,4 +157,4 @@ async def filter_and_paginate(model, db, params: dict):
         'page': page,
         'page_size': page_size,
         'items': result.scalars().all()
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,19 @@
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(model) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def dump_json(model, content: Any) -> bytes:
+    adapter = _adapter(model)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def json_response(model, content: Any, status_code: int = 200, headers: dict | None = None) -> Response:
+    return Response(dump_json(model, content), status_code=status_code, headers=headers, media_type="application/json")
@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Drive every API router through an HTTP client and report latency percentiles.")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./bench.db")
+    parser.add_argument("--scale", default="small", help="dataset preset from scripts/seed_scale.py (tiny, small, large, xlarge)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reuse-data", action="store_true", help="keep an existing dataset instead of reseeding")
+    parser.add_argument("--base-url", help="benchmark a running server instead of the in-process ASGI app")
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured requests per scenario")
+    parser.add_argument("--only", nargs="*", help="scenario name prefixes to run")
+    parser.add_argument("--save-baseline", metavar="NAME", help="write results to benchmarks/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="compare against benchmarks/baselines/NAME.json")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative p95 regression before --compare fails")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="ignore p95 regressions smaller than this")
+    return parser.parse_args(argv)
+
+
+def _configure_environment(args):
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    for name in ("POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_HOST", "POSTGRES_PORT"):
+        os.environ.setdefault(name, "")
+    os.environ["ACCESS_LOG"] = "false"
+    os.environ["LOG_LEVEL"] = "ERROR"
+    os.environ["PROFILING_ENABLED"] = "false"
+    os.environ["ADMIN_USER_IDS"] = "[1]"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+async def _run_scenario(client, scenario, scale, args, rng):
+    latencies = []
+    errors = 0
+
+    async def worker(count):
+        nonlocal errors
+        for _ in range(count):
+            path, kwargs = scenario.build(rng, scale)
+            start = time.perf_counter()
+            response = await client.request(scenario.method, path, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code not in scenario.expected:
+                errors += 1
+
+    for _ in range(args.warmup):
+        path, kwargs = scenario.build(rng, scale)
+        await client.request(scenario.method, path, **kwargs)
+
+    counts = [args.requests // args.concurrency + (i < args.requests % args.concurrency) for i in range(args.concurrency)]
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(count) for count in counts if count))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def _print_table(results: dict, baseline: dict | None):
+    header = f"{'scenario':<22}{'reqs':>7}{'errs':>6}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    if baseline:
+        header += f"{'p95 Δ':>9}"
+    print(header)
+    for name, row in results.items():
+        line = f"{name:<22}{row['requests']:>7}{row['errors']:>6}{row['rps']:>9}{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}"
+        previous = (baseline or {}).get(name)
+        if previous and previous["p95_ms"]:
+            line += f"{(row['p95_ms'] / previous['p95_ms'] - 1) * 100:>+8.0f}%"
+        print(line)
+
+
+def _regressions(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list[str]:
+    problems = []
+    for name, row in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        delta = row["p95_ms"] - previous["p95_ms"]
+        if delta > min_delta_ms and row["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            problems.append(f"{name}: p95 {previous['p95_ms']} -> {row['p95_ms']} ms")
+        if row["errors"] > previous["errors"]:
+            problems.append(f"{name}: errors {previous['errors']} -> {row['errors']}")
+    return problems
+
+
+async def main(args) -> int:
+    _configure_environment(args)
+
+    import httpx
+
+    from app.core.security import security
+    from app.db.session import engine
+    from app.services.job_service import job_runner
+    from scripts import seed_scale
+    from benchmarks.scenarios import SCENARIOS
+
+    scale = seed_scale.PRESETS[args.scale]
+    if not (args.reuse_data and await seed_scale.is_seeded(engine)):
+        started = time.perf_counter()
+        counts = await seed_scale.seed(engine, scale, args.seed)
+        print(f"Seeded {sum(counts.values())} rows in {time.perf_counter() - started:.1f}s: {counts}", file=sys.stderr)
+
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        from app.main import app
+        await job_runner.start()
+        transport, base_url = httpx.ASGITransport(app=app, raise_app_exceptions=False), "http://bench"
+
+    scenarios = [s for s in SCENARIOS if not args.only or s.name.startswith(tuple(args.only))]
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    headers = {"Cookie": f"access_token={security.create_access_token('1')}"}
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, headers=headers, limits=limits, timeout=60) as client:
+        for scenario in scenarios:
+            results[scenario.name] = await _run_scenario(client, scenario, scale, args, rng)
+
+    if not args.base_url:
+        await job_runner.stop()
+    await engine.dispose()
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads((BASELINE_DIR / f"{args.compare}.json").read_text())["results"]
+    _print_table(results, baseline)
+
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        payload = {
+            "scale": args.scale,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "database": args.database_url.split(":", 1)[0],
+            "results": results,
+        }
+        (BASELINE_DIR / f"{args.save_baseline}.json").write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+    if baseline:
+        for name in sorted(set(results) - set(baseline)):
+            print(f"NO BASELINE {name}: not compared, re-save the baseline to include it", file=sys.stderr)
+        problems = _regressions(results, baseline, args.tolerance, args.min_delta_ms)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(_parse_args())))
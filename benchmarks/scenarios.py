@@ -0,0 +1,70 @@
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from scripts.seed_scale import SEED_PASSWORD, Scale, term_start
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    build: Callable[[random.Random, Scale], tuple[str, dict]]
+    expected: tuple[int, ...] = (200,)
+
+
+def _get(path: str, **params) -> tuple[str, dict]:
+    return path, {"params": params} if params else {}
+
+
+def _team(rng, scale: Scale) -> int:
+    return rng.randint(1, scale.teams)
+
+
+def _meeting(rng, scale: Scale) -> int:
+    return rng.randint(1, scale.meetings)
+
+
+def _calendar_range(rng, scale: Scale) -> tuple[str, str]:
+    start = term_start(rng.randrange(scale.terms)) + timedelta(weeks=rng.randrange(max(scale.weeks - 2, 1)))
+    return start.isoformat(), (start + timedelta(days=13)).isoformat()
+
+
+SCENARIOS = [
+    Scenario("auth.login", "POST", lambda rng, s: ("/api/v1/auth/login", {"json": {"email": f"user{rng.randint(1, s.users)}@bench.local", "password": SEED_PASSWORD}})),
+    Scenario("terms.list", "GET", lambda rng, s: _get("/api/v1/terms/")),
+    Scenario("terms.read", "GET", lambda rng, s: _get(f"/api/v1/terms/{rng.randint(1, s.terms)}")),
+    Scenario("terms.stats", "GET", lambda rng, s: _get(f"/api/v1/terms/{rng.randint(1, s.terms)}/stats")),
+    Scenario("terms.grades", "GET", lambda rng, s: _get(f"/api/v1/terms/{rng.randint(1, s.terms)}/grades")),
+    Scenario("cases.list", "GET", lambda rng, s: _get("/api/v1/cases/", term_id=rng.randint(1, s.terms), sort="-id")),
+    Scenario("cases.read", "GET", lambda rng, s: _get(f"/api/v1/cases/{rng.randint(1, s.cases)}")),
+    Scenario("cases.leaderboard", "GET", lambda rng, s: _get(f"/api/v1/cases/{rng.randint(1, s.cases)}/leaderboard")),
+    Scenario("teams.list", "GET", lambda rng, s: _get("/api/v1/teams/", case_id=rng.randint(1, s.cases))),
+    Scenario("teams.list.page", "GET", lambda rng, s: _get("/api/v1/teams/", page=rng.randint(1, max(s.teams // 100, 1)), page_size=100)),
+    Scenario("teams.read", "GET", lambda rng, s: _get(f"/api/v1/teams/{_team(rng, s)}")),
+    Scenario("teams.update", "PATCH", lambda rng, s: (f"/api/v1/teams/{_team(rng, s)}", {"json": {"workspace_link": f"https://example.com/ws/{rng.random()}"}})),
+    Scenario("teams.assignments.open", "GET", lambda rng, s: _get(f"/api/v1/teams/{_team(rng, s)}/assignments", completed="false")),
+    Scenario("teams.ics", "GET", lambda rng, s: _get(f"/api/v1/teams/{_team(rng, s)}/meetings.ics")),
+    Scenario("students.list", "GET", lambda rng, s: _get("/api/v1/students/", full_name__contains=str(rng.randint(1, 99)))),
+    Scenario("students.read", "GET", lambda rng, s: _get(f"/api/v1/students/{rng.randint(1, s.teams * s.students_per_team)}")),
+    Scenario("students.create", "POST", lambda rng, s: ("/api/v1/students/", {"json": {"full_name": f"Bench Student {rng.random()}"}}), expected=(201,)),
+    Scenario("memberships.list", "GET", lambda rng, s: _get("/api/v1/memberships/", team_id=_team(rng, s))),
+    Scenario("users.list", "GET", lambda rng, s: _get("/api/v1/users/")),
+    Scenario("users.read", "GET", lambda rng, s: _get(f"/api/v1/users/{rng.randint(1, s.users)}")),
+    Scenario("meetings.list", "GET", lambda rng, s: _get("/api/v1/meetings/", team_id=_team(rng, s), sort="date_time")),
+    Scenario("meetings.read", "GET", lambda rng, s: _get(f"/api/v1/meetings/{_meeting(rng, s)}")),
+    Scenario("meetings.previous", "GET", lambda rng, s: _get(f"/api/v1/meetings/previous/{_meeting(rng, s)}")),
+    Scenario("meetings.attendees", "PUT", lambda rng, s: (f"/api/v1/meetings/{_meeting(rng, s)}/attendees", {"json": {"user_ids": rng.sample(range(1, s.users + 1), min(10, s.users))}})),
+    Scenario("meetings.calendar", "GET", lambda rng, s: _get("/api/v1/meetings/calendar", **dict(zip(("from", "to"), _calendar_range(rng, s))), term_id=rng.randint(1, s.terms))),
+    Scenario("meetings.schedule", "GET", lambda rng, s: _get(f"/api/v1/meetings/schedule/team/{_team(rng, s)}")),
+    Scenario("assignments.list", "GET", lambda rng, s: _get("/api/v1/assignments/", meeting_id=_meeting(rng, s))),
+    Scenario("assignments.read", "GET", lambda rng, s: _get(f"/api/v1/assignments/{rng.randint(1, s.meetings * s.assignments_per_meeting)}")),
+    Scenario("assignments.complete", "PATCH", lambda rng, s: ("/api/v1/assignments/", {"json": {"ids": rng.sample(range(1, s.meetings * s.assignments_per_meeting + 1), 5)}})),
+    Scenario("assignments.create", "POST", lambda rng, s: ("/api/v1/assignments/", {"json": {"meeting_id": _meeting(rng, s), "text": "Bench task"}}), expected=(201,)),
+    Scenario("checkpoints.list", "GET", lambda rng, s: _get("/api/v1/checkpoints/", team_id=_team(rng, s))),
+    Scenario("checkpoints.update", "PATCH", lambda rng, s: (f"/api/v1/checkpoints/{rng.randint(1, s.teams * s.checkpoints_per_team)}", {"json": {"mark": rng.randint(0, 10)}})),
+    Scenario("checkpoints.read", "GET", lambda rng, s: _get(f"/api/v1/checkpoints/{rng.randint(1, s.teams * s.checkpoints_per_team)}")),
+    Scenario("jobs.list", "GET", lambda rng, s: _get("/api/v1/jobs/")),
+    Scenario("admin.slow_queries", "GET", lambda rng, s: _get("/api/v1/admin/slow-queries", limit=20)),
+]
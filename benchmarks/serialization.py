@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+for name, value in {"DATABASE_URL": "sqlite+aiosqlite://", "JWT_SECRET_KEY": "benchmark", "POSTGRES_USER": "",
+                    "POSTGRES_PASSWORD": "", "POSTGRES_DB": "", "POSTGRES_HOST": "", "POSTGRES_PORT": ""}.items():
+    os.environ.setdefault(name, value)
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+import app.models
+from app.models.meeting import Meeting
+from app.schemas.meeting import MeetingRead
+from app.schemas.paginated import PaginatedResponse
+from app.utils.responses import json_response
+
+
+def _page(size: int) -> dict:
+    start = datetime(2025, 9, 1, 10, tzinfo=timezone.utc)
+    items = [
+        Meeting(id=i, team_id=i % 50 + 1, previous_meeting_id=i - 1 or None, schedule_id=None,
+                recording_link=f"https://example.com/rec/{i}", date_time=start + timedelta(days=i), summary=f"Meeting {i}")
+        for i in range(1, size + 1)
+    ]
+    return {"total": size * 10, "page": 1, "page_size": size, "items": items}
+
+
+async def _fastapi_default(field, page) -> bytes:
+    content = await serialize_response(field=field, response_content=page)
+    return JSONResponse(content).body
+
+
+async def _validate_and_dump(field, page) -> bytes:
+    return json_response(PaginatedResponse[MeetingRead], page).body
+
+
+async def _measure(fn, field, page, seconds: float) -> float:
+    calls = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        await fn(field, page)
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+async def main(args):
+    field = create_model_field(name="Response_list_meetings", type_=PaginatedResponse[MeetingRead], mode="serialization")
+    print(f"{'page size':>10}{'fastapi default/s':>20}{'json_response/s':>18}{'speedup':>10}")
+    for size in args.sizes:
+        page = _page(size)
+        assert await _fastapi_default(field, page) == await _validate_and_dump(field, page)
+        baseline = await _measure(_fastapi_default, field, page, args.seconds)
+        fast = await _measure(_validate_and_dump, field, page, args.seconds)
+        print(f"{size:>10}{baseline:>20.0f}{fast:>18.0f}{fast / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare FastAPI's response_model serialization with json_response for list pages.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[20, 100, 500])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
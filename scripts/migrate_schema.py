@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+
+from sqlalchemy import delete, func, inspect, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import AddConstraint, CreateColumn, CreateIndex, ForeignKeyConstraint
+
+import app.models
+from app.core.config import settings
+from app.db.archive import ARCHIVED_COPIES, sync_archived, term_teams
+from app.db.session import Base
+from app.models.term import Term
+
+
+def _ondelete(value: str | None) -> str | None:
+    return value.upper() if value else None
+
+
+def pending_foreign_keys(sync_conn) -> list[tuple[str, ForeignKeyConstraint]]:
+    """Foreign keys whose ON DELETE rule in the database differs from the models."""
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+    pending = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {
+            tuple(fk["constrained_columns"]): fk for fk in inspector.get_foreign_keys(table.name)
+        }
+        for constraint in table.foreign_key_constraints:
+            current = existing.get(tuple(constraint.column_keys))
+            if current is not None and _ondelete(current.get("options", {}).get("ondelete")) != _ondelete(constraint.ondelete):
+                pending.append((current["name"], constraint))
+    return pending
+
+
+def pending_schema_changes(sync_conn) -> tuple[list, list]:
+    """Columns and indexes declared on the models but missing from existing tables."""
+    inspector = inspect(sync_conn)
+    existing_tables = set(inspector.get_table_names())
+    columns, indexes = [], []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        columns.extend(column for column in table.columns if column.name not in existing_columns)
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        indexes.extend(index for index in table.indexes if index.name not in existing_indexes)
+    return columns, indexes
+
+
+def _duplicates(index):
+    """Rows that would violate a unique index, keeping the lowest id of each key."""
+    table = index.table
+    columns = list(index.columns)
+    keyed = [column.isnot(None) for column in columns]
+    keep = select(func.min(table.c.id)).where(*keyed).group_by(*columns)
+    return [*keyed, table.c.id.not_in(keep)]
+
+
+def _describe(constraint: ForeignKeyConstraint) -> str:
+    columns = ", ".join(constraint.column_keys)
+    return f"{constraint.table.name}({columns}) -> {constraint.referred_table.name} ON DELETE {constraint.ondelete or 'NO ACTION'}"
+
+
+async def migrate(engine, dry_run: bool = False, log=print) -> int:
+    async with engine.begin() as conn:
+        columns, indexes = await conn.run_sync(pending_schema_changes)
+        foreign_keys = await conn.run_sync(pending_foreign_keys)
+        for column in columns:
+            log(f"add column {column.table.name}.{column.name}")
+        duplicates = []
+        for index in indexes:
+            log(f"create index {index.name}")
+            if index.unique:
+                condition = _duplicates(index)
+                count = await conn.scalar(select(func.count()).select_from(index.table).where(*condition))
+                if count:
+                    log(f"remove {count} duplicate rows from {index.table.name} before creating {index.name}")
+                    duplicates.append((index.table, condition))
+        for name, constraint in foreign_keys:
+            log(_describe(constraint))
+        changes = len(columns) + len(indexes) + len(foreign_keys)
+        if dry_run or not changes:
+            return changes
+        if foreign_keys and engine.dialect.name == "sqlite":
+            raise RuntimeError("SQLite cannot alter foreign keys; recreate the database to apply them")
+
+        quote = conn.dialect.identifier_preparer.quote
+        for column in columns:
+            definition = CreateColumn(column).compile(dialect=conn.dialect)
+            await conn.execute(text(f"ALTER TABLE {quote(column.table.name)} ADD COLUMN {definition}"))
+        for table, condition in duplicates:
+            await conn.execute(delete(table).where(*condition))
+        for index in indexes:
+            await conn.execute(CreateIndex(index))
+        if any(column.table in ARCHIVED_COPIES and column.name == "archived" for column in columns):
+            # New archived copies start out false; mark rows of already archived terms.
+            await sync_archived(conn, term_teams(select(Term.id).where(Term.archived == True)))
+        for name, constraint in foreign_keys:
+            await conn.execute(text(f"ALTER TABLE {quote(constraint.table.name)} DROP CONSTRAINT {quote(name)}"))
+            await conn.execute(AddConstraint(constraint))
+    return changes
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Add missing columns and indexes and bring foreign key ON DELETE rules in line with the models."
+    )
+    parser.add_argument("--database-url", default=None, help="defaults to the application's database")
+    parser.add_argument("--dry-run", action="store_true", help="only list the changes that would be applied")
+    return parser.parse_args(argv)
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url or settings.database_url)
+    changed = await migrate(engine, args.dry_run)
+    await engine.dispose()
+    print(f"{changed} schema changes {'pending' if args.dry_run else 'applied'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,53 @@
+import asyncio
+import importlib.util
+import os
+
+import uvicorn
+
+import app.models
+from app.core.config import settings
+from app.db.session import engine, init_db
+
+
+def _worker_count() -> int:
+    if settings.WEB_CONCURRENCY:
+        return settings.WEB_CONCURRENCY
+    return max(os.cpu_count() or 1, 1)
+
+
+def _resolve(choice: str, module: str, fallback: str) -> str:
+    if choice != "auto":
+        return choice
+    return module if importlib.util.find_spec(module) else fallback
+
+
+async def _prepare_database():
+    await init_db()
+    await engine.dispose()
+
+
+def run():
+    asyncio.run(_prepare_database())
+    # Workers inherit the environment; the schema is already created above.
+    os.environ["DB_CREATE_ON_STARTUP"] = "false"
+    uvicorn.run(
+        "app.main:app",
+        host=settings.WEB_HOST,
+        port=settings.WEB_PORT,
+        workers=_worker_count(),
+        loop=_resolve(settings.WEB_LOOP, "uvloop", "asyncio"),
+        http=_resolve(settings.WEB_HTTP, "httptools", "h11"),
+        timeout_keep_alive=settings.WEB_KEEPALIVE,
+        backlog=settings.WEB_BACKLOG,
+        limit_concurrency=settings.WEB_LIMIT_CONCURRENCY,
+        limit_max_requests=settings.WEB_MAX_REQUESTS,
+        timeout_graceful_shutdown=settings.WEB_GRACEFUL_TIMEOUT,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.WEB_FORWARDED_ALLOW_IPS,
+        access_log=not settings.ACCESS_LOG,
+        server_header=False,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,313 @@
+import argparse
+import asyncio
+import enum
+import hashlib
+import itertools
+import random
+import time as timer
+from dataclasses import dataclass, fields
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import func, insert, inspect, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.models
+from app.core.config import settings
+from app.db.session import Base
+from app.models.assignment import Assignment
+from app.models.case import Case, CaseStatus
+from app.models.checkpoint import Checkpoint
+from app.models.meeting import Meeting, MeetingUser
+from app.models.meeting_schedule import MeetingSchedule
+from app.models.student import Student
+from app.models.team import Team
+from app.models.team_grade import TeamGrade
+from app.models.team_membership import TeamMembership
+from app.models.term import SeasonEnum, Term
+from app.models.user import User
+from app.services.grade_service import final_mark_expression, rebuild_team_grades, recompute_final_marks
+
+SEED_PASSWORD = "bench"
+CHUNK_SIZE = 5000
+ROLES = ["Lead", "Dev", "Analyst", "QA", None]
+
+
+@dataclass(frozen=True)
+class Scale:
+    terms: int = 2
+    cases_per_term: int = 20
+    teams_per_case: int = 5
+    students_per_team: int = 4
+    weeks: int = 16
+    users: int = 50
+    assignments_per_meeting: int = 2
+    checkpoints_per_team: int = 3
+
+    @property
+    def cases(self) -> int:
+        return self.terms * self.cases_per_term
+
+    @property
+    def teams(self) -> int:
+        return self.cases * self.teams_per_case
+
+    @property
+    def teams_per_term(self) -> int:
+        return self.cases_per_term * self.teams_per_case
+
+    @property
+    def students(self) -> int:
+        return self.teams * self.students_per_team
+
+    @property
+    def meetings(self) -> int:
+        return self.teams * self.weeks
+
+    @property
+    def rows(self) -> int:
+        return (
+            self.users + self.terms + self.cases + self.teams * (2 + self.checkpoints_per_team)
+            + self.students * 2 + self.meetings * (2 + self.assignments_per_meeting)
+        )
+
+
+PRESETS = {
+    "tiny": Scale(terms=1, cases_per_term=4, teams_per_case=3, students_per_team=3, weeks=6),
+    "small": Scale(),
+    "large": Scale(terms=4, cases_per_term=100, teams_per_case=10, students_per_team=5, weeks=30),
+    "xlarge": Scale(terms=10, cases_per_term=200, teams_per_case=10, students_per_team=6, weeks=32, users=500),
+}
+
+
+def term_start(index: int) -> date:
+    year = 2020 + index // 2
+    return date(year, 9, 1) if index % 2 == 0 else date(year + 1, 2, 1)
+
+
+def _term_index(scale: Scale, team_id: int) -> int:
+    return (team_id - 1) // scale.teams_per_term
+
+
+def generate(scale: Scale, seed: int = 0):
+    rng = random.Random(seed)
+    password = hashlib.sha256(SEED_PASSWORD.encode("utf-8")).hexdigest()
+
+    yield User, (
+        {"id": i, "full_name": f"User {i}", "email": f"user{i}@bench.local", "password": password}
+        for i in range(1, scale.users + 1)
+    )
+    yield Term, (
+        {
+            "id": i + 1,
+            "start_date": term_start(i),
+            "end_date": term_start(i) + timedelta(weeks=scale.weeks),
+            "year": term_start(i).year,
+            "season": SeasonEnum.autumn if i % 2 == 0 else SeasonEnum.spring,
+        }
+        for i in range(scale.terms)
+    )
+    yield Case, (
+        {
+            "id": i,
+            "term_id": (i - 1) // scale.cases_per_term + 1,
+            "user_id": rng.randint(1, scale.users),
+            "title": f"Case {i}",
+            "description": f"Generated case {i}",
+            "status": rng.choice(list(CaseStatus)),
+        }
+        for i in range(1, scale.cases + 1)
+    )
+    yield Team, (
+        {
+            "id": i,
+            "case_id": (i - 1) // scale.teams_per_case + 1,
+            "title": f"Team {i}",
+            "workspace_link": f"https://example.com/ws/{i}",
+            "final_mark": 0,
+        }
+        for i in range(1, scale.teams + 1)
+    )
+    yield Student, ({"id": i, "full_name": f"Student {i}"} for i in range(1, scale.students + 1))
+    yield TeamMembership, (
+        {
+            "id": i,
+            "student_id": i,
+            "team_id": (i - 1) // scale.students_per_team + 1,
+            "role": rng.choice(ROLES),
+            "group": f"G-{(i - 1) // scale.students_per_team % 20 + 1}",
+        }
+        for i in range(1, scale.students + 1)
+    )
+    yield MeetingSchedule, (
+        {
+            "id": team_id,
+            "team_id": team_id,
+            "start_date": term_start(_term_index(scale, team_id)),
+            "day_of_week": term_start(_term_index(scale, team_id)).weekday(),
+            "time": time(10 + team_id % 8),
+            "interval_weeks": 1,
+            "active": True,
+        }
+        for team_id in range(1, scale.teams + 1)
+    )
+    yield Checkpoint, (
+        {
+            "id": (team_id - 1) * scale.checkpoints_per_team + number,
+            "team_id": team_id,
+            "number": number,
+            "date": term_start(_term_index(scale, team_id)) + timedelta(weeks=4 * number),
+            "project_state": "In progress",
+            "mark": rng.randint(0, 10),
+            "video_link": None,
+            "presentation_link": None,
+            "university_mark": None,
+            "university_comment": None,
+        }
+        for team_id in range(1, scale.teams + 1)
+        for number in range(1, scale.checkpoints_per_team + 1)
+    )
+    yield Meeting, (
+        {
+            "id": (team_id - 1) * scale.weeks + week + 1,
+            "team_id": team_id,
+            "previous_meeting_id": (team_id - 1) * scale.weeks + week if week else None,
+            "schedule_id": team_id,
+            "recording_link": None,
+            "date_time": datetime.combine(
+                term_start(_term_index(scale, team_id)) + timedelta(weeks=week),
+                time(10 + team_id % 8),
+            ),
+            "summary": f"Week {week + 1}",
+        }
+        for team_id in range(1, scale.teams + 1)
+        for week in range(scale.weeks)
+    )
+    yield Assignment, (
+        {
+            "id": (meeting_id - 1) * scale.assignments_per_meeting + n + 1,
+            "meeting_id": meeting_id,
+            "text": f"Task {n + 1} for meeting {meeting_id}",
+            "completed": rng.random() < 0.5,
+        }
+        for meeting_id in range(1, scale.meetings + 1)
+        for n in range(scale.assignments_per_meeting)
+    )
+    yield MeetingUser, (
+        {"id": meeting_id, "meeting_id": meeting_id, "user_id": rng.randint(1, scale.users)}
+        for meeting_id in range(1, scale.meetings + 1)
+    )
+
+
+def _chunks(rows, size: int):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _copy_value(value):
+    return value.name if isinstance(value, enum.Enum) else value
+
+
+async def _copy_rows(conn, model, rows) -> int:
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+    columns = list(first)
+    column_list = ", ".join(f'"{name}"' for name in columns)
+    raw = await conn.get_raw_connection()
+    total = 0
+    async with raw.driver_connection.cursor() as cursor:
+        async with cursor.copy(f'COPY "{model.__tablename__}" ({column_list}) FROM STDIN') as copy:
+            for row in itertools.chain([first], rows):
+                await copy.write_row([_copy_value(row[name]) for name in columns])
+                total += 1
+    return total
+
+
+async def _insert_rows(conn, model, rows) -> int:
+    total = 0
+    for chunk in _chunks(rows, CHUNK_SIZE):
+        await conn.execute(insert(model), chunk)
+        total += len(chunk)
+    return total
+
+
+async def _reset_sequences(conn, tables):
+    for table in tables:
+        await conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        ))
+
+
+def _secondary_indexes():
+    return [index for table in Base.metadata.sorted_tables for index in table.indexes]
+
+
+async def is_seeded(engine) -> bool:
+    async with engine.connect() as conn:
+        if not await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(Team.__tablename__)):
+            return False
+        return bool(await conn.scalar(select(func.count()).select_from(Team)))
+
+
+async def seed(engine, scale: Scale, seed: int = 0, log=None) -> dict[str, int]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    postgres = engine.dialect.name == "postgresql"
+    counts = {}
+    async with engine.begin() as conn:
+        for index in _secondary_indexes():
+            await conn.run_sync(index.drop)
+
+        for model, rows in generate(scale, seed):
+            started = timer.perf_counter()
+            load = _copy_rows if postgres else _insert_rows
+            counts[model.__tablename__] = await load(conn, model, rows)
+            if log:
+                log(f"{model.__tablename__}: {counts[model.__tablename__]} rows in {timer.perf_counter() - started:.1f}s")
+        counts[TeamGrade.__tablename__] = await rebuild_team_grades(conn)
+        if final_mark_expression() is not None:
+            await recompute_final_marks(conn)
+
+        for index in _secondary_indexes():
+            await conn.run_sync(index.create)
+        if postgres:
+            await _reset_sequences(conn, counts)
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE"))
+    return counts
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic dataset for load testing.")
+    parser.add_argument("--database-url", default=None, help="defaults to the application's database")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    for field in fields(Scale):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=int, dest=field.name)
+    return parser.parse_args(argv)
+
+
+async def main(args):
+    overrides = {field.name: getattr(args, field.name) for field in fields(Scale) if getattr(args, field.name) is not None}
+    scale = Scale(**{**PRESETS[args.preset].__dict__, **overrides})
+    engine = create_async_engine(args.database_url or settings.database_url)
+    print(f"Generating ~{scale.rows} rows: {scale}")
+    started = timer.perf_counter()
+    counts = await seed(engine, scale, args.seed, log=print)
+    await engine.dispose()
+    print(f"Seeded {sum(counts.values())} rows in {timer.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,83 @@
+import pytest
+
+from app.core import metrics
+from app.core import middleware
+from app.db.instrumentation import QueryBudgetExceeded, current_query_stats
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = metrics.Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+    histogram.observe(3, route="/a")
+
+    text = registry.render()
+    assert '# TYPE latency_seconds histogram' in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+
+
+def test_counter_escapes_label_values():
+    registry = metrics.Registry()
+    counter = registry.counter("events_total", "Events.", ("name",))
+
+    counter.inc(name='say "hi"')
+
+    assert 'events_total{name="say \\"hi\\""} 1' in registry.render()
+
+
+@pytest.mark.asyncio
+async def test_timing_middleware_records_route_status_and_size(monkeypatch):
+    logged = []
+    monkeypatch.setattr(middleware, "log_access", lambda **fields: logged.append(fields))
+
+    class _Route:
+        path = "/api/v1/things/{thing_id}"
+
+    async def app(scope, receive, send):
+        scope["route"] = _Route()
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"12345"})
+
+    async def send(message):
+        pass
+
+    before = metrics.http_requests_total.value(method="POST", route=_Route.path, status=201)
+    scope = {"type": "http", "method": "POST", "path": "/api/v1/things/1", "client": ("10.0.0.1", 1)}
+
+    await middleware.TimingMiddleware(app)(scope, None, send)
+
+    assert metrics.http_requests_total.value(method="POST", route=_Route.path, status=201) == before + 1
+    assert logged[0]["status"] == 201
+    assert logged[0]["size"] == 5
+    assert logged[0]["route"] == _Route.path
+    assert metrics.http_requests_in_progress.value(method="POST") == 0
+
+
+@pytest.mark.asyncio
+async def test_timing_middleware_fails_request_over_query_budget_before_responding(monkeypatch):
+    monkeypatch.setattr(middleware, "log_access", lambda **fields: None)
+    monkeypatch.setattr(middleware.settings, "QUERY_BUDGET", 1)
+    monkeypatch.setattr(middleware.settings, "QUERY_REPEAT_LIMIT", None)
+    monkeypatch.setattr(middleware.settings, "QUERY_BUDGET_ACTION", "raise")
+    sent = []
+
+    async def app(scope, receive, send):
+        stats = current_query_stats()
+        stats.record("SELECT 1", 0.01, False)
+        stats.record("SELECT 2", 0.01, False)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/things/", "client": None}
+
+    with pytest.raises(QueryBudgetExceeded, match="2 queries exceed the budget of 1"):
+        await middleware.TimingMiddleware(app)(scope, None, send)
+    assert sent == []
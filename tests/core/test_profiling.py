@@ -0,0 +1,95 @@
+import asyncio
+import cProfile
+import marshal
+import time
+from collections import Counter
+
+import pytest
+
+from app.core import profiling
+from app.core.config import settings
+
+
+def _profile(store, route, stacks):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    sum(range(10))
+    profiler.disable()
+    return store.add(method="GET", path=route, route=route, duration_ms=1.0, profiler=profiler, stacks=Counter(stacks))
+
+
+def test_store_aggregates_profiles_by_route():
+    store = profiling.ProfileStore(size=2)
+    _profile(store, "/a", {"main;handler": 2})
+    _profile(store, "/a", {"main;handler": 1, "main;other": 1})
+    _profile(store, "/b", {"main;b": 5})
+
+    profiles = store.select("/a")
+
+    assert [profile.id for profile in store.profiles] == [3, 2]
+    assert profiling.collapse_stacks(profiles) == "main;handler 1\nmain;other 1\n"
+    assert any("sum" in key[2] for key in marshal.loads(profiling.dump_stats(profiles)))
+    assert "function calls" in profiling.render_stats(profiles)
+
+
+@pytest.mark.asyncio
+async def test_middleware_profiles_header_requests_only_for_admins(monkeypatch):
+    store = profiling.ProfileStore(size=5)
+    monkeypatch.setattr(profiling, "profile_store", store)
+    monkeypatch.setattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiling, "is_admin_token", lambda token: token == "admin")
+
+    async def app(scope, receive, send):
+        pass
+
+    middleware = profiling.ProfilingMiddleware(app)
+
+    def scope(cookie):
+        return {
+            "type": "http", "method": "GET", "path": "/x",
+            "headers": [(b"x-profile", b"1"), (b"cookie", f"access_token={cookie}".encode())],
+        }
+
+    await middleware(scope("user"), None, None)
+    assert len(store.profiles) == 0
+
+    await middleware(scope("admin"), None, None)
+    assert len(store.profiles) == 1
+    assert store.profiles[0].route == "unmatched"
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_middleware_attributes_only_the_profiled_request(monkeypatch):
+    store = profiling.ProfileStore(size=5)
+    monkeypatch.setattr(profiling, "profile_store", store)
+    monkeypatch.setattr(settings, "PROFILING_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "PROFILING_SAMPLE_INTERVAL_MS", 1)
+
+    async def profiled_handler():
+        _busy(0.02)
+        await asyncio.sleep(0.05)
+
+    async def app(scope, receive, send):
+        await profiled_handler()
+
+    async def other_request():
+        await asyncio.sleep(0.01)
+        _busy(0.02)
+
+    other = asyncio.create_task(other_request())
+    await profiling.ProfilingMiddleware(app)({"type": "http", "method": "GET", "path": "/x", "headers": []}, None, None)
+    await other
+
+    collapsed = profiling.collapse_stacks(store.select())
+    assert "profiled_handler" in collapsed
+    assert ";sleep (tasks.py" in collapsed
+    assert "other_request" not in collapsed
+    functions = {key[2] for key in marshal.loads(profiling.dump_stats(store.select()))}
+    assert "profiled_handler" in functions
+    assert "other_request" not in functions
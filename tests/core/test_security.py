@@ -0,0 +1,17 @@
+from app.core import security
+
+
+def test_team_feed_token_is_bound_to_team_and_secret(monkeypatch):
+    monkeypatch.setattr(security.settings, "ICS_FEED_SECRET", None)
+    token = security.team_feed_token(1)
+
+    assert security.verify_team_feed_token(1, token)
+    assert not security.verify_team_feed_token(2, token)
+
+    monkeypatch.setattr(security.settings, "ICS_FEED_SECRET", "rotated")
+    assert not security.verify_team_feed_token(1, token)
+
+
+def test_team_feed_token_with_non_ascii_characters_is_rejected():
+    assert not security.verify_team_feed_token(1, "é")
+    assert not security.verify_team_feed_token(1, security.team_feed_token(1) + "é")
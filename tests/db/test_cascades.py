@@ -0,0 +1,75 @@
+from datetime import date, datetime, time
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from app.db import instrumentation
+from app.models.assignment import Assignment
+from app.models.case import Case
+from app.models.checkpoint import Checkpoint
+from app.models.meeting import Meeting, MeetingUser
+from app.models.meeting_schedule import MeetingSchedule
+from app.models.student import Student
+from app.models.team import Team
+from app.models.team_membership import TeamMembership
+from app.models.term import SeasonEnum, Term
+from app.models.user import User
+from app.services import case_service, meeting_service, team_service
+
+
+@pytest_asyncio.fixture
+async def db(sqlite_session):
+    instrumentation.instrument_engine(sqlite_session.bind)
+    sqlite_session.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn),
+        Case(id=1, term_id=1, user_id=1, title="A"),
+        Team(id=1, case_id=1, title="T1"),
+        Team(id=2, case_id=1, title="T2"),
+        Student(id=1, full_name="S1"),
+        TeamMembership(student_id=1, team_id=1, group="G"),
+        Checkpoint(team_id=1, number=1, mark=5),
+        MeetingSchedule(id=1, team_id=1, start_date=date(2024, 9, 2), day_of_week=0, time=time(10), interval_weeks=1),
+        Meeting(id=1, team_id=1, schedule_id=1, date_time=datetime(2024, 9, 2, 10)),
+        Meeting(id=2, team_id=1, schedule_id=1, previous_meeting_id=1, date_time=datetime(2024, 9, 9, 10)),
+        Meeting(id=3, team_id=2, date_time=datetime(2024, 9, 3, 10)),
+        MeetingUser(meeting_id=1, user_id=1),
+        Assignment(meeting_id=1, text="a"),
+        Assignment(meeting_id=2, text="b"),
+    ])
+    await sqlite_session.commit()
+    sqlite_session.expunge_all()
+    return sqlite_session
+
+
+async def _count(db, model):
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_delete_team_cascades_in_database_without_loading_children(db):
+    with instrumentation.track_queries() as stats:
+        await team_service.delete_team(db, 1)
+
+    assert stats.count == 2
+    assert [await _count(db, model) for model in (Team, Meeting, MeetingSchedule, Checkpoint, TeamMembership, Assignment, MeetingUser)] == [
+        1, 1, 0, 0, 0, 0, 0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_meeting_removes_assignments_and_unlinks_next_meeting(db):
+    await meeting_service.delete_meeting(db, 1)
+
+    assert await _count(db, Assignment) == 1
+    assert await _count(db, MeetingUser) == 0
+    assert await db.scalar(select(Meeting.previous_meeting_id).where(Meeting.id == 2)) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_case_removes_its_teams(db):
+    await case_service.delete_case(db, 1)
+
+    assert await _count(db, Team) == 0
+    assert await _count(db, Meeting) == 0
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db import instrumentation
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrumentation.instrument_engine(engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_statements_and_feeds_parent(engine):
+    with instrumentation.track_queries() as outer:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            with instrumentation.track_queries() as inner:
+                await conn.execute(text("SELECT 1"))
+
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.statements["SELECT 1"] == 2
+    assert instrumentation.current_query_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_assert_query_budget_raises_on_repeated_statement(engine):
+    with pytest.raises(instrumentation.QueryBudgetExceeded, match="repeated 3 times"):
+        with instrumentation.assert_query_budget(max_repeats=2):
+            async with engine.connect() as conn:
+                for _ in range(3):
+                    await conn.execute(text("SELECT 1"))
+
+
+def test_check_query_budget_warns_or_raises(monkeypatch, caplog):
+    stats = instrumentation.QueryStats()
+    stats.record("SELECT 1", 0.01, False)
+    stats.record("SELECT 2", 0.01, False)
+    monkeypatch.setattr(settings, "QUERY_BUDGET", 1)
+    monkeypatch.setattr(settings, "QUERY_REPEAT_LIMIT", None)
+
+    monkeypatch.setattr(settings, "QUERY_BUDGET_ACTION", "warn")
+    instrumentation.check_query_budget(stats, "/api/v1/terms/")
+    assert "2 queries exceed the budget of 1" in caplog.text
+
+    monkeypatch.setattr(settings, "QUERY_BUDGET_ACTION", "raise")
+    with pytest.raises(instrumentation.QueryBudgetExceeded):
+        instrumentation.check_query_budget(stats, "/api/v1/terms/")
+
+    monkeypatch.setattr(settings, "QUERY_BUDGET_ACTION", "off")
+    instrumentation.check_query_budget(stats, "/api/v1/terms/")
+
+
+def test_normalize_statement_collapses_whitespace_and_in_lists():
+    statement = "SELECT id\n  FROM terms WHERE year IN (?, ?, ?) AND season = ?"
+
+    assert instrumentation.normalize_statement(statement) == "SELECT id FROM terms WHERE year IN (...) AND season = ?"
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_recorded_with_route_and_plan(engine, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 1)
+    monkeypatch.setattr(settings, "SLOW_QUERY_LOG_PARAMETERS", True)
+    monkeypatch.setattr(instrumentation, "slow_query_log", instrumentation.SlowQueryLog(2))
+
+    with instrumentation.track_queries(route=lambda: "/api/v1/terms/") as stats:
+        async with engine.connect() as conn:
+            await conn.execute(text("CREATE TABLE terms (id INTEGER PRIMARY KEY, year INTEGER)"))
+            await conn.execute(text("SELECT id FROM terms WHERE year = :year"), {"year": 2024})
+            assert instrumentation.slow_query_log.list()[0]["plan"] is None
+        await asyncio.gather(*instrumentation._explain_tasks)
+
+    assert stats.count == 2
+
+    entries = instrumentation.slow_query_log.list()
+    assert len(entries) == 2
+    assert entries[0]["statement"] == "SELECT id FROM terms WHERE year = ?"
+    assert entries[0]["route"] == "/api/v1/terms/"
+    assert entries[0]["parameters"] == "(2024,)"
+    assert "SCAN terms" in entries[0]["plan"]
+    assert entries[1]["plan"] is None
+
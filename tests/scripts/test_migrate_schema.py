@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy import insert, inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import app.models
+from app.db.session import Base
+from app.models.case import Case
+from app.models.team import Team
+from app.models.term import SeasonEnum, Term
+from app.models.user import User
+from scripts.migrate_schema import migrate, pending_foreign_keys
+
+
+def _quiet(message):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_pending_foreign_keys_reports_rules_missing_from_database():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE cases (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text(
+            "CREATE TABLE teams (id INTEGER PRIMARY KEY, title VARCHAR, case_id INTEGER REFERENCES cases (id), "
+            "workspace_link VARCHAR, final_mark INTEGER)"
+        ))
+        pending = await conn.run_sync(pending_foreign_keys)
+
+    assert [(constraint.table.name, constraint.column_keys, constraint.ondelete) for _, constraint in pending] == [
+        ("teams", ["case_id"], "CASCADE"),
+    ]
+    with pytest.raises(RuntimeError, match="recreate"):
+        await migrate(engine, log=_quiet)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrate_adds_missing_columns_and_indexes():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE terms (id INTEGER PRIMARY KEY, start_date DATE, end_date DATE, year INTEGER NOT NULL, "
+            "season VARCHAR(6) NOT NULL)"
+        ))
+        await conn.execute(text("INSERT INTO terms (id, year, season) VALUES (1, 2024, 'autumn')"))
+
+    assert await migrate(engine, dry_run=True, log=_quiet) == 2
+    assert await migrate(engine, log=_quiet) == 2
+
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("SELECT archived FROM terms"))).scalar_one() == 0
+        indexes = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_indexes("terms"))
+    assert [index["name"] for index in indexes] == ["ix_terms_archived"]
+    assert await migrate(engine, log=_quiet) == 0
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_schema_created_from_models_needs_no_migration():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    assert await migrate(engine, log=_quiet) == 0
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrate_copies_archived_flag_onto_existing_meetings():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("DROP INDEX ix_meetings_archived"))
+        await conn.execute(text("ALTER TABLE meetings DROP COLUMN archived"))
+        await conn.execute(insert(User), [{"id": 1, "full_name": "Owner", "email": "o@example.com", "password": "x"}])
+        await conn.execute(insert(Term), [
+            {"id": 1, "year": 2024, "season": SeasonEnum.autumn, "archived": True},
+            {"id": 2, "year": 2025, "season": SeasonEnum.spring, "archived": False},
+        ])
+        await conn.execute(insert(Case), [
+            {"id": 1, "term_id": 1, "user_id": 1, "title": "Old"},
+            {"id": 2, "term_id": 2, "user_id": 1, "title": "New"},
+        ])
+        await conn.execute(insert(Team), [{"id": 1, "case_id": 1, "title": "T1"}, {"id": 2, "case_id": 2, "title": "T2"}])
+        await conn.execute(text(
+            "INSERT INTO meetings (id, team_id, date_time) VALUES (1, 1, '2024-10-01 10:00:00'), (2, 2, '2025-03-01 10:00:00')"
+        ))
+
+    assert await migrate(engine, log=_quiet) == 2
+
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text("SELECT id, archived FROM meetings ORDER BY id"))).all()
+    assert [tuple(row) for row in rows] == [(1, 1), (2, 0)]
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrate_removes_duplicates_before_creating_unique_index():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("DROP INDEX ux_meeting_users_meeting_id_user_id"))
+        await conn.execute(text(
+            "INSERT INTO meeting_users (id, meeting_id, user_id) VALUES (1, 1, 1), (2, 1, 1), (3, 1, 2), (4, 1, 1), (5, 2, 1)"
+        ))
+
+    assert await migrate(engine, dry_run=True, log=_quiet) == 1
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("SELECT count(*) FROM meeting_users"))).scalar_one() == 5
+
+    assert await migrate(engine, log=_quiet) == 1
+
+    async with engine.connect() as conn:
+        rows = (await conn.execute(text("SELECT id FROM meeting_users ORDER BY id"))).scalars().all()
+        indexes = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_indexes("meeting_users"))
+    assert rows == [1, 3, 5]
+    assert [(index["name"], bool(index["unique"])) for index in indexes] == [("ux_meeting_users_meeting_id_user_id", True)]
+    await engine.dispose()
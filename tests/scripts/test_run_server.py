@@ -0,0 +1,18 @@
+import os
+
+from scripts import run_server
+
+
+def test_run_creates_schema_once_and_disables_it_in_workers(monkeypatch):
+    calls = []
+
+    async def prepare():
+        calls.append("prepare")
+
+    monkeypatch.setattr(run_server, "_prepare_database", prepare)
+    monkeypatch.setattr(run_server.uvicorn, "run", lambda *args, **kwargs: calls.append(os.environ["DB_CREATE_ON_STARTUP"]))
+    monkeypatch.setenv("DB_CREATE_ON_STARTUP", "true")
+
+    run_server.run()
+
+    assert calls == ["prepare", "false"]
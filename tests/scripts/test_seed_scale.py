@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+from app.services.meeting_service import _schedule_occurrences
+from scripts.seed_scale import PRESETS, generate
+
+
+def _materialize(scale, seed):
+    return {model.__tablename__: list(rows) for model, rows in generate(scale, seed)}
+
+
+def test_generate_is_deterministic_and_matches_scale():
+    scale = PRESETS["tiny"]
+
+    first = _materialize(scale, seed=7)
+    second = _materialize(scale, seed=7)
+
+    assert first == second
+    assert sum(len(rows) for rows in first.values()) == scale.rows
+    assert len(first["meetings"]) == scale.meetings
+    assert _materialize(scale, seed=8)["cases"] != first["cases"]
+
+
+def test_generated_foreign_keys_point_at_generated_rows():
+    tables = _materialize(PRESETS["tiny"], seed=0)
+    ids = {name: {row["id"] for row in rows} for name, rows in tables.items()}
+
+    assert {row["team_id"] for row in tables["meetings"]} <= ids["teams"]
+    assert {row["meeting_id"] for row in tables["assignments"]} <= ids["meetings"]
+    assert {row["previous_meeting_id"] for row in tables["meetings"]} - {None} <= ids["meetings"]
+    assert {row["case_id"] for row in tables["teams"]} <= ids["cases"]
+
+
+def test_generated_meetings_are_naive_schedule_occurrences():
+    tables = _materialize(PRESETS["tiny"], seed=0)
+    schedules = {row["id"]: SimpleNamespace(**row) for row in tables["meeting_schedules"]}
+
+    for meeting in tables["meetings"]:
+        schedule = schedules[meeting["schedule_id"]]
+        assert meeting["date_time"].tzinfo is None
+        assert meeting["date_time"] in set(_schedule_occurrences(schedule, meeting["date_time"].date()))
@@ -1,9 +1,16 @@
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy import select
 
 from app.models.assignment import Assignment
-from app.schemas.assignment import AssignmentCreate, AssignmentUpdate
+from app.models.case import Case
+from app.models.meeting import Meeting
+from app.models.team import Team
+from app.models.term import SeasonEnum, Term
+from app.models.user import User
+from app.schemas.assignment import AssignmentBulkUpdate, AssignmentCreate, AssignmentUpdate
 from app.services import assignment_service
 
 
@@ -103,3 +110,122 @@ async def test_get_assignment_returns_none_when_not_found(mock_session, result_s
 
     assert assignment is None
     mock_session.execute.assert_awaited_once()
+
+
+async def _seed_team_assignments(db):
+    db.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn),
+        Case(id=1, term_id=1, user_id=1, title="Case"),
+        Team(id=1, case_id=1, title="Alpha"),
+        Team(id=2, case_id=1, title="Beta"),
+        Meeting(id=1, team_id=1, date_time=datetime(2024, 9, 2, 10)),
+        Meeting(id=2, team_id=1, date_time=datetime(2024, 9, 9, 10)),
+        Meeting(id=3, team_id=2, date_time=datetime(2024, 9, 2, 10)),
+        Assignment(id=1, meeting_id=2, text="later", completed=None),
+        Assignment(id=2, meeting_id=1, text="done", completed=True),
+        Assignment(id=3, meeting_id=1, text="open", completed=False),
+        Assignment(id=4, meeting_id=3, text="other team", completed=False),
+    ])
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_team_assignments_joins_through_meetings(sqlite_session):
+    await _seed_team_assignments(sqlite_session)
+
+    all_items = await assignment_service.get_team_assignments(sqlite_session, 1, {})
+    open_items = await assignment_service.get_team_assignments(sqlite_session, 1, {}, completed=False)
+    done_items = await assignment_service.get_team_assignments(sqlite_session, 1, {}, completed=True)
+
+    assert [a.id for a in all_items["items"]] == [2, 3, 1]
+    assert [a.id for a in open_items["items"]] == [3, 1]
+    assert [a.id for a in done_items["items"]] == [2]
+    assert (await assignment_service.get_team_assignments(sqlite_session, 2, {}, completed=True))["total"] == 0
+    assert await assignment_service.get_team_assignments(sqlite_session, 99, {}) is None
+
+
+@pytest.mark.asyncio
+async def test_complete_assignments_updates_all_ids_in_one_statement(sqlite_session):
+    await _seed_team_assignments(sqlite_session)
+
+    updated = await assignment_service.complete_assignments(sqlite_session, AssignmentBulkUpdate(ids=[3, 1, 3]))
+
+    assert [(a.id, a.completed) for a in updated] == [(1, True), (3, True)]
+
+
+@pytest.mark.asyncio
+async def test_complete_assignments_rolls_back_when_ids_are_missing(sqlite_session):
+    await _seed_team_assignments(sqlite_session)
+
+    with pytest.raises(ValueError, match="not found: 42"):
+        await assignment_service.complete_assignments(sqlite_session, AssignmentBulkUpdate(ids=[3, 42]))
+
+    assert await sqlite_session.scalar(select(Assignment.completed).where(Assignment.id == 3)) is False
+
+
+async def _meeting_texts(db, meeting_id):
+    result = await db.execute(
+        select(Assignment.text).where(Assignment.meeting_id == meeting_id).order_by(Assignment.id)
+    )
+    return result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_carry_over_copies_open_assignments_to_next_meeting_once(sqlite_session):
+    await _seed_team_assignments(sqlite_session)
+
+    result = await assignment_service.carry_over_assignments(sqlite_session, 1)
+    repeated = await assignment_service.carry_over_assignments(sqlite_session, 1)
+
+    assert result == {"mode": "copy", "carried": 1, "source_meeting_id": 1, "target_meeting_id": 2}
+    assert repeated["carried"] == 0
+    assert await _meeting_texts(sqlite_session, 1) == ["done", "open"]
+    assert await _meeting_texts(sqlite_session, 2) == ["later", "open"]
+
+
+@pytest.mark.asyncio
+async def test_carry_over_move_and_validation(sqlite_session):
+    await _seed_team_assignments(sqlite_session)
+
+    result = await assignment_service.carry_over_assignments(sqlite_session, 1, mode="move", target_meeting_id=2)
+
+    assert result["carried"] == 1
+    assert await _meeting_texts(sqlite_session, 1) == ["done"]
+    with pytest.raises(ValueError, match="no next meeting"):
+        await assignment_service.carry_over_assignments(sqlite_session, 2)
+    with pytest.raises(ValueError, match="same team"):
+        await assignment_service.carry_over_assignments(sqlite_session, 1, target_meeting_id=3)
+    assert await assignment_service.carry_over_assignments(sqlite_session, 99) is None
+
+
+@pytest.mark.asyncio
+async def test_carry_over_term_moves_from_last_held_to_next_meeting(sqlite_session):
+    await _seed_team_assignments(sqlite_session)
+    sqlite_session.add_all([
+        Meeting(id=4, team_id=1, previous_meeting_id=1, date_time=datetime(2024, 9, 16, 10)),
+        Meeting(id=5, team_id=2, previous_meeting_id=3, date_time=datetime(2024, 9, 9, 10)),
+    ])
+    await sqlite_session.commit()
+
+    result = await assignment_service.carry_over_term_assignments(
+        sqlite_session, 1, mode="move", now=datetime(2024, 9, 5)
+    )
+
+    assert result == {"mode": "move", "carried": 2}
+    assert await _meeting_texts(sqlite_session, 1) == ["done"]
+    assert await _meeting_texts(sqlite_session, 4) == ["open"]
+    assert await _meeting_texts(sqlite_session, 5) == ["other team"]
+
+
+@pytest.mark.asyncio
+async def test_carry_over_term_copy_skips_teams_without_upcoming_meeting(sqlite_session):
+    await _seed_team_assignments(sqlite_session)
+    sqlite_session.add(Meeting(id=4, team_id=1, previous_meeting_id=1, date_time=datetime(2024, 9, 16, 10)))
+    await sqlite_session.commit()
+
+    result = await assignment_service.carry_over_term_assignments(sqlite_session, 1, now=datetime(2024, 9, 5))
+
+    assert result["carried"] == 1
+    assert await _meeting_texts(sqlite_session, 1) == ["done", "open"]
+    assert await _meeting_texts(sqlite_session, 4) == ["open"]
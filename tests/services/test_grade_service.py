@@ -0,0 +1,177 @@
+import pytest
+import pytest_asyncio
+from pydantic import ValidationError
+from sqlalchemy import select
+
+from app.core.config import Settings, settings
+from app.models.case import Case
+from app.models.team import Team
+from app.models.team_grade import TeamGrade
+from app.models.term import SeasonEnum, Term
+from app.models.user import User
+from app.schemas.checkpoint import CheckpointCreate, CheckpointUpdate
+from app.schemas.team import TeamUpdate
+from app.services import checkpoint_service, grade_service, team_service
+
+
+@pytest_asyncio.fixture
+async def db(sqlite_session):
+    sqlite_session.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn),
+        Case(id=1, term_id=1, user_id=1, title="Case A"),
+        Case(id=2, term_id=1, user_id=1, title="Case B"),
+        Team(id=1, case_id=1, title="Alpha"),
+        Team(id=2, case_id=1, title="Beta"),
+        Team(id=3, case_id=2, title="Gamma"),
+    ])
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+async def _checkpoint(db, team_id, number, mark, university_mark=None):
+    return await checkpoint_service.create_checkpoint(
+        db, CheckpointCreate(team_id=team_id, number=number, mark=mark, university_mark=university_mark)
+    )
+
+
+async def _rollup(db, team_id):
+    return await db.scalar(select(TeamGrade).where(TeamGrade.team_id == team_id).execution_options(populate_existing=True))
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_writes_keep_rollup_in_sync(db):
+    first = await _checkpoint(db, 1, 1, 7, university_mark=4)
+    await _checkpoint(db, 1, 2, 9)
+
+    grade = await _rollup(db, 1)
+    assert (grade.checkpoint_count, grade.mark_sum, grade.university_mark_count, grade.university_mark_sum) == (2, 16, 1, 4)
+
+    await checkpoint_service.update_checkpoint(db, first.id, CheckpointUpdate(mark=3, university_mark=5))
+    grade = await _rollup(db, 1)
+    assert (grade.mark_sum, grade.university_mark_sum) == (12, 5)
+
+    await checkpoint_service.delete_checkpoint(db, first.id)
+    grade = await _rollup(db, 1)
+    assert (grade.checkpoint_count, grade.mark_sum, grade.university_mark_count) == (1, 9, 0)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_writes_recompute_rollup_from_checkpoints(db):
+    first = await _checkpoint(db, 1, 1, 7)
+    grade = await _rollup(db, 1)
+    grade.mark_sum = 100
+    await db.commit()
+
+    await checkpoint_service.update_checkpoint(db, first.id, CheckpointUpdate(mark=8))
+    assert (await _rollup(db, 1)).mark_sum == 8
+
+    await checkpoint_service.delete_checkpoint(db, first.id)
+    assert await _rollup(db, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_term_grades_rank_across_term_and_within_case(db):
+    await _checkpoint(db, 1, 1, 5)
+    await _checkpoint(db, 2, 1, 8)
+    await _checkpoint(db, 2, 2, 4)
+    await _checkpoint(db, 3, 1, 6, university_mark=3)
+
+    grades = await grade_service.get_term_grades(db, 1)
+
+    assert [(g["team_title"], g["mark_sum"], g["rank"], g["case_rank"]) for g in grades] == [
+        ("Beta", 12, 1, 1),
+        ("Gamma", 6, 2, 1),
+        ("Alpha", 5, 3, 2),
+    ]
+    assert grades[0]["mark_avg"] == 6
+    assert grades[1]["university_mark_avg"] == 3
+    assert await grade_service.get_term_grades(db, 99) is None
+
+
+@pytest.mark.asyncio
+async def test_case_leaderboard_includes_teams_without_checkpoints(db):
+    await _checkpoint(db, 2, 1, 8)
+
+    leaderboard = await grade_service.get_case_leaderboard(db, 1)
+
+    assert [(g["team_title"], g["checkpoints"], g["rank"]) for g in leaderboard] == [("Beta", 1, 1), ("Alpha", 0, 2)]
+    assert leaderboard[1]["mark_avg"] is None
+    assert await grade_service.get_case_leaderboard(db, 99) is None
+
+
+@pytest.mark.asyncio
+async def test_rebuild_recomputes_rollups_from_checkpoints(db):
+    await _checkpoint(db, 1, 1, 5)
+    await _checkpoint(db, 3, 1, 6)
+    grade = await _rollup(db, 1)
+    grade.mark_sum = 100
+    await db.commit()
+
+    rebuilt = await grade_service.rebuild_team_grades(db, term_id=1)
+    await db.commit()
+
+    assert rebuilt == 2
+    assert (await _rollup(db, 1)).mark_sum == 5
+    assert (await _rollup(db, 2)) is None
+
+
+async def _final_marks(db):
+    result = await db.execute(select(Team.id, Team.final_mark).order_by(Team.id).execution_options(populate_existing=True))
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_writes_update_final_mark_of_affected_team_only(db, monkeypatch):
+    monkeypatch.setattr(settings, "FINAL_MARK_FORMULA", "sum")
+    monkeypatch.setattr(settings, "FINAL_MARK_UNIVERSITY_WEIGHT", 0.5)
+    first = await _checkpoint(db, 1, 1, 7, university_mark=4)
+    await _checkpoint(db, 1, 2, 9, university_mark=2)
+
+    assert await _final_marks(db) == {1: 19, 2: 0, 3: 0}
+
+    await checkpoint_service.delete_checkpoint(db, first.id)
+
+    assert await _final_marks(db) == {1: 10, 2: 0, 3: 0}
+
+
+@pytest.mark.asyncio
+async def test_manual_formula_leaves_final_mark_alone(db, monkeypatch):
+    monkeypatch.setattr(settings, "FINAL_MARK_FORMULA", "manual")
+    team = await db.get(Team, 1)
+    team.final_mark = 42
+    await db.commit()
+
+    await _checkpoint(db, 1, 1, 7)
+
+    assert (await _final_marks(db))[1] == 42
+    with pytest.raises(ValueError, match="manually"):
+        await grade_service.recompute_final_marks(db, term_id=1)
+
+
+@pytest.mark.asyncio
+async def test_final_mark_cannot_be_set_by_hand_while_formula_is_active(db, monkeypatch):
+    monkeypatch.setattr(settings, "FINAL_MARK_FORMULA", "sum")
+
+    with pytest.raises(ValueError, match="computed from checkpoints"):
+        await team_service.update_team(db, 1, TeamUpdate(final_mark=42))
+    assert (await team_service.update_team(db, 1, TeamUpdate(title="Renamed"))).title == "Renamed"
+
+
+def test_unknown_final_mark_formula_is_rejected_at_startup():
+    with pytest.raises(ValidationError):
+        Settings(FINAL_MARK_FORMULA="summ")
+
+
+@pytest.mark.asyncio
+async def test_recompute_final_marks_applies_new_formula_to_term(db, monkeypatch):
+    await _checkpoint(db, 1, 1, 7)
+    await _checkpoint(db, 1, 2, 8)
+    await _checkpoint(db, 3, 1, 5)
+    monkeypatch.setattr(settings, "FINAL_MARK_FORMULA", "average")
+
+    updated = await grade_service.recompute_final_marks(db, term_id=1)
+    await db.commit()
+
+    assert updated == 3
+    assert await _final_marks(db) == {1: 8, 2: 0, 3: 5}
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.models
+from app.db.session import Base
+from app.models.job import Job, JobStatus
+from app.services import job_service
+
+
+@pytest.mark.asyncio
+async def test_enqueue_job_persists_and_submits(monkeypatch, mock_session):
+    submitted = []
+    monkeypatch.setattr(job_service.job_runner, "submit", submitted.append)
+    monkeypatch.setitem(job_service._handlers, "test.kind", AsyncMock())
+
+    async def refresh(job):
+        job.id = 42
+
+    mock_session.refresh.side_effect = refresh
+
+    job = await job_service.enqueue_job(mock_session, "test.kind", {"team_id": 1})
+
+    assert isinstance(job, Job)
+    assert job.status == JobStatus.pending
+    mock_session.add.assert_called_once_with(job)
+    assert mock_session.commit.await_count == 1
+    assert submitted == [42]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_job_rejects_unknown_kind(mock_session):
+    with pytest.raises(ValueError, match="Unknown job kind"):
+        await job_service.enqueue_job(mock_session, "does.not.exist", {})
+
+    mock_session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_job_status_reads_progress_from_the_row(mock_session, result_stub):
+    job = Job(id=7, kind="meeting_schedule.create", status=JobStatus.running, payload={}, progress=500, total=1200, attempts=1, created_at=datetime(2024, 9, 1))
+    mock_session.execute.return_value = result_stub([job])
+
+    status = await job_service.get_job_status(mock_session, job_id=7)
+
+    assert status.progress == 500
+    assert status.total == 1200
+
+
+@pytest.mark.asyncio
+async def test_get_job_status_returns_none_when_not_found(mock_session, result_stub):
+    mock_session.execute.return_value = result_stub([])
+
+    assert await job_service.get_job_status(mock_session, job_id=1) is None
+
+
+@pytest.mark.asyncio
+async def test_run_job_reclaims_running_jobs_with_expired_lease(monkeypatch, sqlite_session):
+    monkeypatch.setattr(job_service, "SessionLocal", async_sessionmaker(sqlite_session.bind, expire_on_commit=False))
+    monkeypatch.setattr(job_service.settings, "JOB_LEASE_SECONDS", 60)
+    ran = []
+
+    async def handler(db, payload, progress):
+        ran.append(payload["n"])
+        return {"ok": True}
+
+    monkeypatch.setitem(job_service._handlers, "test.kind", handler)
+    now = datetime.now()
+    sqlite_session.add_all([
+        Job(id=1, kind="test.kind", payload={"n": 1}, status=JobStatus.running, started_at=now - timedelta(hours=1), heartbeat_at=now - timedelta(minutes=5)),
+        Job(id=2, kind="test.kind", payload={"n": 2}, status=JobStatus.running, started_at=now - timedelta(hours=1), heartbeat_at=now),
+        Job(id=3, kind="test.kind", payload={"n": 3}, status=JobStatus.pending),
+        Job(id=4, kind="test.kind", payload={"n": 4}, status=JobStatus.done),
+        Job(id=5, kind="test.kind", payload={"n": 5}, status=JobStatus.running, started_at=now - timedelta(hours=1), attempts=3),
+    ])
+    await sqlite_session.commit()
+    submitted = []
+    monkeypatch.setattr(job_service.job_runner, "submit", submitted.append)
+
+    await job_service.job_runner.requeue()
+    for job_id in submitted:
+        await job_service.run_job(job_id)
+    await job_service.run_job(2)
+
+    assert submitted == [1, 3]
+    assert ran == [1, 3]
+    statuses = await sqlite_session.execute(select(Job.id, Job.status).order_by(Job.id).execution_options(populate_existing=True))
+    assert dict(statuses.all()) == {
+        1: JobStatus.done, 2: JobStatus.running, 3: JobStatus.done, 4: JobStatus.done, 5: JobStatus.failed,
+    }
+    assert await sqlite_session.scalar(select(Job.attempts).where(Job.id == 1)) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_job_marks_job_failed_when_handler_raises(monkeypatch, sqlite_session):
+    monkeypatch.setattr(job_service, "SessionLocal", async_sessionmaker(sqlite_session.bind, expire_on_commit=False))
+
+    async def handler(db, payload, progress):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(job_service._handlers, "test.broken", handler)
+    sqlite_session.add(Job(id=1, kind="test.broken", payload={}, status=JobStatus.pending))
+    await sqlite_session.commit()
+
+    await job_service.run_job(1)
+
+    job = await sqlite_session.scalar(select(Job).where(Job.id == 1).execution_options(populate_existing=True))
+    assert (job.status, job.error, job.attempts) == (JobStatus.failed, "boom", 1)
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_running_job_writes_throttled_progress_to_its_row(monkeypatch, tmp_path):
+    # A file database, so the reporter and the handler use separate connections.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(job_service, "SessionLocal", sessions)
+    monkeypatch.setattr(job_service.settings, "JOB_PROGRESS_INTERVAL", 0.01)
+    seen = []
+
+    async def handler(db, payload, progress):
+        await progress(3, 10)
+        await asyncio.sleep(0.05)
+        async with sessions() as other:
+            seen.append((await other.get(Job, 1)).progress)
+        await progress(10, 10)
+        return None
+
+    monkeypatch.setitem(job_service._handlers, "test.kind", handler)
+    async with sessions() as db:
+        db.add(Job(id=1, kind="test.kind", payload={}, status=JobStatus.pending))
+        await db.commit()
+
+    await job_service.run_job(1)
+
+    assert seen == [3]
+    async with sessions() as db:
+        job = await db.get(Job, 1)
+    assert (job.status, job.progress, job.total) == (JobStatus.done, 10, 10)
+    await engine.dispose()
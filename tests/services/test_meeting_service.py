@@ -3,14 +3,17 @@ from datetime import date, time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
 
 from app.models.meeting import Meeting, MeetingUser
 from app.models.meeting_schedule import MeetingSchedule
 from app.models.team import Team
 from app.models.case import Case
 from app.models.term import Term, SeasonEnum
-from app.schemas.meeting import MeetingCreate, MeetingUpdate
-from app.schemas.meeting_user import MeetingUserCreate
+from app.models.user import User
+from app.schemas.meeting import MeetingCreate, MeetingUpdate, MeetingOccurrenceMaterialize
+from app.schemas.meeting_user import MeetingAttendeesUpdate, MeetingUserCreate
 from app.schemas.meeting_schedule import (
     MeetingScheduleCreate,
     MeetingScheduleUpdate,
@@ -221,7 +224,7 @@ async def test_create_meeting_schedule_generates_meetings(monkeypatch, mock_sess
     existing_schedules_result = MagicMock()
     existing_schedules_result.scalars.return_value = []
 
-    def execute_side_effect(query):
+    def execute_side_effect(query, *args):
         text = str(query)
         if "FROM teams" in text or "Team" in text:
             return team_result
@@ -334,7 +337,7 @@ async def test_create_meeting_schedule_deactivates_existing_schedules(
 
     call_count = 0
 
-    def execute_side_effect(query):
+    def execute_side_effect(query, *args):
         nonlocal call_count
         call_count += 1
         if call_count == 1:
@@ -360,7 +363,7 @@ async def test_create_meeting_schedule_deactivates_existing_schedules(
     assert existing_schedule.active is False
 
 
-def test_generate_meetings_from_schedule_weekly():
+def test_schedule_occurrences_weekly():
     schedule = MeetingSchedule(
         team_id=1,
         start_date=date(2024, 9, 1),
@@ -371,19 +374,15 @@ def test_generate_meetings_from_schedule_weekly():
     schedule.id = 1
     end_date = date(2024, 9, 15)
 
-    meetings = meeting_service._generate_meetings_from_schedule(
-        schedule, end_date, team_id=1
-    )
+    occurrences = list(meeting_service._schedule_occurrences(schedule, end_date))
 
-    assert len(meetings) == 2
-    assert meetings[0].date_time.date() == date(2024, 9, 2)
-    assert meetings[1].date_time.date() == date(2024, 9, 9)
-    assert all(m.team_id == 1 for m in meetings)
-    assert all(m.schedule_id == 1 for m in meetings)
-    assert all(m.date_time.time() == time(12, 0) for m in meetings)
+    assert len(occurrences) == 2
+    assert occurrences[0].date() == date(2024, 9, 2)
+    assert occurrences[1].date() == date(2024, 9, 9)
+    assert all(o.time() == time(12, 0) for o in occurrences)
 
 
-def test_generate_meetings_from_schedule_biweekly():
+def test_schedule_occurrences_biweekly():
     schedule = MeetingSchedule(
         team_id=1,
         start_date=date(2024, 9, 1),
@@ -394,15 +393,65 @@ def test_generate_meetings_from_schedule_biweekly():
     schedule.id = 1
     end_date = date(2024, 9, 20)
 
-    meetings = meeting_service._generate_meetings_from_schedule(
-        schedule, end_date, team_id=1
-    )
+    occurrences = list(meeting_service._schedule_occurrences(schedule, end_date))
+
+    assert len(occurrences) == 2
+    assert occurrences[0].date() == date(2024, 9, 4)
+    assert occurrences[1].date() == date(2024, 9, 18)
+
+
+@pytest.mark.asyncio
+async def test_insert_schedule_meetings_inserts_in_batches_and_links_chain(monkeypatch, mock_session):
+    monkeypatch.setattr(meeting_service, "MEETING_INSERT_BATCH_SIZE", 2)
+    schedule = MeetingSchedule(team_id=5, start_date=date(2024, 9, 1), day_of_week=0, time=time(12, 0), interval_weeks=1)
+    schedule.id = 9
+    inserted = [MagicMock(), MagicMock()]
+    inserted[0].scalars.return_value.all.return_value = [101, 102]
+    inserted[1].scalars.return_value.all.return_value = [103]
+    mock_session.execute = AsyncMock(side_effect=[inserted[0], None, inserted[1], None])
+    progress = AsyncMock()
+
+    total = await meeting_service.insert_schedule_meetings(
+        mock_session,
+        [schedule],
+        date(2024, 9, 23),
+        previous_ids={9: 50},
+        after=datetime.datetime(2024, 9, 2, 12, 0),
+        progress=progress,
+    )
+
+    assert total == 3
+    insert_rows = mock_session.execute.await_args_list[0].args[1]
+    assert insert_rows[0] == {
+        "team_id": 5, "schedule_id": 9, "date_time": datetime.datetime(2024, 9, 9, 12, 0), "archived": False,
+    }
+    assert mock_session.execute.await_args_list[1].args[1] == [
+        {"id": 101, "previous_meeting_id": 50},
+        {"id": 102, "previous_meeting_id": 101},
+    ]
+    assert mock_session.execute.await_args_list[3].args[1] == [
+        {"id": 103, "previous_meeting_id": 102},
+    ]
+    assert [c.args for c in progress.await_args_list] == [(2, 3), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_insert_schedule_meetings_chains_each_schedule_separately(mock_session):
+    schedules = [
+        MeetingSchedule(id=1, team_id=1, start_date=date(2024, 9, 2), day_of_week=0, time=time(10), interval_weeks=1),
+        MeetingSchedule(id=2, team_id=2, start_date=date(2024, 9, 3), day_of_week=1, time=time(11), interval_weeks=1),
+    ]
+    inserted = MagicMock()
+    inserted.scalars.return_value.all.return_value = [11, 12, 21, 22]
+    mock_session.execute = AsyncMock(side_effect=[inserted, None])
+
+    total = await meeting_service.insert_schedule_meetings(mock_session, schedules, date(2024, 9, 10))
 
-    assert len(meetings) == 2
-    assert meetings[0].date_time.date() == date(2024, 9, 4)
-    assert meetings[1].date_time.date() == date(2024, 9, 18)
-    assert all(m.team_id == 1 for m in meetings)
-    assert all(m.schedule_id == 1 for m in meetings)
+    assert total == 4
+    assert mock_session.execute.await_args_list[1].args[1] == [
+        {"id": 12, "previous_meeting_id": 11},
+        {"id": 22, "previous_meeting_id": 21},
+    ]
 
 
 @pytest.mark.asyncio
@@ -456,7 +505,7 @@ async def test_update_meeting_schedule_updates_fields(
 
     call_count = 0
 
-    def execute_side_effect(query):
+    def execute_side_effect(query, *args):
         nonlocal call_count
         call_count += 1
         if call_count == 1:
@@ -507,35 +556,16 @@ async def test_update_meeting_schedule_deletes_future_meetings(
     schedule.id = 1
     schedule.team = team
 
-    future_meeting1 = Meeting(
-        team_id=1,
-        schedule_id=1,
-        date_time=datetime.datetime(2024, 10, 1, 12, 0),
-    )
-    future_meeting2 = Meeting(
-        team_id=1,
-        schedule_id=1,
-        date_time=datetime.datetime(2024, 10, 8, 12, 0),
-    )
-
     schedule_result = MagicMock()
     schedule_result.scalar_one_or_none.return_value = schedule
 
-    future_meetings_result = MagicMock()
-    future_meetings_result.scalars.return_value = [
-        future_meeting1,
-        future_meeting2,
-    ]
-
     call_count = 0
 
-    def execute_side_effect(query):
+    def execute_side_effect(query, *args):
         nonlocal call_count
         call_count += 1
         if call_count == 1:
             return schedule_result
-        elif call_count == 2:
-            return future_meetings_result
         return MagicMock()
 
     mock_session.execute = AsyncMock(side_effect=execute_side_effect)
@@ -546,7 +576,12 @@ async def test_update_meeting_schedule_deletes_future_meetings(
         mock_session, schedule_id=1, data=update_data
     )
 
-    assert mock_session.delete.await_count == 2
+    delete_stmt = mock_session.execute.await_args_list[1].args[0]
+    sql = str(delete_stmt)
+    assert sql.startswith("DELETE FROM meetings")
+    assert "meetings.schedule_id = :schedule_id_1" in sql
+    assert "meetings.date_time > :date_time_1" in sql
+    mock_session.delete.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -576,3 +611,183 @@ async def test_update_meeting_schedule_no_update_when_empty_data(
 
     assert result is schedule
     assert mock_session.commit.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_meetings_calendar_groups_by_day_with_team_titles(mock_session):
+    first = Meeting(id=1, team_id=1, date_time=datetime.datetime(2024, 9, 2, 10, 0))
+    second = Meeting(id=2, team_id=2, date_time=datetime.datetime(2024, 9, 2, 12, 0))
+    third = Meeting(id=3, team_id=1, date_time=datetime.datetime(2024, 9, 4, 10, 0))
+    rows = MagicMock()
+    rows.all.return_value = [(first, "Alpha"), (second, "Beta"), (third, "Alpha")]
+    mock_session.execute.return_value = rows
+
+    days = await meeting_service.get_meetings_calendar(
+        mock_session, date(2024, 9, 2), date(2024, 9, 8), team_ids=[1, 2]
+    )
+
+    assert [day.date for day in days] == [date(2024, 9, 2), date(2024, 9, 4)]
+    assert [m.team_title for m in days[0].meetings] == ["Alpha", "Beta"]
+    assert days[1].meetings[0].id == 3
+    mock_session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_meetings_calendar_rejects_invalid_range(mock_session):
+    with pytest.raises(ValueError):
+        await meeting_service.get_meetings_calendar(
+            mock_session, date(2024, 9, 8), date(2024, 9, 2)
+        )
+    with pytest.raises(ValueError):
+        await meeting_service.get_meetings_calendar(
+            mock_session, date(2024, 1, 1), date(2024, 12, 31)
+        )
+
+    mock_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_team_meetings_feed_builds_rule_overrides_and_caches(monkeypatch, mock_session, result_stub):
+    meeting_service.team_feed_cache.invalidate()
+    term = Term(start_date=date(2024, 9, 1), end_date=date(2024, 9, 30), year=2024, season=SeasonEnum.autumn)
+    case = Case(term_id=1, user_id=1, title="Case", description=None)
+    case.term = term
+    team = Team(id=1, title="Alpha", case_id=1, workspace_link=None, final_mark=0)
+    team.case = case
+    schedule = MeetingSchedule(id=4, team_id=1, start_date=date(2024, 9, 1), day_of_week=0, time=time(12, 0), interval_weeks=1)
+    meetings = [
+        Meeting(id=10, team_id=1, schedule_id=4, date_time=datetime.datetime(2024, 9, 2, 12, 0)),
+        Meeting(id=11, team_id=1, schedule_id=4, date_time=datetime.datetime(2024, 9, 9, 12, 0), summary="Demo"),
+        Meeting(id=12, team_id=1, schedule_id=None, date_time=datetime.datetime(2024, 9, 20, 9, 0)),
+    ]
+    mock_session.execute = AsyncMock(side_effect=[result_stub([team]), result_stub(meetings)])
+    monkeypatch.setattr(meeting_service, "get_team_schedule", AsyncMock(return_value=schedule))
+
+    etag, body = await meeting_service.get_team_meetings_feed(mock_session, team_id=1)
+
+    assert "RRULE:FREQ=WEEKLY;INTERVAL=1;BYDAY=MO;UNTIL=20240930T235959" in body
+    assert "EXDATE:20240916T120000,20240923T120000,20240930T120000" in body
+    assert "RECURRENCE-ID:20240909T120000" in body
+    assert "UID:meeting-12@reqroute" in body
+    assert "UID:meeting-10@reqroute" not in body
+
+    cached = await meeting_service.get_team_meetings_feed(mock_session, team_id=1)
+
+    assert cached == (etag, body)
+    assert mock_session.execute.await_count == 2
+    meeting_service.team_feed_cache.invalidate()
+
+
+def _schedule_with_term(end_date):
+    term = Term(start_date=date(2024, 9, 1), end_date=end_date, year=2024, season=SeasonEnum.autumn)
+    case = Case(term_id=1, user_id=1, title="Case", description=None)
+    case.term = term
+    team = Team(id=1, title="Alpha", case_id=1, workspace_link=None, final_mark=0)
+    team.case = case
+    schedule = MeetingSchedule(id=3, team_id=1, start_date=date(2024, 9, 1), day_of_week=0, time=time(12, 0), interval_weeks=1, active=True)
+    schedule.team = team
+    return schedule
+
+
+@pytest.mark.asyncio
+async def test_create_meeting_schedule_skips_generation_in_lazy_mode(monkeypatch, mock_session, result_stub):
+    schedule = _schedule_with_term(date(2024, 12, 31))
+    existing_schedules_result = MagicMock()
+    existing_schedules_result.scalars.return_value = []
+    mock_session.execute = AsyncMock(side_effect=[result_stub([schedule.team]), existing_schedules_result])
+    monkeypatch.setattr(meeting_service.settings, "LAZY_MEETINGS", True)
+
+    await meeting_service.create_meeting_schedule(
+        mock_session,
+        MeetingScheduleCreate(team_id=1, start_date=date(2024, 9, 1), day_of_week=0, time=time(12, 0), interval_weeks=1),
+    )
+
+    mock_session.add_all.assert_not_called()
+    assert mock_session.commit.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_occurrences_merges_virtual_occurrences(monkeypatch, mock_session, result_stub):
+    schedule = _schedule_with_term(date(2024, 9, 30))
+    materialized = Meeting(id=8, team_id=1, schedule_id=3, date_time=datetime.datetime(2024, 9, 9, 12, 0), summary="Demo")
+    mock_session.execute = AsyncMock(side_effect=[result_stub([schedule]), result_stub([materialized])])
+    monkeypatch.setattr(meeting_service.settings, "LAZY_MEETINGS", True)
+
+    occurrences = await meeting_service.get_schedule_occurrences(
+        mock_session, schedule_id=3, date_from=date(2024, 9, 1), date_to=date(2024, 9, 20)
+    )
+
+    assert [(o.id, o.date_time.day, o.virtual) for o in occurrences] == [
+        (None, 2, True),
+        (8, 9, False),
+        (None, 16, True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_materialize_schedule_occurrence_rejects_dates_off_the_rule(mock_session, result_stub):
+    schedule = _schedule_with_term(date(2024, 9, 30))
+    mock_session.execute = AsyncMock(return_value=result_stub([schedule]))
+
+    with pytest.raises(ValueError, match="is not an occurrence"):
+        await meeting_service.materialize_schedule_occurrence(
+            mock_session,
+            schedule_id=3,
+            data=MeetingOccurrenceMaterialize(date_time=datetime.datetime(2024, 9, 3, 12, 0)),
+        )
+
+    mock_session.add.assert_not_called()
+    lock = mock_session.execute.await_args_list[0].args[0]
+    assert "FOR NO KEY UPDATE" in str(lock.compile(dialect=postgresql.dialect()))
+
+
+async def _seed_meeting_with_users(db):
+    db.add_all([
+        *(User(id=i, full_name=f"U{i}", email=f"u{i}@example.com", password="x") for i in range(1, 5)),
+        Term(id=1, year=2024, season=SeasonEnum.autumn),
+        Case(id=1, term_id=1, user_id=1, title="Case"),
+        Team(id=1, case_id=1, title="Alpha"),
+        Meeting(id=1, team_id=1, date_time=datetime.datetime(2024, 9, 2, 10)),
+        MeetingUser(meeting_id=1, user_id=1),
+        MeetingUser(meeting_id=1, user_id=2),
+    ])
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_set_meeting_attendees_applies_diff(sqlite_session):
+    await _seed_meeting_with_users(sqlite_session)
+
+    result = await meeting_service.set_meeting_attendees(
+        sqlite_session, 1, MeetingAttendeesUpdate(user_ids=[2, 3, 4, 3])
+    )
+    repeated = await meeting_service.set_meeting_attendees(
+        sqlite_session, 1, MeetingAttendeesUpdate(user_ids=[2, 3, 4])
+    )
+
+    assert result == {"meeting_id": 1, "user_ids": [2, 3, 4], "added": 2, "removed": 1}
+    assert (repeated["added"], repeated["removed"]) == (0, 0)
+    assert await meeting_service.set_meeting_attendees(sqlite_session, 99, MeetingAttendeesUpdate(user_ids=[])) is None
+
+
+@pytest.mark.asyncio
+async def test_set_meeting_attendees_rejects_unknown_users(sqlite_session):
+    await _seed_meeting_with_users(sqlite_session)
+
+    with pytest.raises(ValueError, match="Users not found: 42"):
+        await meeting_service.set_meeting_attendees(sqlite_session, 1, MeetingAttendeesUpdate(user_ids=[3, 42]))
+
+    result = await sqlite_session.execute(
+        select(MeetingUser.user_id).where(MeetingUser.meeting_id == 1).order_by(MeetingUser.user_id)
+    )
+    assert result.scalars().all() == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_link_meeting_user_returns_existing_link_on_retry(sqlite_session):
+    await _seed_meeting_with_users(sqlite_session)
+
+    link = await meeting_service.link_meeting_user(sqlite_session, MeetingUserCreate(meeting_id=1, user_id=2))
+
+    assert (link.meeting_id, link.user_id) == (1, 2)
+    assert await sqlite_session.scalar(select(func.count()).select_from(MeetingUser)) == 2
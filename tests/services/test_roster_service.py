@@ -0,0 +1,102 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from app.models.case import Case
+from app.models.student import Student
+from app.models.team import Team
+from app.models.team_membership import TeamMembership
+from app.models.term import SeasonEnum, Term
+from app.models.user import User
+from app.services import roster_service
+
+
+async def _body(text: str):
+    yield text.encode("utf-8")
+
+
+@pytest_asyncio.fixture
+async def db(sqlite_session):
+    sqlite_session.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn),
+        Case(id=1, term_id=1, user_id=1, title="Case A"),
+        Case(id=2, term_id=1, user_id=1, title="Case B"),
+        Team(id=1, case_id=1, title="Alpha"),
+        Team(id=2, case_id=1, title="Beta"),
+        Team(id=3, case_id=2, title="Alpha"),
+        Student(id=1, full_name="Existing Student"),
+        TeamMembership(student_id=1, team_id=2, group="G1"),
+    ])
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+async def _count(db, model):
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_import_roster_creates_students_and_memberships(db):
+    csv = (
+        "full_name,group,team_id,role\n"
+        "Ann Lee,G1,1,Lead\n"
+        "Bob Ray,G1,1,\n"
+        "Ann Lee,G1,2,Dev\n"
+        "Existing Student,G1,2,\n"
+        "Existing Student,G1,1,\n"
+    )
+
+    report = await roster_service.import_roster(db, _body(csv))
+
+    assert report["applied"] is True
+    assert (report["rows"], report["students_created"], report["students_matched"]) == (5, 2, 1)
+    assert (report["memberships_created"], report["memberships_skipped"]) == (4, 1)
+    assert await _count(db, Student) == 3
+    assert await _count(db, TeamMembership) == 5
+    ann = await db.scalar(select(Student.id).where(Student.full_name == "Ann Lee"))
+    teams = await db.execute(select(TeamMembership.team_id).where(TeamMembership.student_id == ann).order_by(TeamMembership.team_id))
+    assert teams.scalars().all() == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_import_roster_dry_run_reports_conflicts_without_writing(db):
+    csv = (
+        "full_name,group,team\n"
+        "Ann Lee,G1,Alpha\n"
+        "Bob Ray,G1,Gamma\n"
+        ",G1,Beta\n"
+        "Cid Moe,G2,Beta\n"
+        "Cid Moe,G2,Beta\n"
+    )
+
+    report = await roster_service.import_roster(db, _body(csv), dry_run=True)
+
+    assert report["applied"] is False
+    assert [(issue["line"], issue["kind"]) for issue in report["errors"]] == [
+        (4, "invalid_row"),
+        (2, "ambiguous_team"),
+        (3, "unknown_team"),
+    ]
+    assert [(issue["line"], issue["kind"]) for issue in report["warnings"]] == [(6, "duplicate_row")]
+    assert await _count(db, Student) == 1
+
+
+@pytest.mark.asyncio
+async def test_import_roster_with_errors_writes_nothing_and_case_scopes_titles(db):
+    blocked = await roster_service.import_roster(db, _body("full_name,group,team\nAnn Lee,G1,Missing\n"))
+    scoped = await roster_service.import_roster(db, _body("full_name,group,team\nAnn Lee,G1,Alpha\n"), case_id=2)
+
+    assert blocked["applied"] is False
+    assert scoped["applied"] is True
+    assert await db.scalar(select(TeamMembership.team_id).join(Student).where(Student.full_name == "Ann Lee")) == 3
+
+
+@pytest.mark.asyncio
+async def test_import_roster_rejects_missing_columns_and_oversized_files(db, monkeypatch):
+    with pytest.raises(ValueError, match="missing required columns: group"):
+        await roster_service.import_roster(db, _body("full_name,team_id\nAnn,1\n"))
+
+    monkeypatch.setattr(roster_service.settings, "ROSTER_IMPORT_MAX_ROWS", 1)
+    with pytest.raises(ValueError, match="must not exceed 1 rows"):
+        await roster_service.import_roster(db, _body("full_name,group,team_id\nA,G,1\nB,G,1\n"))
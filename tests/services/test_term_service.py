@@ -0,0 +1,206 @@
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.models.assignment import Assignment
+from app.models.case import Case, CaseStatus
+from app.models.meeting import Meeting
+from app.models.meeting_schedule import MeetingSchedule
+from app.models.student import Student
+from app.models.team import Team
+from app.models.team_membership import TeamMembership
+from app.models.term import SeasonEnum, Term
+from app.models.user import User
+from app.models.checkpoint import Checkpoint
+from app.schemas.assignment import AssignmentCreate
+from app.schemas.team import TeamUpdate
+from app.schemas.term import TermClone, TermUpdate
+from app.services import assignment_service, case_service, team_service, term_service
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    term_service.term_stats_cache.invalidate()
+    yield
+    term_service.term_stats_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_get_term_stats_aggregates_term_hierarchy(sqlite_session):
+    now = datetime.now()
+    sqlite_session.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn),
+        Term(id=2, year=2025, season=SeasonEnum.spring),
+        Case(id=1, term_id=1, user_id=1, title="A", status=CaseStatus.active),
+        Case(id=2, term_id=1, user_id=1, title="B", status=CaseStatus.active),
+        Case(id=3, term_id=1, user_id=1, title="C", status=CaseStatus.done),
+        Case(id=4, term_id=2, user_id=1, title="Other term"),
+        Team(id=1, case_id=1, title="T1"),
+        Team(id=2, case_id=3, title="T2"),
+        Team(id=3, case_id=4, title="Other"),
+        Student(id=1, full_name="S1"),
+        Student(id=2, full_name="S2"),
+        TeamMembership(student_id=1, team_id=1, group="G"),
+        TeamMembership(student_id=2, team_id=1, group="G"),
+        TeamMembership(student_id=2, team_id=2, group="G"),
+        TeamMembership(student_id=1, team_id=3, group="G"),
+        Meeting(id=1, team_id=1, date_time=now - timedelta(days=7)),
+        Meeting(id=2, team_id=1, date_time=now + timedelta(days=7)),
+        Meeting(id=3, team_id=2, date_time=now - timedelta(days=1)),
+        Meeting(id=4, team_id=3, date_time=now - timedelta(days=1)),
+        Assignment(meeting_id=1, text="done", completed=True),
+        Assignment(meeting_id=1, text="open", completed=False),
+        Assignment(meeting_id=3, text="untouched", completed=None),
+        Assignment(meeting_id=4, text="other term", completed=True),
+    ])
+    await sqlite_session.commit()
+
+    stats = await term_service.get_term_stats(sqlite_session, 1)
+
+    assert stats.cases == 3
+    assert stats.cases_by_status == {"draft": 0, "active": 2, "voting in progress": 0, "done": 1}
+    assert (stats.teams, stats.students) == (2, 2)
+    assert (stats.meetings_scheduled, stats.meetings_held) == (3, 2)
+    assert (stats.assignments_completed, stats.assignments_open) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_get_term_stats_is_cached_until_related_tables_change(sqlite_session):
+    sqlite_session.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn),
+    ])
+    await sqlite_session.commit()
+
+    first = await term_service.get_term_stats(sqlite_session, 1)
+    assert await term_service.get_term_stats(sqlite_session, 1) is first
+
+    sqlite_session.add(Case(term_id=1, user_id=1, title="New"))
+    await sqlite_session.commit()
+
+    assert (await term_service.get_term_stats(sqlite_session, 1)).cases == 1
+    assert await term_service.get_term_stats(sqlite_session, 99) is None
+
+
+async def _seed_clone_source(db):
+    db.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn, start_date=date(2024, 9, 2), end_date=date(2024, 12, 20)),
+        Case(id=1, term_id=1, user_id=1, title="A", description="First", status=CaseStatus.done),
+        Case(id=2, term_id=1, user_id=1, title="A", status=CaseStatus.active),
+        Team(id=1, case_id=1, title="T1", final_mark=9, workspace_link="https://old"),
+        Team(id=2, case_id=2, title="T2"),
+        MeetingSchedule(id=1, team_id=1, start_date=date(2024, 9, 9), day_of_week=0, time=time(10), interval_weeks=1),
+        MeetingSchedule(id=2, team_id=2, start_date=date(2024, 9, 2), day_of_week=2, time=time(12), interval_weeks=2, active=False),
+    ])
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_clone_term_copies_cases_teams_and_active_schedules(sqlite_session, monkeypatch):
+    monkeypatch.setattr(term_service.settings, "LAZY_MEETINGS", False)
+    await _seed_clone_source(sqlite_session)
+
+    cloned = await term_service.clone_term(sqlite_session, 1, TermClone(
+        year=2025, season=SeasonEnum.spring, start_date=date(2025, 2, 3), end_date=date(2025, 3, 3),
+    ))
+
+    new_term = cloned["term"].id
+    assert (cloned["cases"], cloned["teams"], cloned["schedules"], cloned["meetings"]) == (2, 2, 1, 4)
+    cases = (await sqlite_session.execute(
+        select(Case.description, Case.status).where(Case.term_id == new_term).order_by(Case.id)
+    )).all()
+    assert cases == [("First", CaseStatus.draft), (None, CaseStatus.draft)]
+    teams = (await sqlite_session.execute(
+        select(Team.title, Team.final_mark, Team.workspace_link, Case.description)
+        .join(Case).where(Case.term_id == new_term).order_by(Team.id)
+    )).all()
+    assert teams == [("T1", 0, None, "First"), ("T2", 0, None, None)]
+    schedule = (await sqlite_session.execute(select(MeetingSchedule).order_by(MeetingSchedule.id.desc()))).scalars().first()
+    assert schedule.start_date == date(2025, 2, 10)
+    meetings = (await sqlite_session.execute(
+        select(Meeting.id, Meeting.date_time, Meeting.previous_meeting_id)
+        .where(Meeting.schedule_id == schedule.id).order_by(Meeting.date_time)
+    )).all()
+    assert [m.date_time.date() for m in meetings] == [date(2025, 2, 10), date(2025, 2, 17), date(2025, 2, 24), date(2025, 3, 3)]
+    assert [m.previous_meeting_id for m in meetings] == [None, meetings[0].id, meetings[1].id, meetings[2].id]
+
+
+@pytest.mark.asyncio
+async def test_clone_term_without_teams_and_validation(sqlite_session):
+    await _seed_clone_source(sqlite_session)
+
+    cloned = await term_service.clone_term(sqlite_session, 1, TermClone(
+        year=2025, season=SeasonEnum.spring, include_teams=False, include_schedules=False,
+    ))
+
+    assert (cloned["cases"], cloned["teams"], cloned["schedules"]) == (2, 0, 0)
+    assert await term_service.clone_term(sqlite_session, 99, TermClone(year=2025, season=SeasonEnum.spring)) is None
+    with pytest.raises(ValueError, match="start_date and end_date"):
+        await term_service.clone_term(sqlite_session, 1, TermClone(year=2025, season=SeasonEnum.spring))
+
+
+@pytest.mark.asyncio
+async def test_archive_ended_terms_hides_them_from_default_listings(sqlite_session, monkeypatch):
+    monkeypatch.setattr(term_service.settings, "TERM_ARCHIVE_AFTER_DAYS", 30)
+    sqlite_session.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn, end_date=date(2024, 12, 20)),
+        Term(id=2, year=2025, season=SeasonEnum.spring, end_date=date(2025, 5, 30)),
+        Term(id=3, year=2025, season=SeasonEnum.autumn),
+        Case(id=1, term_id=1, user_id=1, title="Old"),
+        Case(id=2, term_id=2, user_id=1, title="Current"),
+    ])
+    await sqlite_session.commit()
+
+    assert await term_service.archive_ended_terms(sqlite_session, today=date(2025, 6, 10)) == [1]
+
+    terms = await term_service.get_terms_filtered(sqlite_session, {})
+    assert [term.id for term in terms["items"]] == [2, 3]
+    everything = await term_service.get_terms_filtered(sqlite_session, {"include_archived": "true"})
+    assert everything["total"] == 3
+    cases = await case_service.get_cases_filtered(sqlite_session, {"title_contains": "old"})
+    assert [case.title for case in cases["items"]] == []
+    cases = await case_service.get_cases_filtered(sqlite_session, {})
+    assert [case.title for case in cases["items"]] == ["Current"]
+
+
+@pytest.mark.asyncio
+async def test_archived_flag_follows_term_onto_meetings_assignments_and_checkpoints(sqlite_session, monkeypatch):
+    monkeypatch.setattr(term_service.settings, "TERM_ARCHIVE_AFTER_DAYS", 30)
+    sqlite_session.add_all([
+        User(id=1, full_name="Owner", email="owner@example.com", password="x"),
+        Term(id=1, year=2024, season=SeasonEnum.autumn, end_date=date(2024, 12, 20)),
+        Term(id=2, year=2025, season=SeasonEnum.spring),
+        Case(id=1, term_id=1, user_id=1, title="Old"),
+        Case(id=2, term_id=2, user_id=1, title="Current"),
+        Team(id=1, case_id=1, title="T1"),
+        Team(id=2, case_id=2, title="T2"),
+        Meeting(id=1, team_id=1, date_time=datetime(2024, 10, 1, 10)),
+        Meeting(id=2, team_id=2, date_time=datetime(2025, 3, 1, 10)),
+        Assignment(id=1, meeting_id=1, text="old"),
+        Checkpoint(id=1, team_id=1, number=1, mark=5),
+    ])
+    await sqlite_session.commit()
+
+    async def archived_rows():
+        rows = {}
+        for model in (Meeting, Assignment, Checkpoint):
+            result = await sqlite_session.execute(select(model.id).where(model.archived == True).order_by(model.id))
+            rows[model.__tablename__] = result.scalars().all()
+        return rows
+
+    await term_service.archive_ended_terms(sqlite_session, today=date(2025, 6, 10))
+    assert await archived_rows() == {"meetings": [1], "assignments": [1], "checkpoints": [1]}
+
+    added = await assignment_service.create_assignment(sqlite_session, AssignmentCreate(meeting_id=1, text="late"))
+    assert added.archived is True
+
+    await team_service.update_team(sqlite_session, 1, TeamUpdate(case_id=2))
+    assert await archived_rows() == {"meetings": [], "assignments": [], "checkpoints": []}
+
+    await team_service.update_team(sqlite_session, 1, TeamUpdate(case_id=1))
+    await term_service.update_term(sqlite_session, 1, TermUpdate(archived=False))
+    assert await archived_rows() == {"meetings": [], "assignments": [], "checkpoints": []}
@@ -0,0 +1,46 @@
+from app.utils import cache
+
+
+def test_response_cache_returns_stored_values_until_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    store = cache.ResponseCache(ttl=10)
+
+    store.set("key", "value")
+    assert store.get("key") == "value"
+
+    now[0] = 111.0
+    assert store.get("key") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    store = cache.ResponseCache(ttl=60, max_entries=2)
+
+    store.set("a", 1)
+    store.set("b", 2)
+    store.get("a")
+    store.set("c", 3)
+
+    assert store.get("a") == 1
+    assert store.get("b") is None
+    assert store.get("c") == 3
+
+
+def test_invalidate_tables_clears_only_dependent_caches():
+    meetings = cache.ResponseCache(ttl=60, depends_on=("meetings",))
+    teams = cache.ResponseCache(ttl=60, depends_on=("teams",))
+    meetings.set(1, "feed")
+    teams.set(1, "team")
+
+    cache.invalidate_tables({"meetings"})
+
+    assert meetings.get(1) is None
+    assert teams.get(1) == "team"
+
+
+def test_etag_matches_handles_lists_and_weak_tags():
+    assert cache.etag_matches('"x", "abc"', '"abc"')
+    assert cache.etag_matches('W/"abc"', '"abc"')
+    assert cache.etag_matches("*", '"abc"')
+    assert not cache.etag_matches(None, '"abc"')
+    assert not cache.etag_matches('"other"', '"abc"')
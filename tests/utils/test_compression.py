@@ -0,0 +1,108 @@
+import gzip
+
+import pytest
+
+from app.core.middleware import CompressionMiddleware
+from app.utils import compression
+from app.utils.cache import ResponseCache
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("gzip, deflate", "gzip"),
+    ("identity", None),
+    ("gzip;q=0", None),
+    ("*", "gzip"),
+    ("br", None),
+])
+def test_negotiate_encoding_without_brotli(monkeypatch, header, expected):
+    monkeypatch.setattr(compression, "brotli", None)
+
+    assert compression.negotiate_encoding(header) == expected
+
+
+def test_negotiate_encoding_prefers_brotli_when_available(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+
+    assert compression.negotiate_encoding("gzip, br") == "br"
+    assert compression.negotiate_encoding("gzip;q=1, br;q=0.5") == "gzip"
+
+
+def test_encode_cached_compresses_once_per_entry(monkeypatch):
+    cache = ResponseCache(ttl=60)
+    body = b"BEGIN:VEVENT\r\n" * 200
+    cache.set(1, ("etag", body))
+    calls = []
+    original = compression.compress
+
+    def counting_compress(data, encoding):
+        calls.append(encoding)
+        return original(data, encoding)
+
+    monkeypatch.setattr(compression, "compress", counting_compress)
+    first, encoding = compression.encode_cached(cache, 1, body, "gzip")
+    second, _ = compression.encode_cached(cache, 1, body, "gzip")
+
+    assert encoding == "gzip"
+    assert first is second
+    assert calls == ["gzip"]
+    assert gzip.decompress(first) == body
+    assert compression.encode_cached(cache, 1, b"tiny", "gzip") == (b"tiny", None)
+
+
+async def _call(app, accept_encoding="gzip"):
+    messages = []
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+
+    async def send(message):
+        messages.append(message)
+
+    await CompressionMiddleware(app)(scope, None, send)
+    return messages[0], b"".join(message.get("body", b"") for message in messages[1:])
+
+
+def _app(chunks, content_type=b"application/json", extra_headers=()):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type), (b"etag", b'"abc"'), *extra_headers]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1})
+    return app
+
+
+@pytest.mark.asyncio
+async def test_middleware_compresses_large_json_and_weakens_etag():
+    body = b'{"items": [' + b'{"id": 1, "summary": "meeting"},' * 100 + b"]}"
+
+    start, content = await _call(_app([body]))
+
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"etag"] == b'W/"abc"'
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert int(headers[b"content-length"]) == len(content)
+    assert gzip.decompress(content) == body
+
+
+@pytest.mark.asyncio
+async def test_middleware_streams_chunked_bodies():
+    chunks = [b"a" * 2000, b"b" * 2000, b""]
+
+    start, content = await _call(_app(chunks, content_type=b"text/csv"))
+
+    assert dict(start["headers"])[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in dict(start["headers"])
+    assert gzip.decompress(content) == b"a" * 2000 + b"b" * 2000
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("app", [
+    _app([b"{}"]),
+    _app([b"x" * 5000], content_type=b"image/png"),
+    _app([b"x" * 5000], extra_headers=[(b"content-encoding", b"br")]),
+])
+async def test_middleware_skips_small_binary_and_encoded_responses(app):
+    start, content = await _call(app)
+
+    assert b"content-encoding" not in dict(start["headers"]) or dict(start["headers"])[b"content-encoding"] == b"br"
+    assert not content.startswith(b"\x1f\x8b")
@@ -0,0 +1,43 @@
+import pytest
+
+from app.utils.csv_stream import iter_csv_dicts, iter_csv_lines
+
+
+async def _chunks(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 3, 1024])
+async def test_iter_csv_lines_handles_chunk_boundaries_and_quoted_newlines(size):
+    data = '﻿name,note\r\n"Иванов, Иван","two\nlines"\r\n\r\nPetrov,"say ""hi"""'.encode("utf-8")
+
+    rows = await _collect(iter_csv_lines(_chunks(data, size)))
+
+    assert rows == [
+        (1, ["name", "note"]),
+        (2, ["Иванов, Иван", "two\nlines"]),
+        (5, ["Petrov", 'say "hi"']),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_lines_rejects_unterminated_quote():
+    with pytest.raises(ValueError, match="line 2"):
+        await _collect(iter_csv_lines(_chunks(b'a\n"open\n', 4)))
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_dicts_normalizes_header_and_checks_required_columns():
+    data = b"Full_Name; Group ;Team\nAnn;G1;Alpha\n"
+
+    rows = await _collect(iter_csv_dicts(_chunks(data, 5), ("full_name", ("team_id", "team")), delimiter=";"))
+
+    assert rows == [(2, {"full_name": "Ann", "group": "G1", "team": "Alpha"})]
+    with pytest.raises(ValueError, match="team_id or team"):
+        await _collect(iter_csv_dicts(_chunks(b"full_name\nAnn\n", 5), ("full_name", ("team_id", "team"))))
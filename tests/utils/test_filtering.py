@@ -1,9 +1,19 @@
+from datetime import datetime
+
 import pytest
+from sqlalchemy import select
 
+from app.models.meeting import Meeting
 from app.utils import filtering
 
 
+class _TypeStub:
+    python_type = str
+
+
 class _ColumnStub:
+    type = _TypeStub()
+
     def __init__(self):
         self.ilike_calls = []
         self.eq_calls = []
@@ -40,6 +50,12 @@ class _StmtStub:
         self.limit_value = value
         return self
 
+    def subquery(self):
+        return self
+
+    def select_from(self, value):
+        return self
+
 
 class _ResultStub:
     def __init__(self, values):
@@ -54,6 +70,9 @@ class _ResultStub:
     def all(self):
         return list(self._values)
 
+    def scalar_one(self):
+        return self._values[0]
+
 
 def _make_model():
     class _Model:
@@ -112,9 +131,9 @@ async def test_filter_and_paginate_applies_filters_and_paginates(monkeypatch):
         return stmt_arg
 
     monkeypatch.setattr(filtering, "apply_filters", fake_apply_filters)
-    monkeypatch.setattr(filtering, "select", lambda model_arg: stmt)
+    monkeypatch.setattr(filtering, "select", lambda *args: stmt)
 
-    db_execute = _ResultStub([1, 2, 3, 4])
+    db_execute = _ResultStub([4])
     db_execute_second = _ResultStub(["a", "b"])
 
     class _DB:
@@ -139,3 +158,130 @@ async def test_filter_and_paginate_applies_filters_and_paginates(monkeypatch):
     assert stmt.offset_value == 2
     assert stmt.limit_value == 2
 
+
+
+def _compile(stmt):
+    compiled = stmt.compile()
+    return str(compiled), compiled.params
+
+
+def test_apply_filters_supports_range_operators_with_coercion():
+    stmt = filtering.apply_filters(Meeting, select(Meeting), {
+        "team_id": "5",
+        "date_time__gte": "2024-09-01T00:00:00",
+        "date_time__lt": "2024-09-08",
+    })
+
+    sql, params = _compile(stmt)
+    assert "meetings.team_id = :team_id_1" in sql
+    assert "meetings.date_time >= :date_time_1" in sql
+    assert "meetings.date_time < :date_time_2" in sql
+    assert params["team_id_1"] == 5
+    assert params["date_time_1"] == datetime(2024, 9, 1)
+    assert params["date_time_2"] == datetime(2024, 9, 8)
+
+
+def test_apply_filters_supports_in_and_isnull():
+    stmt = filtering.apply_filters(Meeting, select(Meeting), {
+        "team_id__in": "1, 2,3",
+        "summary__isnull": "false",
+        "schedule_id__isnull": "true",
+    })
+
+    sql, params = _compile(stmt)
+    assert "meetings.team_id IN (__[POSTCOMPILE_team_id_1])" in sql
+    assert params["team_id_1"] == [1, 2, 3]
+    assert "meetings.summary IS NOT NULL" in sql
+    assert "meetings.schedule_id IS NULL" in sql
+
+
+def test_apply_filters_sorts_by_multiple_columns():
+    stmt = filtering.apply_filters(Meeting, select(Meeting), {"sort": "-date_time,id"})
+
+    sql, _ = _compile(stmt)
+    assert "ORDER BY meetings.date_time DESC, meetings.id" in sql
+
+
+def test_apply_filters_ignores_non_column_attributes():
+    stmt = filtering.apply_filters(
+        Meeting, select(Meeting), {"team": "1", "metadata": "x", "page": "2", "include_archived": "true"}
+    )
+
+    sql, _ = _compile(stmt)
+    assert "WHERE" not in sql
+
+
+def test_apply_filters_excludes_archived_terms_by_default():
+    scoped, _ = _compile(filtering.apply_filters(Meeting, select(Meeting), {}))
+    unscoped, _ = _compile(filtering.apply_filters(Meeting, select(Meeting), {"include_archived": "1"}))
+
+    assert "meetings.archived = false" in scoped
+    assert "SELECT" not in scoped.split("WHERE", 1)[1]
+    assert "WHERE" not in unscoped
+
+
+@pytest.mark.parametrize("params", [
+    {"team_id": "abc"},
+    {"date_time__gt": "yesterday"},
+    {"summary__isnull": "maybe"},
+    {"team_id__between": "1,2"},
+])
+def test_apply_filters_rejects_invalid_values_and_operators(params):
+    with pytest.raises(filtering.FilterError):
+        filtering.apply_filters(Meeting, select(Meeting), params)
+
+
+def _make_db(total, items):
+    class _DB:
+        def __init__(self):
+            self.calls = []
+
+        async def execute(self, stmt_arg):
+            self.calls.append(stmt_arg)
+            return _ResultStub([total]) if len(self.calls) == 1 else _ResultStub(items)
+
+    return _DB()
+
+
+@pytest.mark.asyncio
+async def test_filter_and_paginate_clamps_page_size_to_model_limit(monkeypatch):
+    stmt = _StmtStub()
+
+    class _Model:
+        __tablename__ = "meetings"
+
+    monkeypatch.setattr(filtering, "apply_filters", lambda model_arg, stmt_arg, params_arg: stmt_arg)
+    monkeypatch.setattr(filtering, "select", lambda *args: stmt)
+    monkeypatch.setattr(filtering.settings, "PAGE_SIZE_LIMITS", {"meetings": 50})
+    filtering.clamped_page_size_requests.clear()
+
+    result = await filtering.filter_and_paginate(_Model, _make_db(0, []), {"page_size": "1000000"})
+
+    assert result["page_size"] == 50
+    assert stmt.limit_value == 50
+    assert filtering.clamped_page_size_requests.value(table="meetings") == 1
+
+
+def test_get_pagination_uses_defaults_bounded_by_limit(monkeypatch):
+    class _Model:
+        __tablename__ = "teams"
+
+    monkeypatch.setattr(filtering.settings, "PAGE_SIZE_DEFAULT", 20)
+    monkeypatch.setattr(filtering.settings, "PAGE_SIZE_MAX", 10)
+
+    assert filtering.get_pagination(_Model, {}) == (1, 10)
+
+
+@pytest.mark.parametrize("params", [
+    {"page": "0"},
+    {"page": "-3"},
+    {"page_size": "0"},
+    {"page_size": "-1"},
+    {"page_size": "many"},
+])
+def test_get_pagination_rejects_invalid_values(params):
+    class _Model:
+        __tablename__ = "teams"
+
+    with pytest.raises(filtering.FilterError):
+        filtering.get_pagination(_Model, params)
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from app.utils import ics
+
+
+def test_escape_text_escapes_reserved_characters():
+    assert ics.escape_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+
+
+def test_fold_line_splits_long_lines_at_75_octets():
+    line = "DESCRIPTION:" + "x" * 200
+
+    folded = ics.fold_line(line)
+
+    parts = folded.split("\r\n")
+    assert all(len(part.encode("utf-8")) <= 75 for part in parts)
+    assert all(part.startswith(" ") for part in parts[1:])
+    assert "".join(part[1:] if i else part for i, part in enumerate(parts)) == line
+
+
+def test_render_calendar_wraps_events():
+    body = ics.render_calendar("Team", [["UID:1", f"DTSTART:{ics.format_datetime(datetime(2024, 9, 2, 10))}"]])
+
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert "BEGIN:VEVENT\r\nUID:1\r\nDTSTART:20240902T100000\r\nEND:VEVENT" in body
+    assert body.endswith("END:VCALENDAR\r\n")
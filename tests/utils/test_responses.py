@@ -0,0 +1,28 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.meeting import Meeting
+from app.schemas.meeting import MeetingRead
+from app.schemas.paginated import PaginatedResponse
+from app.utils.responses import json_response
+
+
+def test_json_response_validates_orm_rows_once_and_dumps_bytes():
+    meeting = Meeting(id=1, team_id=2, previous_meeting_id=None, recording_link=None,
+                      date_time=datetime(2025, 9, 1, 10, tzinfo=timezone.utc), summary="Привет")
+
+    response = json_response(PaginatedResponse[MeetingRead], {"total": 1, "page": 1, "page_size": 20, "items": [meeting]})
+
+    assert response.media_type == "application/json"
+    assert "Привет".encode() in response.body
+    payload = json.loads(response.body)
+    assert payload["items"][0]["date_time"] == "2025-09-01T10:00:00Z"
+    assert payload["total"] == 1
+
+
+def test_json_response_rejects_invalid_content():
+    with pytest.raises(ValidationError):
+        json_response(PaginatedResponse[MeetingRead], {"total": 1, "page": 1, "page_size": 20, "items": [{"id": 1}]})